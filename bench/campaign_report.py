@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+캠페인 PDF 리포트 벤치마크: 페이지 수별 시간 / 파일 크기 / 최대 메모리(tracemalloc)
+    python bench/campaign_report.py [페이지 수 ...]
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blasting.core import compute
+from blasting.campaign import write_report
+
+
+def main(argv):
+    counts = [int(a) for a in argv] or [100, 1000]
+    random.seed(0)
+    out = os.path.join(tempfile.gettempdir(), "campaign_bench.pdf")
+    for n in counts:
+        designs = ((compute(Q1=round(random.uniform(0.05, 30), 2)), None, f"#{i}") for i in range(n))
+        t = time.perf_counter()
+        write_report(designs, out)
+        dt = time.perf_counter() - t
+
+        designs = ((compute(Q1=round(random.uniform(0.05, 30), 2)), None, f"#{i}") for i in range(n))
+        tracemalloc.start()
+        write_report(designs, out)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{n:6d}쪽  {dt:6.2f} s  {os.path.getsize(out)/1024:8.0f} KB  최대 메모리 {peak/1024:7.0f} KB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+기폭 시차 배정 시간 (공 배치 → 시각 배정 → window 장약량 검증)
+    python bench/delay_schedule.py [공 수 목표]
+- 직사각형 계단 엇갈림 배치, 전자뇌관 1 ms 단위, window 8 ms, 지발당 허용 = 공 장약량 x 2
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blasting.core import compute
+from blasting.delays import programmable, schedule_layout
+from blasting.layout import layout
+
+
+def main(argv):
+    target = int(argv[0]) if argv else 2000
+    res = compute(K=200, n=-1.6, Vel=0.3, D=80)
+    side = (target * res["B"] * res["S"]) ** 0.5
+    lay = layout([(0, 0), (side, 0), (side, side), (0, side)], ((0, 0), (side, 0)), res)
+    limit = res["Q"] * 2
+    t = time.perf_counter()
+    sch = schedule_layout(lay, limit=limit, window=8.0, delays=programmable(len(lay) * 8))
+    sec = time.perf_counter() - t
+    s = sch.summary()
+    print(f"공 {len(lay):,}개 배정 {sec * 1e3:.1f} ms, 전체 {s['duration']:,.0f} ms, "
+          f"window 최대 {s['max_window_charge']} kg (허용 {limit} kg), 지연시간 {s['delays']:,}종")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+리포트 1건당 폰트 등록 비용 비교
+- 기존: make_pdf/export_pdf 호출마다 TTF 파싱 + registerFont
+- 현재: blasting.fonts.korean_font() 로 프로세스당 1회 등록
+사용: python bench/font_registry.py [--font 경로] [-n 20]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="한글 폰트 등록 비용 비교")
+    ap.add_argument("--font", help="측정할 TTF 경로 (기본: blasting.fonts 후보 탐색)")
+    ap.add_argument("-n", type=int, default=20, help="리포트 수")
+    args = ap.parse_args(argv)
+    if args.font:
+        os.environ["BLASTING_KOR_FONT"] = args.font
+
+    from blasting import fonts
+    from blasting.core import compute
+    from blasting.report import get_pattern_path, make_pdf
+
+    path = next((p for p in fonts.candidates() if os.path.isfile(p)), None)
+    if path is None:
+        print("한글 폰트를 찾지 못했습니다. --font 로 TTF 경로를 지정하세요.")
+        return 1
+
+    r = compute(K=200, n=-1.6, Vel=0.3, D=120)
+    img, _ = get_pattern_path(r)
+
+    # 기존 방식: 매 리포트마다 후보 탐색 + 폰트 파싱/등록
+    t = time.perf_counter()
+    for _ in range(args.n):
+        fonts.reset()
+        make_pdf(r, img)
+    old = (time.perf_counter() - t) / args.n
+
+    # 레지스트리: 첫 호출에서만 등록
+    fonts.reset()
+    t = time.perf_counter()
+    for _ in range(args.n):
+        make_pdf(r, img)
+    new = (time.perf_counter() - t) / args.n
+
+    size = os.path.getsize(path) / 1024 / 1024
+    print(f"폰트: {path} ({size:.1f} MB)")
+    print(f"리포트당  기존 {old*1000:7.1f} ms   레지스트리 {new*1000:7.1f} ms   절감 {(old-new)*1000:7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
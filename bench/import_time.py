@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+blasting 코어 import 시간 측정 (콜드 스타트 예산 확인)
+- 새 인터프리터에서 모듈을 import 하는 시간을 여러 번 재어 중앙값을 예산과 비교
+- UI/리포트 모듈(streamlit, tkinter, reportlab, PIL, numpy)이 딸려 들어오면 실패
+사용: python bench/import_time.py [--budget-ms 20] [--repeat 7] [module ...]
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORBIDDEN = ("streamlit", "tkinter", "reportlab", "PIL", "numpy", "pandas")
+
+_PROBE = """
+import sys, time, json
+t = time.perf_counter()
+import {mod}
+dt = (time.perf_counter() - t) * 1000.0
+print(json.dumps({{"ms": dt, "mods": sorted(m.split('.')[0] for m in sys.modules)}}))
+"""
+
+
+def measure(mod, repeat):
+    times, loaded = [], set()
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _PROBE.format(mod=mod)], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        r = json.loads(out)
+        times.append(r["ms"])
+        loaded.update(r["mods"])
+    return statistics.median(times), sorted(set(FORBIDDEN) & loaded)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="blasting import 시간 예산 확인")
+    ap.add_argument("modules", nargs="*", default=["blasting", "blasting.core"])
+    ap.add_argument("--budget-ms", type=float, default=20.0)
+    ap.add_argument("--repeat", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    ok = True
+    for mod in args.modules:
+        ms, bad = measure(mod, args.repeat)
+        status = "OK" if ms <= args.budget_ms and not bad else "FAIL"
+        ok &= status == "OK"
+        extra = f"  (불필요한 의존: {', '.join(bad)})" if bad else ""
+        print(f"{status:4s} import {mod:<20s} {ms:7.2f} ms / 예산 {args.budget_ms:.0f} ms{extra}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+대형 계단 공 배치 + 공별 허용 장약량 검토 시간
+    python bench/layout_holes.py [계단 폭 m]
+- 사다리꼴 계단, 엇갈림 배치, 보호 대상 1,000개
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from blasting.core import compute
+from blasting.layout import layout
+from blasting.structures import Structures
+
+K, N_EXP = 200.0, -1.6
+
+
+def main(argv):
+    width = float(argv[0]) if argv else 150.0
+    rng = np.random.default_rng(0)
+    res = compute(K=K, n=N_EXP, Vel=0.3, D=80)
+    polygon = [(0, 0), (width, 0), (width * 1.1, width * 0.5), (-width * 0.1, width * 0.5)]
+    st = Structures(rng.uniform(-width, 2 * width, 1000), rng.uniform(width, 3 * width, 1000),
+                    rng.choice([0.2, 0.3, 0.5, 1.0], 1000))
+    st.governing([0.0], [0.0], K, N_EXP)          # 색인 생성은 제외
+
+    t = time.perf_counter()
+    lay = layout(polygon, ((0, 0), (width, 0)), res, pattern="staggered", margin=res["B"] / 2,
+                 structures=st, K=K, n=N_EXP)
+    sec = time.perf_counter() - t
+    s = lay.summary()
+    print(f"B={res['B']} S={res['S']}  공 {s['holes']:,}개: {sec * 1e3:.1f} ms")
+    print(f"총 장약량 {s['explosive']:,.1f} kg, 총 천공장 {s['drilled']:,.1f} m, 허용 장약량 초과 {s['over']:,}공")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
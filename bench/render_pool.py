@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+설계별 PDF 렌더링: 현재 프로세스 순차 vs RenderPool (작업자 수별)
+    python bench/render_pool.py [PDF 수] [작업자 수 ...]
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blasting.core import compute
+from blasting.render import RenderJob, RenderPool, render_job
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 200
+    workers = [int(a) for a in argv[1:]] or sorted({1, 2, os.cpu_count() or 1})
+    random.seed(0)
+    results = [compute(Q1=round(random.uniform(0.05, 30), 2)) for _ in range(n)]
+    out = tempfile.mkdtemp(prefix="render_bench_")
+    jobs = lambda: (RenderJob(i, r, layout=("web", "desktop")[i % 2], out=os.path.join(out, f"{i}.pdf"))
+                    for i, r in enumerate(results))
+
+    t = time.perf_counter()
+    for job in jobs():
+        render_job(job)
+    base = time.perf_counter() - t
+    print(f"순차          {n / base:8.1f} PDF/s")
+
+    for w in workers:
+        t = time.perf_counter()
+        with RenderPool(workers=w) as pool:
+            errors = sum(bool(r.error) for r in pool.imap(jobs()))
+        dt = time.perf_counter() - t
+        print(f"풀 작업자 {w:3d}  {n / dt:8.1f} PDF/s  (x{base / dt:.2f}, 오류 {errors})")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+설계 결과 메모리: compute 결과 dict 목록 vs ResultSet (float64 / float32)
+    python bench/result_memory.py [설계 수]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blasting.batch import compute_batch
+from blasting.results import ResultSet
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 1_000_000
+    q1 = np.round(np.random.default_rng(0).uniform(0.05, 30, n), 2)
+    out = compute_batch(Q1=q1)
+
+    tracemalloc.start()
+    rows = ResultSet.from_batch(out).to_dicts()
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+
+    for dtype in (np.float64, np.float32):
+        rs = ResultSet.from_batch(out, dtype=dtype)
+        t = time.perf_counter()
+        top = rs[(rs["Pa"] == 4) & (rs["B"] > 1.5)].sort("c1", descending=True)
+        dt = time.perf_counter() - t
+        print(f"{np.dtype(dtype).name:8s} {rs.nbytes / 2**20:8.1f} MB  (dict 목록 {dict_bytes / 2**20:8.1f} MB)"
+              f"  필터+정렬 {dt * 1000:6.1f} ms ({len(top):,}행)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+단일 설계 반복 호출: 변경 전 compute (user-019 이전 core.compute 를 그대로 복사) vs design (Design 레코드)
+    python bench/scalar_fast.py [호출 수]
+- 몬테카를로: K, n, Vel, D 를 무작위로
+- design: 캐시 없는 계산 그대로 (호출당 비용)
+- ResultCache.design / .compute: 결과 캐시 경유 (Q3 가 0.01 kg 단위라 반복됨 → 적중률은 stats 로)
+결과가 같은지도 확인
+"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blasting import core
+from blasting.cache import ResultCache
+from blasting.core import PD_FORCED_MSG, design
+
+
+# ===== 변경 전 (user-019 이전) blasting.core 의 compute 와 보조 함수 그대로 — 비교 기준 =====
+# Pa별 폭약 제원: ({pd: (W1 kg, h1 m, nu)}, 표에 없는 pd 의 기본값 — None 이면 ANFO 공식)
+_C32 = (0.25, 0.295, 0.5)
+_C50 = (1.0, 0.42, 0.5)
+_C65 = (2.0, 0.52, 0.5)
+CARTRIDGES = {
+    1: ({}, (0.12, 0.2, 0.5)),
+    2: ({}, _C32),
+    3: ({0.032: _C32, 0.050: _C50}, _C32),
+    4: ({0.032: _C32, 0.050: _C50, 0.065: _C65}, _C50),
+    5: ({0.032: _C32, 0.050: _C50, 0.065: _C65}, _C50),
+    6: ({0.032: _C32, 0.050: _C50, 0.065: (2.0, 0.52, 1.0)}, None),
+}
+
+
+def pa_class(Q3):
+    return 1 if Q3 < 0.125 else 2 if Q3 < 0.5 else 3 if Q3 < 1.6 else 4 if Q3 < 5 else 5 if Q3 < 15 else 6
+
+
+def anfo(pd):
+    """ANFO 공식(0.815) → (W1, h1, nu)"""
+    return (1000*0.815*3.1415*(pd**2))/4.0, 1.0, 0.1
+
+
+def cartridge(Pa, pd, pd_from_custom=False):
+    """Pa, pd 에 해당하는 (W1, h1, nu)"""
+    table, default = CARTRIDGES[Pa]
+    if pd_from_custom and Pa >= 3:
+        return anfo(pd)
+    spec = table.get(pd, default)
+    return anfo(pd) if spec is None else spec
+
+
+def _positive(x):
+    try:
+        v = float(x)
+    except (TypeError, ValueError):
+        return None
+    return v if v > 0 else None
+
+
+def max_charge(K, n, Vel, D):
+    """허용진동 기준 지발당 최대 장약량 Q2 (K, n, Vel, D 중 하나라도 없으면 None)"""
+    if not all([K, n, Vel, D]):
+        return None
+    return round((D**2) * ((Vel/K)**(2/(-n))), 2)
+
+
+def design_charge(Q1, Q2):
+    """설계 장약량 Q3: Q1, Q2 중 작은 값 (없는 쪽은 무시)"""
+    if Q1 is None:
+        if Q2 is None:
+            raise ValueError("Q1이 비어있을 때는 K, n, Vel, D를 모두 입력해야 합니다.")
+        return Q2
+    return round(min(Q1, Q2), 2) if Q2 is not None else round(Q1, 2)
+
+
+def user_pd(pd_choice=None, pd_text=None):
+    """사용자 폭약직경 → (pd 또는 None, 직접입력 여부). 직접입력(양수) > 선택"""
+    pd = _positive(pd_text) if pd_text else None
+    if pd is not None:
+        return pd, True
+    if pd_choice is not None:
+        return _positive(pd_choice), False
+    return None, False
+
+
+def compute_ref(K=None, n=None, Vel=None, D=None, Q1=None, C=0.33, V=1.2,
+                pd_choice=None, pd_text=None, k1=0.7, V1_theory=1.2):
+    def rnd(x, n): return round(x, n)
+
+    Q2 = max_charge(K, n, Vel, D)
+    Q3 = design_charge(Q1, Q2)
+    Pa = pa_class(Q3)
+
+    pd, pd_from_custom = user_pd(pd_choice, pd_text)
+    user_supplied = pd is not None
+    if pd is None:
+        pd = 0.032 if Pa in [1,2,3] else 0.050 if Pa in [4,5] else 0.076
+    pd = rnd(pd, 3)
+
+    pd_msg = None
+    if Pa in (1,2) and user_supplied and pd > 0.032:
+        pd = 0.032
+        pd_msg = PD_FORCED_MSG
+
+    W1, h1, nu = cartridge(Pa, pd, pd_from_custom)
+
+    if pd_from_custom and Q3 >= 0.5:
+        Q = float(Q3)
+        h = h1 * (Q3/W1)
+    else:
+        Q4 = int((Q3/W1)*2.0) if W1 <= 2.0 else int(Q3)
+        Q = (Q4/2.0)*W1 if W1 <= 2.0 else float(Q4)
+        h = 0.95 * h1 * Q / W1
+
+    denom = C * V1_theory * (0.7*h + 0.77*(Q**(1/3)) + 10*pd)
+    if denom <= 0: raise ValueError("계산 오류")
+
+    B1 = 0.94 * math.sqrt(Q/denom)
+    S1 = V1_theory * B1
+
+    if abs(V-1.2) < 1e-12:
+        B, S = rnd(B1, 2), rnd(S1, 2)
+    else:
+        B = math.sqrt((B1*S1)/V)
+        S = V * B
+        B, S = rnd(B, 2), rnd(S, 2)
+
+    T = rnd((k1*(pd**-0.25) if Pa==1 else k1*(pd**-0.18)) * math.sqrt(B*S), 2)
+    H = rnd(T + h, 2)
+    K_step = rnd(H - 0.2*B, 2)
+    c1 = rnd(Q/(B*S*K_step) if B*S*K_step else 0, 2)
+
+    return {"B": B, "S": S, "T": T, "h": rnd(H-T, 2), "H": H, "Q": Q,
+            "c1": c1, "K_step": K_step, "Pa": Pa, "pd": pd, "_msg": pd_msg}
+
+
+# ===== 측정 =====
+def _time(fn, cases):
+    t = time.perf_counter()
+    for c in cases:
+        fn(*c)
+    return (time.perf_counter() - t) / len(cases) * 1e6
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 200000
+    rng = random.Random(1)
+    cases = [(rng.uniform(100, 300), rng.uniform(-2.0, -1.4), rng.choice((0.2, 0.3, 0.5)), rng.uniform(10, 120))
+             for _ in range(n)]
+    cache = ResultCache(65536)
+    for c in cases[:20000]:
+        ref = compute_ref(*c)
+        assert design(*c).as_dict() == ref and cache.design(*c).as_dict() == ref
+
+    ref = _time(compute_ref, cases)
+    rows = [("compute (dict)", _time(core.compute, cases), None),
+            ("design", _time(design, cases), None)]
+    for name in ("design", "compute"):
+        cache = ResultCache(65536)
+        call = cache.design if name == "design" else (lambda K, n, Vel, D: cache.compute(K=K, n=n, Vel=Vel, D=D))
+        rows.append((f"ResultCache.{name}", _time(call, cases), cache.stats()))
+    print(f"변경 전 compute        {ref:6.2f} us/호출")
+    for name, t, stats in rows:
+        print(f"{name:22s} {t:6.2f} us/호출  x{ref / t:.2f}" + (f"  적중률 {stats.hit_rate:.1%}" if stats else ""))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+보호 대상 다수 Q2: 격자 색인 조회 vs 전체 비교
+    python bench/structures_index.py [대상 수] [발파 위치 수]
+- 대상 Vel 은 0.2 (학교), 0.3 (주택), 0.5 (상가), 1.0 (관로) 중 무작위
+- 지배 대상과 Q2 가 전체 비교 결과와 같은지 확인
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from blasting.batch import max_charge_batch
+from blasting.structures import Structures
+
+K, N_EXP = 200.0, -1.6
+
+
+def brute(st, bx, by):
+    d = np.hypot(st.xy[:, 0] - bx[:, None], st.xy[:, 1] - by[:, None])
+    q2 = max_charge_batch(K, N_EXP, st.Vel[None, :], d)
+    i = np.argmin(q2, axis=1)
+    return i, q2[np.arange(bx.size), i]
+
+
+def main(argv):
+    ns = int(argv[0]) if argv else 1000
+    nb = int(argv[1]) if len(argv) > 1 else 1000
+    rng = np.random.default_rng(0)
+    st = Structures(rng.uniform(0, 3000, ns), rng.uniform(0, 3000, ns), rng.choice([0.2, 0.3, 0.5, 1.0], ns))
+    bx, by = rng.uniform(-500, 3500, nb), rng.uniform(-500, 3500, nb)
+
+    t = time.perf_counter()
+    st.governing(bx[:1], by[:1], K, N_EXP)
+    build = time.perf_counter() - t
+    t = time.perf_counter()
+    for _ in range(10):
+        g = st.governing(bx, by, K, N_EXP)
+    query = (time.perf_counter() - t) / 10
+    t = time.perf_counter()
+    bi, bq = brute(st, bx, by)
+    full = time.perf_counter() - t
+
+    same = (g.Q2 == bq).all()
+    print(f"대상 {ns:,}개, 발파 위치 {nb:,}곳  후보 {st.candidates(N_EXP)}")
+    print(f"색인 생성 {build * 1e3:.1f} ms, 색인 조회 {query * 1e3:.2f} ms, 전체 비교 {full * 1e3:.2f} ms")
+    print(f"Q2 일치 {same}, 지배 대상 일치 {(g.index == bi).mean() * 100:.2f}% (불일치는 Q2 동률)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+파형 수집 처리량: 합성 3성분 계측 파일(.bin, int16) → 이벤트 표 → 추정식 회귀
+    python bench/waveform_ingest.py [파일 수] [작업 수]
+- 파일마다 4 kHz x 4초 (16,000 샘플 x 3성분, 약 94 KB), 감쇠 정현파 + 잡음
+- 합성에 쓴 K=200, n=-1.6 이 회귀로 다시 나오는지 확인
+"""
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from blasting.sitelaw import SiteLawAccumulator
+from blasting.waveform import process_files, write_bin
+
+RATE, SECONDS, SCALE = 4000, 4, 5e-4          # int16 1 = 0.0005 cm/s (최대 16 cm/s)
+
+
+def make_files(folder, count, rng):
+    t = np.arange(RATE * SECONDS) / RATE
+    paths = []
+    for i in range(count):
+        D, W = rng.uniform(30, 300), rng.uniform(0.5, 20)
+        ppv = 200 * (D / W ** 0.5) ** -1.6 * 10 ** rng.normal(0, 0.1)
+        f = rng.uniform(8, 60, 3)
+        env = np.exp(-t * 3)[:, None]
+        x = env * np.sin(2 * np.pi * f * t[:, None] + rng.uniform(0, 6, 3))
+        x = x / np.abs(x).max(axis=0) * ppv * np.array([1.0, *rng.uniform(0.5, 0.9, 2)])   # 최대 성분 = ppv
+        p = os.path.join(folder, f"ev{i:05d}.bin")
+        write_bin(p, np.clip(np.round(x / SCALE), -32767, 32767).astype(np.int16), RATE, SCALE, D, W, 1714500000 + i)
+        paths.append(p)
+    return paths
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 1000
+    jobs = int(argv[1]) if len(argv) > 1 else None
+    with tempfile.TemporaryDirectory() as folder:
+        paths = make_files(folder, count, np.random.default_rng(0))
+        size = sum(os.path.getsize(p) for p in paths)
+        t = time.perf_counter()
+        events = list(process_files(paths, jobs=jobs))
+        sec = time.perf_counter() - t
+    acc = SiteLawAccumulator()
+    acc.add([e.PPV for e in events], [e.D for e in events], [e.W for e in events])
+    law = acc.fit()
+    print(f"{count:,}개 ({size / 1e6:.0f} MB): {sec:.2f} s ({count / sec:,.0f} 파일/s, {size / 1e6 / sec:.0f} MB/s)")
+    print(f"오류 {sum(bool(e.error) for e in events)}개, 회귀 {law} (합성 K=200, n=-1.6)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Smart Stem 발파설계 계산 패키지
+- core  : 단일 설계 계산(compute)
+- explosives: 폭약 카탈로그 (explosives.csv → Pa 별 직경 색인, 스칼라/배치 공용)
+- batch : NumPy 배열 기반 일괄 계산(compute_batch)
+- results: 대량 설계 결과 컨테이너 (열 단위 고정폭 배열, 행 뷰/필터/정렬, NumPy/Arrow 내보내기)
+- sweep : 설계표(파라미터 스윕) 생성 + CSV/Parquet 스트리밍 출력
+- runner: 현장 CSV 일괄 설계 (프로세스 풀)
+- cache : compute 결과 LRU 캐시
+- waveform: 3성분 진동 파형 파일(.bin memmap / .csv) → 이벤트 표 (PPV, PVS, 주 주파수, 프로세스 풀)
+- sitelaw: 계측 기록(PPV, 거리, 장약량) → 시험발파 추정식 K, n 회귀 (chunk 누적, 50%/95% 추정식)
+- structures: 보호 대상 다수(좌표, 허용 Vel) → 발파 위치별 지배 대상과 Q2 (격자 공간 색인)
+- layout: 계단 다각형 + 자유면 → 공 배치 (정방형/엇갈림), 공별 허용 장약량 검토, 공 표
+- delays: 공 배치에 기폭 시각 배정 (시간창 안 장약량 합 ≤ 지발당 허용 장약량)
+- table : 현장 프로파일별 Q3 격자 설계표 (사전 계산, .npz 저장)
+- report: PDF 리포트 / 패턴 이미지 경로
+- diagram: 결과 값으로 그린 패턴 도면 (단면도 + 평면도, SVG / reportlab 벡터)
+- printpage: Streamlit 인쇄 문서 (내용 해시 이름으로 static/print/ 에 기록)
+- fonts : reportlab 한글 폰트 등록 (프로세스당 1회)
+- campaign: 다수 설계 PDF (1건 1페이지 + 목차, report 와 같은 페이지 배치)
+- render: 설계별 PDF 렌더링 프로세스 풀 (warm 작업자, 제한시간)
+- assets: 패턴 이미지 파생본(표시/인쇄/PDF 크기) + 트리밍 영역, 원본 해시 기준 manifest
+"""
+from .core import compute
+
+__all__ = ["compute"]
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+패턴 이미지 파생본(리사이즈) 캐시
+- 원본 JPG(발파프로그램/*.jpg, exam.jpg)를 실제로 쓰는 크기로 미리 줄여 둠
+    display : Tkinter 이미지 캔버스 / Streamlit 결과 화면
+    print   : 인쇄 HTML / Tkinter 인쇄
+    pdf     : PDF 리포트 (표 옆 이미지, 약 200dpi)
+- 흰 여백 자동 트리밍 영역(bbox, Tkinter _autocrop_whitespace 와 같은 계산)도 함께 저장
+- manifest.json 은 원본 내용 해시(sha256) 기준 → 같은 내용이면 경로가 달라도 공유, 원본이 바뀌면 자동으로 무효
+- 실행 시에는 manifest 만 읽고 가장 가까운 파생본 경로를 돌려줌 (없으면 원본). Pillow 는 build 때만 필요
+- 파생본/manifest 는 같은 폴더의 임시 파일에 쓴 뒤 os.replace → 다시 만드는 중에도 읽는 쪽은 완성된 파일만 봄
+
+사용 예:
+    python -m blasting.assets            # 파생본 생성/갱신 (BLASTING_ASSET_DIR, 기본 <repo>/.assets)
+    derivative(path, "pdf")              # 파생본 경로 또는 원본 경로
+    closest(path, 600, 500)              # 600x500 안에 맞춰 표시할 때 충분한 가장 작은 파생본
+    crop_box(path, img.size)             # 흰 여백 트리밍 영역 (img 크기 기준)
+"""
+import os
+import sys
+import glob
+import json
+import hashlib
+import threading
+from functools import lru_cache
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSET_DIR = os.environ.get("BLASTING_ASSET_DIR") or os.path.join(BASE_DIR, ".assets")
+MANIFEST = "manifest.json"
+VERSION = 2                # 2: 투명 영역을 흰색으로 합성 (1 의 파생본은 다시 생성)
+
+# 용도별 최대 크기 (px, 폭 x 높이). 원본보다 크게 만들지 않음
+PROFILES = {
+    "display": (1000, 860),
+    "print": (1600, 1400),
+    "pdf": (760, 760),
+}
+JPEG_QUALITY = 90
+CROP_THRESHOLD = 245      # _autocrop_whitespace(thr=245)
+
+_lock = threading.Lock()
+
+
+# ================= 원본 해시 =================
+@lru_cache(maxsize=64)
+def _file_digest(path, mtime_ns, size):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_digest(path):
+    """파일 내용 해시 (경로, 수정시각, 크기가 같으면 다시 읽지 않음)"""
+    if not path or not os.path.isfile(path):
+        return None
+    st = os.stat(path)
+    return _file_digest(path, st.st_mtime_ns, st.st_size)
+
+
+def sources():
+    """기본 원본 목록: 발파프로그램/*.jpg, *.png + exam.jpg"""
+    paths = sorted(glob.glob(os.path.join(BASE_DIR, "발파프로그램", "*.jpg")) +
+                   glob.glob(os.path.join(BASE_DIR, "발파프로그램", "*.png")))
+    exam = os.path.join(BASE_DIR, "exam.jpg")
+    return paths + [exam] if os.path.isfile(exam) else paths
+
+
+# ================= manifest =================
+@lru_cache(maxsize=4)
+def _load(path, mtime_ns):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data if data.get("version") == VERSION else {"sources": {}}
+
+
+def manifest(asset_dir=None):
+    """manifest dict (파일이 바뀌었을 때만 다시 읽음). 없으면 빈 manifest"""
+    path = os.path.join(asset_dir or ASSET_DIR, MANIFEST)
+    try:
+        return _load(path, os.stat(path).st_mtime_ns)
+    except (OSError, ValueError):
+        return {"sources": {}}
+
+
+def entry(path, asset_dir=None):
+    """원본 path 의 manifest 항목 (없으면 None)"""
+    digest = file_digest(path)
+    return manifest(asset_dir)["sources"].get(digest) if digest else None
+
+
+def derivative(path, profile, asset_dir=None):
+    """profile 크기의 파생본 경로. 파생본이 없거나 원본이 이미 작으면 원본 경로"""
+    e = entry(path, asset_dir)
+    d = e and e["derived"].get(profile)
+    if d:
+        p = os.path.join(asset_dir or ASSET_DIR, d["file"])
+        if os.path.isfile(p):
+            return p
+    return path
+
+
+def closest(path, width, height, asset_dir=None):
+    """width x height 안에 맞춰 표시할 때 해상도가 모자라지 않은 가장 작은 파생본 (없으면 원본)"""
+    e = entry(path, asset_dir)
+    if not e:
+        return path
+    ow, oh = e["size"]
+    need = ow * min(width / ow, height / oh, 1.0) - 0.5
+    best = None
+    for d in e["derived"].values():
+        if d["size"][0] >= need and (best is None or d["size"][0] < best["size"][0]):
+            p = os.path.join(asset_dir or ASSET_DIR, d["file"])
+            if os.path.isfile(p):
+                best = dict(d, path=p)
+    return best["path"] if best else path
+
+
+def crop_box(path, size=None, asset_dir=None):
+    """흰 여백 트리밍 영역 (left, top, right, bottom). size 를 주면 그 크기 이미지 기준으로 환산. 없으면 None"""
+    e = entry(path, asset_dir)
+    if not e or not e.get("bbox"):
+        return None
+    box = e["bbox"]
+    if size is None or tuple(size) == tuple(e["size"]):
+        return tuple(box)
+    sx, sy = size[0] / e["size"][0], size[1] / e["size"][1]
+    return (int(box[0] * sx), int(box[1] * sy),
+            min(size[0], int(round(box[2] * sx))), min(size[1], int(round(box[3] * sy))))
+
+
+# ================= 생성 =================
+def on_white(im):
+    """
+    Pillow 이미지 → RGB 또는 L. 투명도(RGBA/LA/PA, 팔레트·RGB 의 transparency)가 있으면 흰 배경에 합성
+    (그냥 convert("RGB") 하면 투명 영역이 검정이 됨)
+    """
+    if im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info:
+        from PIL import Image
+        im = im.convert("RGBA")
+        bg = Image.new("RGB", im.size, (255, 255, 255))
+        bg.paste(im, mask=im.getchannel("A"))
+        return bg
+    return im.copy() if im.mode in ("RGB", "L") else im.convert("RGB")
+
+
+def _bbox(img, thr=CROP_THRESHOLD):
+    gray = img.convert("L")
+    bw = gray.point(lambda p: 255 if p < thr else 0, mode="1")
+    return bw.getbbox()
+
+
+def _replace(dst, write):
+    """write(파일 객체) 로 dst 옆 임시 파일을 쓰고 os.replace (실패하면 임시 파일 삭제)"""
+    tmp = f"{dst}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _build_one(path, digest, asset_dir):
+    from PIL import Image
+
+    resample = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", 1))
+    with Image.open(path) as im:
+        im.load()
+        img = on_white(im)
+    ow, oh = img.size
+    bbox = _bbox(img)
+    derived = {}
+    for name, (mw, mh) in PROFILES.items():
+        scale = min(mw / ow, mh / oh)
+        if scale >= 1.0:
+            continue                      # 원본이 이미 작음 → 원본 사용
+        size = (max(1, int(round(ow * scale))), max(1, int(round(oh * scale))))
+        fname = f"{digest[:16]}_{name}.jpg"
+        _replace(os.path.join(asset_dir, fname), lambda f: img.resize(size, resample).save(
+            f, "JPEG", quality=JPEG_QUALITY, optimize=True))
+        derived[name] = {"file": fname, "size": list(size)}
+    return {"size": [ow, oh], "bbox": list(bbox) if bbox else None, "derived": derived}
+
+
+def build(paths=None, asset_dir=None, force=False, prune=True):
+    """
+    파생본 생성/갱신. 이미 manifest 에 있는 원본(같은 해시, 파일 존재)은 건너뜀.
+    prune: 목록에 없는 원본의 파생본 삭제. 반환: (새로 만든 원본 수, 전체 원본 수)
+    """
+    asset_dir = asset_dir or ASSET_DIR
+    paths = sources() if paths is None else paths
+    with _lock:
+        os.makedirs(asset_dir, exist_ok=True)
+        m = manifest(asset_dir)
+        old = m["sources"]
+        force = force or m.get("profiles", {}) != {k: list(v) for k, v in PROFILES.items()}
+        new, built = {}, 0
+        for p in paths:
+            digest = file_digest(p)
+            if not digest or digest in new:
+                continue
+            e = dict(old.get(digest) or {})
+            if force or not e or not all(os.path.isfile(os.path.join(asset_dir, d["file"]))
+                                         for d in e["derived"].values()):
+                e = _build_one(p, digest, asset_dir)
+                built += 1
+            e["source"] = os.path.relpath(p, BASE_DIR)
+            new[digest] = e
+
+        if prune:
+            keep = {d["file"] for e in new.values() for d in e["derived"].values()} | {MANIFEST}
+            for f in os.listdir(asset_dir):
+                if f not in keep and f.endswith(".jpg"):
+                    os.remove(os.path.join(asset_dir, f))
+        else:
+            new = dict(old, **new)
+
+        if built or new.keys() != old.keys() or m.get("profiles") is None:
+            data = json.dumps({"version": VERSION, "profiles": PROFILES, "sources": new},
+                              ensure_ascii=False, indent=1).encode("utf-8")
+            _replace(os.path.join(asset_dir, MANIFEST), lambda f: f.write(data))
+    return built, len(new)
+
+
+def ensure():
+    """앱 시작 시 호출: 파생본이 없거나 오래되었으면 생성. 실패(읽기 전용, Pillow 없음 등)는 무시 → 원본 사용"""
+    try:
+        return build(prune=False)
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(prog="python -m blasting.assets", description="패턴 이미지 파생본 생성")
+    ap.add_argument("paths", nargs="*", help="원본 이미지 (기본: 발파프로그램/*.jpg, exam.jpg)")
+    ap.add_argument("--dir", default=None, help=f"저장 폴더 (기본: {ASSET_DIR})")
+    ap.add_argument("--force", action="store_true", help="모두 다시 생성")
+    args = ap.parse_args(argv)
+
+    built, total = build(args.paths or None, args.dir, force=args.force, prune=not args.paths)
+    print(f"완료: 원본 {total}개 중 {built}개 생성 → {args.dir or ASSET_DIR}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+발파설계 일괄 계산 (NumPy 배열 연산)
+- compute_batch: core.compute 와 행 단위로 동일한 결과를 배열 연산으로 산출
+- 입력: 배열/스칼라(브로드캐스트) 또는 DataFrame(열 이름 = 인자 이름)
+- 결측값(None/NaN)은 compute 의 None 과 같게 취급
+- pd: 폭약직경(NaN/0 이하=자동), pd_custom: True면 직접입력(ANFO) 값으로 취급
+- 거듭제곱(np.power) 결과가 반올림 경계(…5) 근처인 값/행은 스칼라 경로로 재계산하여 결과를 일치시킴
+"""
+import numpy as np
+
+from .core import CATALOGUE, PA_NAMES, PD_FORCED_MSG, compute, max_charge
+
+INPUT_COLUMNS = ("K", "n", "Vel", "D", "Q1", "C", "V", "pd", "pd_custom", "k1")
+OUTPUT_COLUMNS = ("B", "S", "T", "h", "H", "Q", "c1", "K_step", "Pa", "pd", "_msg")
+
+# 반올림 경계 판정 폭 (스케일된 값 기준)
+_TIE_EPS = 1e-6
+
+
+def _round(x, nd, suspect=None):
+    """
+    round(x, nd) 와 비트 단위로 같은 결과.
+    경계 근처 원소는 파이썬 round 로 다시 반올림하고, suspect 가 주어지면 표시
+    (x 자체가 스칼라 경로와 다를 수 있는 값 → 행 전체 재계산 대상)
+    """
+    scale = 10.0 ** nd
+    y = x * scale
+    out = np.rint(y) / scale
+    near = np.abs(y - np.floor(y) - 0.5) < _TIE_EPS
+    if near.any():
+        idx = np.flatnonzero(near)
+        out.flat[idx] = [round(float(v), nd) for v in x.flat[idx]]
+        if suspect is not None:
+            suspect |= near
+    return out
+
+
+def _per_value(x, *funcs):
+    """값 종류가 적은 배열(pd 등)에 파이썬 스칼라 함수를 적용 (스칼라 경로와 비트 동일)"""
+    vals, inv = np.unique(x, return_inverse=True)
+    inv = inv.reshape(x.shape)
+    return [np.array([f(float(v)) for v in vals], dtype=float)[inv] for f in funcs]
+
+
+def _given(a):
+    """compute 의 all([...]) 처럼 0, NaN 은 미입력"""
+    return ~np.isnan(a) & (a != 0)
+
+
+def max_charge_batch(K, n, Vel, D):
+    """core.max_charge 의 배열 버전 (미입력 행은 NaN, 값은 스칼라 경로와 비트 동일)"""
+    K, n, Vel, D = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (K, n, Vel, D)))
+    have_all = _given(K) & _given(n) & _given(Vel) & _given(D)
+    suspect = np.zeros(K.shape, dtype=bool)
+    with np.errstate(all="ignore"):
+        Q2 = _round((D**2) * ((Vel/K)**(2/(-n))), 2, suspect)
+    # np.power 결과가 반올림 경계에 걸린 원소는 스칼라 식으로 다시 계산
+    for i in np.flatnonzero(suspect & have_all):
+        Q2.flat[i] = max_charge(K.flat[i], n.flat[i], Vel.flat[i], D.flat[i])
+    return np.where(have_all, Q2, np.nan)
+
+
+def design_charge_batch(Q1, Q2):
+    """core.design_charge 의 배열 버전. Q1, Q2 모두 없는 행이 있으면 ValueError"""
+    Q1, Q2 = np.broadcast_arrays(np.asarray(Q1, dtype=float), np.asarray(Q2, dtype=float))
+    have_Q1, have_Q2 = ~np.isnan(Q1), ~np.isnan(Q2)
+    bad = ~have_Q1 & ~have_Q2
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"{i}행: Q1이 비어있을 때는 K, n, Vel, D를 모두 입력해야 합니다.")
+    return _round(np.where(have_Q1 & have_Q2, np.minimum(Q1, Q2), np.where(have_Q1, Q1, Q2)), 2)
+
+
+def _columns(K, n, Vel, D, Q1, C, V, pd, pd_custom, k1):
+    cols = dict(K=K, n=n, Vel=Vel, D=D, Q1=Q1, C=C, V=V, pd=pd, k1=k1)
+    cols = {k: np.asarray(np.nan if v is None else v, dtype=float) for k, v in cols.items()}
+    cols["pd_custom"] = np.asarray(False if pd_custom is None else pd_custom, dtype=bool)
+    names = list(cols)
+    arrs = np.broadcast_arrays(*cols.values())
+    return {k: np.atleast_1d(a) for k, a in zip(names, arrs)}
+
+
+def _scalar_row(cols, i, V1_theory):
+    """i번째 행을 core.compute 로 계산"""
+    def opt(k):
+        v = float(cols[k][i])
+        return None if np.isnan(v) else v
+
+    pd = opt("pd")
+    if pd is not None and not pd > 0:
+        pd = None          # 배치에서 0 이하 pd 는 자동
+    custom = bool(cols["pd_custom"][i]) and pd is not None
+    return compute(K=opt("K"), n=opt("n"), Vel=opt("Vel"), D=opt("D"), Q1=opt("Q1"),
+                   C=float(cols["C"][i]), V=float(cols["V"][i]),
+                   pd_choice=None if custom else pd,
+                   pd_text=repr(pd) if custom else None,
+                   k1=float(cols["k1"][i]), V1_theory=V1_theory)
+
+
+def compute_batch(K=None, n=None, Vel=None, D=None, Q1=None, C=0.33, V=1.2,
+                  pd=None, pd_custom=None, k1=0.7, V1_theory=1.2):
+    """
+    core.compute 의 배열 버전.
+    K 자리에 DataFrame(또는 열 이름 → 배열 dict)을 넘기면 INPUT_COLUMNS 에 해당하는 열을 사용.
+    반환: OUTPUT_COLUMNS 키의 배열 dict (DataFrame 입력이면 같은 index 의 DataFrame)
+    """
+    frame = None
+    if hasattr(K, "columns") or isinstance(K, dict):
+        frame = K
+        src = dict(K=None, n=None, Vel=None, D=None, Q1=None, C=C, V=V,
+                   pd=pd, pd_custom=pd_custom, k1=k1)
+        keys = frame.columns if hasattr(frame, "columns") else frame.keys()
+        src.update({k: frame[k] for k in INPUT_COLUMNS if k in keys})
+        cols = _columns(**src)
+    else:
+        cols = _columns(K, n, Vel, D, Q1, C, V, pd, pd_custom, k1)
+
+    size = cols["K"].size
+    suspect = np.zeros(size, dtype=bool)
+    Kv, nv, Velv, Dv, Q1v = cols["K"], cols["n"], cols["Vel"], cols["D"], cols["Q1"]
+    Cv, Vv, k1v = cols["C"], cols["V"], cols["k1"]
+
+    # --- Q2/Q3 ---
+    Q3 = design_charge_batch(Q1v, max_charge_batch(Kv, nv, Velv, Dv))
+
+    # --- Pa ---
+    Pa = np.select([Q3 < 0.125, Q3 < 0.5, Q3 < 1.6, Q3 < 5, Q3 < 15], [1, 2, 3, 4, 5], 6)
+
+    # --- pd 결정: 직접입력(양수) > 선택 > Pa 기본 ---
+    pdv = cols["pd"]
+    custom = cols["pd_custom"] & (pdv > 0)
+    user_pd = pdv > 0
+    pd_default = np.array([CATALOGUE.default_pd(pa) if pa in PA_NAMES else np.nan for pa in range(7)])[Pa]
+    pd_arr = _round(np.where(user_pd, pdv, pd_default), 3)
+
+    forced = (Pa <= 2) & user_pd & (pd_arr > 0.032)
+    pd_arr = np.where(forced, 0.032, pd_arr)
+
+    # --- W1/h1: 카탈로그 색인 검색 (벌크 제품은 pd 값마다 스칼라 식) ---
+    pow25, pow18 = _per_value(pd_arr, lambda p: p**-0.25, lambda p: p**-0.18)
+    product = CATALOGUE.find_batch(Pa, pd_arr, custom)
+    W1 = np.empty(size)
+    h1 = np.empty(size)
+    for i in np.unique(product):
+        m = product == i
+        p = CATALOGUE.products[i]
+        if p.kind == "bulk":
+            W1[m], h1[m] = _per_value(pd_arr[m], lambda v: p.spec(v)[0], lambda v: p.spec(v)[1])
+        else:
+            W1[m], h1[m] = p.weight, p.length
+
+    # --- Q4/Q/h ---
+    with np.errstate(all="ignore"):
+        anfo_path = custom & (Q3 >= 0.5)
+        small_W1 = W1 <= 2.0
+        Q4 = np.where(small_W1, np.trunc((Q3/W1)*2.0), np.trunc(Q3))
+        Q = np.where(anfo_path, Q3, np.where(small_W1, (Q4/2.0)*W1, Q4))
+        h = np.where(anfo_path, h1 * (Q3/W1), 0.95 * h1 * Q / W1)
+
+        # --- B, S ---
+        denom = Cv * V1_theory * (0.7*h + 0.77*(Q**(1/3)) + 10*pd_arr)
+        if not (denom > 0).all():
+            raise ValueError("계산 오류")
+        B1 = 0.94 * np.sqrt(Q/denom)
+        S1 = V1_theory * B1
+        keep = np.abs(Vv - 1.2) < 1e-12
+        Bc = np.sqrt((B1*S1)/Vv)
+        Sc = Vv * Bc
+        B = _round(np.where(keep, B1, Bc), 2, suspect)
+        S = _round(np.where(keep, S1, Sc), 2, suspect)
+
+        # --- T, H, K_step, c1 ---
+        T = _round((k1v*np.where(Pa == 1, pow25, pow18)) * np.sqrt(B*S), 2)
+        H = _round(T + h, 2)
+        K_step = _round(H - 0.2*B, 2)
+        vol = B*S*K_step
+        c1 = _round(np.where(vol != 0, Q/np.where(vol != 0, vol, 1.0), 0.0), 2)
+        h_out = _round(H - T, 2)
+
+    msg = np.full(size, None, dtype=object)
+    msg[forced] = PD_FORCED_MSG
+    out = {"B": B, "S": S, "T": T, "h": h_out, "H": H, "Q": Q, "c1": c1,
+           "K_step": K_step, "Pa": Pa.astype(np.int64), "pd": pd_arr, "_msg": msg}
+
+    # 거듭제곱 값이 반올림 경계에 걸린 행은 스칼라 경로로 재계산
+    for i in np.flatnonzero(suspect):
+        r = _scalar_row(cols, i, V1_theory)
+        for k in OUTPUT_COLUMNS:
+            out[k][i] = r[k]
+
+    if frame is not None and hasattr(frame, "columns"):
+        import pandas as pd_lib
+        return pd_lib.DataFrame(out, index=frame.index)
+    return out
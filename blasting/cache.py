@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+compute 결과 캐시 (프로세스 공용, LRU)
+- Q2/Q3 이후의 계산은 (Q3, pd, C, V, k1) 에만 의존 → K, n, Vel, D, Q1 대신 0.01 kg 로 반올림된 Q3 를 키로 사용
+  (같은 Q3 가 나오는 다른 입력 조합도 같은 항목을 공유)
+- pd_choice/pd_text 는 compute 와 같은 우선순위로 해석한 뒤 0.001 m 로 반올림하여 키로 사용
+  ("0.050", "0.05", 0.05 → 같은 키)
+- 항목은 불변 core.Design 레코드 → design() 은 사본 없이 그대로 반환, compute() 는 as_dict() 사본
+  (두 경로가 같은 항목을 공유)
+- 저장소는 인스턴스마다 functools.lru_cache (C 구현: 키 해시 1번, 스레드 안전)
+  크기 제한(LRU 제거), 적중/실패/제거 횟수 제공. 여러 세션(스레드)에서 동시에 사용 가능
+- ByteStore: 바이트 총량으로 제한되는 LRU 저장소 (PDF 등 생성 결과물 공유용)
+"""
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+from .core import design, design_charge, max_charge, user_pd
+
+DEFAULT_SIZE = int(os.environ.get("BLASTING_CACHE_SIZE", "4096"))
+
+CacheStats = namedtuple("CacheStats", "hits misses evictions size maxsize hit_rate")
+
+
+def cache_key(K=None, n=None, Vel=None, D=None, Q1=None, C=0.33, V=1.2,
+              pd_choice=None, pd_text=None, k1=0.7, V1_theory=1.2):
+    """
+    compute 결과를 결정하는 정규화된 입력 (Q3, pd, 직접입력 여부, C, V, k1, V1_theory).
+    입력 오류는 compute 와 같은 ValueError
+    """
+    Q3 = design_charge(Q1, max_charge(K, n, Vel, D))
+    pd, custom = user_pd(pd_choice, pd_text)
+    if pd is None:
+        return (Q3, None, False, float(C), float(V), float(k1), float(V1_theory))
+    return (Q3, round(pd, 3), custom, float(C), float(V), float(k1), float(V1_theory))
+
+
+def _design_q3(Q3, pd, custom, C, V, k1, V1_theory):
+    """정규화된 입력 → core.design (Q3 를 Q1 으로: 이미 0.01 kg 로 반올림된 값이라 그대로 Q3)"""
+    return design(None, None, None, None, Q3, C, V, pd, custom, k1, V1_theory)
+
+
+class ResultCache:
+    def __init__(self, maxsize=DEFAULT_SIZE):
+        self.maxsize = max(0, int(maxsize))
+        self._design = lru_cache(self.maxsize)(_design_q3)
+
+    def compute(self, **kw):
+        """캐시를 거친 compute. 반환 dict 는 호출자마다 새 사본"""
+        return self._design(*cache_key(**kw)).as_dict()
+
+    def design(self, K=None, n=None, Vel=None, D=None, Q1=None, C=0.33, V=1.2,
+               pd=None, pd_custom=False, k1=0.7, V1_theory=1.2):
+        """캐시를 거친 core.design (인자도 같음). 반환: 공유되는 불변 Design 레코드"""
+        Q2 = round((D**2) * ((Vel/K)**(2/(-n))), 2) if K and n and Vel and D else None
+        Q3 = design_charge(Q1, Q2)
+        if pd is not None and pd > 0:
+            return self._design(Q3, round(pd, 3), bool(pd_custom), C, V, k1, V1_theory)
+        return self._design(Q3, None, False, C, V, k1, V1_theory)
+
+    def resize(self, maxsize):
+        """크기 변경 (저장된 항목과 통계는 비움)"""
+        self.maxsize = max(0, int(maxsize))
+        self._design = lru_cache(self.maxsize)(_design_q3)
+
+    def clear(self):
+        self._design.cache_clear()
+
+    def stats(self):
+        info = self._design.cache_info()
+        total = info.hits + info.misses
+        evictions = info.misses - info.currsize if self.maxsize else 0
+        return CacheStats(info.hits, info.misses, evictions, info.currsize,
+                          self.maxsize, info.hits / total if total else 0.0)
+
+
+class ByteStore:
+    """키 → bytes, 총 바이트 수 제한 LRU (프로세스 공용, 스레드 안전)"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = int(max_bytes)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get_or_create(self, key, make):
+        """key 가 있으면 저장된 bytes, 없으면 make() 결과를 저장 후 반환 (None 은 저장하지 않음)"""
+        with self._lock:
+            data = self._data.get(key)
+            if data is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        data = make()
+        if data is None or len(data) > self.max_bytes:
+            return data
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = data
+                self.nbytes += len(data)
+            while self.nbytes > self.max_bytes:
+                _, old = self._data.popitem(last=False)
+                self.nbytes -= len(old)
+                self.evictions += 1
+        return data
+
+    def get(self, key):
+        with self._lock:
+            data = self._data.get(key)
+            if data is not None:
+                self._data.move_to_end(key)
+            return data
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return CacheStats(self.hits, self.misses, self.evictions, self.nbytes,
+                              self.max_bytes, self.hits / total if total else 0.0)
+
+
+# 프로세스 공용 캐시
+_default = ResultCache()
+
+
+def cached_compute(**kw):
+    return _default.compute(**kw)
+
+
+def cache_stats():
+    return _default.stats()
+
+
+def set_cache_size(maxsize):
+    _default.resize(maxsize)
+
+
+def clear_cache():
+    _default.clear()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+캠페인(다수 발파) PDF 리포트 — 설계 1건 = 1페이지 + 앞쪽 요약 목차
+- 각 페이지는 report.draw_design_page (make_pdf 와 같은 표 + 패턴 배치, 행 정의 공용)
+- reportlab 공개 canvas API 로 한 문서에 기록 (pageCompression 으로 페이지 내용 압축)
+  · 한글 폰트는 fonts.korean_font() 로 프로세스당 한 번 등록, 문서에는 사용한 글자만 서브셋으로 포함
+  · 패턴 이미지(assets 의 "pdf" 파생본)는 같은 파일이면 문서당 한 번만 넣고 모든 페이지가 같은 객체를 참조
+  · canvas 는 save() 때 문서를 한 번에 기록 → 메모리는 페이지당 압축된 내용 스트림 크기 정도
+    (1,000쪽 약 수 MB, bench/campaign_report.py)
+- 목차가 앞쪽에 오도록 설계 목록을 먼저 모음 (결과 dict 와 라벨만 유지)
+
+사용 예:
+    designs = [(res, None, "1차 발파") for res in results]     # (결과, 이미지 경로 또는 None, 라벨)
+    write_report(designs, "캠페인.pdf", title="OO현장 발파설계")
+    write_report(designs, response)                            # write() 가 있는 스트림 (HTTP 응답 등)
+
+    python -m blasting.campaign 설계결과.csv -o 캠페인.pdf --label 공번
+"""
+import os
+import sys
+import argparse
+from datetime import datetime
+
+from .core import PA_NAMES
+from .fonts import korean_font
+from .report import draw_design_page, get_pattern_path
+from .runner import read_results
+
+INDEX_ROWS = 32                                           # 목차 페이지당 행 수
+
+
+def mm(x):
+    return x * 72.0 / 25.4
+
+
+INDEX_COLUMNS = (("No.", 12), ("구분", 38), ("발파패턴", 38), ("B", 15), ("S", 15),
+                 ("H", 15), ("Q (kg)", 18), ("c1", 15), ("쪽", 12))
+
+
+def _index_page(c, font, items, first_no, n_index, total, title, date):
+    """목차 한 페이지. items: [(결과, 이미지 경로, 라벨)] 중 이 페이지 분량"""
+    from reportlab.lib.pagesizes import A4
+
+    W, H = A4
+
+    def setf(s):
+        try: c.setFont(font or "Helvetica", s)
+        except: c.setFont("Helvetica", s)
+
+    setf(16)
+    c.drawCentredString(W/2, H-mm(25), f"{title} — 목차")
+    setf(10)
+    c.drawRightString(W - mm(15), H-mm(35), f"출력날짜: {date}")
+    c.drawString(mm(15), H-mm(35), f"설계 {total}건")
+
+    x0, y, row_h = mm(15), H - mm(42), mm(6.5)
+    c.setStrokeColorRGB(0.3, 0.3, 0.3)
+    c.setLineWidth(0.5)
+    c.setFillColorRGB(0.94, 0.94, 0.94)
+    c.rect(x0, y - row_h, mm(sum(w for _, w in INDEX_COLUMNS)), row_h, fill=1)
+    c.setFillColorRGB(0, 0, 0)
+
+    rows = [[col for col, _ in INDEX_COLUMNS]]
+    for k, (r, _, label) in enumerate(items):
+        no = first_no + k
+        rows.append([str(no), label or "", PA_NAMES.get(r['Pa'], '일반발파'), f"{r['B']:.2f}",
+                     f"{r['S']:.2f}", f"{r['H']:.2f}", f"{r['Q']}", f"{r['c1']}", str(n_index + no)])
+    setf(8)
+    for cells in rows:
+        x = x0
+        for text, (_, cw) in zip(cells, INDEX_COLUMNS):
+            c.rect(x, y - row_h, mm(cw), row_h)
+            c.drawString(x + mm(1.5), y - row_h + mm(2), text)
+            x += mm(cw)
+        y -= row_h
+
+
+# ================= 리포트 =================
+def _items(designs):
+    for d in designs:
+        result, img_path, label = (tuple(d) + (None, None))[:3] if isinstance(d, (tuple, list)) else (d, None, None)
+        if img_path is None:
+            img_path = get_pattern_path(result)[0]
+        yield result, img_path, label
+
+
+class _Counter:
+    """canvas.save() 의 출력 대상: 경로면 파일을 열고, 스트림이면 그대로 쓰면서 바이트 수 집계"""
+
+    def __init__(self, out):
+        self._own = isinstance(out, (str, os.PathLike))
+        self._f = open(out, "wb") if self._own else out
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return self._f.write(data)
+
+    def close(self):
+        if self._own:
+            self._f.close()
+
+
+def write_report(designs, out, title="스마트스템 발파설계"):
+    """
+    designs: 결과 dict 또는 (결과, 이미지 경로, 라벨) 의 iterable (이미지 경로 None → Pa 기본 패턴,
+    패턴 파일도 없으면 결과 값으로 그린 벡터 도면).
+    out: 파일 경로 또는 write() 가 있는 바이너리 스트림. 반환: 기록한 바이트 수.
+    reportlab 이 없으면 ImportError
+    """
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+
+    items = list(_items(designs))
+    font = korean_font()
+    date = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    counter = _Counter(out)
+    c = canvas.Canvas(counter, pagesize=A4, pageCompression=1)
+    c.setTitle(title)
+    c.setProducer("blasting.campaign")
+
+    n_index = max(1, -(-len(items) // INDEX_ROWS))
+    for p in range(n_index):
+        _index_page(c, font, items[p*INDEX_ROWS:(p+1)*INDEX_ROWS], p*INDEX_ROWS + 1,
+                    n_index, len(items), title, date)
+        c.showPage()
+
+    for no, (result, img_path, label) in enumerate(items, 1):
+        draw_design_page(c, result, img_path, font, date, title=title,
+                         note=f"No. {no}" + (f"  {label}" if label else ""))
+        c.showPage()
+    c.save()
+    counter.close()
+    return counter.size
+
+
+# ================= runner 결과 CSV → PDF =================
+def _csv_designs(path, label_col=None):
+    """runner 결과 CSV → 설계 항목. 오류 행은 건너뜀"""
+    for row, res in read_results(path):
+        if res is not None:
+            yield res, None, row.get(label_col) if label_col else None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m blasting.campaign",
+                                 description="일괄 설계 결과 CSV → 캠페인 PDF (설계 1건 1페이지 + 목차)")
+    ap.add_argument("input", help="python -m blasting.runner 결과 CSV")
+    ap.add_argument("-o", "--output", required=True, help="PDF 파일")
+    ap.add_argument("--title", default="스마트스템 발파설계")
+    ap.add_argument("--label", default=None, help="페이지/목차에 표시할 입력 열 이름")
+    args = ap.parse_args(argv)
+
+    size = write_report(_csv_designs(args.input, args.label), args.output, title=args.title)
+    print(f"완료: {size/1024:,.0f} KB → {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+발파설계 계산 로직 (단일 설계)
+- UI(streamlit/tkinter), reportlab, Pillow 에 의존하지 않음 → 배치/API 프로세스에서 바로 import
+- Streamlit 앱과 Tkinter 앱이 같은 compute 를 사용
+- pd 결정: 직접입력(ANFO, 양수만) > 선택 > Pa 기본 (폭약 제원/기본 pd 는 explosives.csv)
+- [Pa=1,2 규칙] 사용자가 pd를 입력/선택했고 pd>0.032면 0.032로 강제 + 안내 메시지
+- [ANFO 분기] 직접입력 시 Q3>=0.5면 Q=Q3, h=h1*(Q3/W1), 아니면 기본 경로
+"""
+import math
+from collections import namedtuple
+
+from .explosives import CATALOGUE
+
+PA_NAMES = {1: "미진동발파패턴", 2: "정밀진동제어발파", 3: "소규모진동제어발파",
+            4: "중규모진동제어발파", 5: "일반발파", 6: "대규모발파"}
+
+# 목적 → 전색장 계수 k1 (Streamlit 라디오 라벨)
+PURPOSE_K1 = {"비산제어(0.7)": 0.7, "파쇄도개선(0.55)": 0.55, "광산채석장(0.5)": 0.5}
+
+PD_FORCED_MSG = "폭약경이 적합하지 않아 0.032m로 조정되었습니다."
+
+# 폭약 제원은 카탈로그(explosives.csv, explosives.CATALOGUE)에서: Pa, pd → (W1 kg, h1 m, nu)
+_missing = sorted(set(PA_NAMES) - set(CATALOGUE.default))
+if _missing:
+    raise ValueError(f"폭약 카탈로그에 Pa {_missing} 기본 제품(default_pa)이 없습니다.")
+
+
+def pa_class(Q3):
+    return 1 if Q3 < 0.125 else 2 if Q3 < 0.5 else 3 if Q3 < 1.6 else 4 if Q3 < 5 else 5 if Q3 < 15 else 6
+
+
+def default_pd(Pa):
+    """Pa 기본 폭약경 (카탈로그 기본 제품 직경)"""
+    return CATALOGUE.default_pd(Pa)
+
+
+def cartridge(Pa, pd, pd_from_custom=False):
+    """Pa, pd 에 해당하는 (W1, h1, nu)"""
+    return CATALOGUE.spec(Pa, pd, pd_from_custom)
+
+
+def _positive(x):
+    try:
+        v = float(x)
+    except (TypeError, ValueError):
+        return None
+    return v if v > 0 else None
+
+
+def max_charge(K, n, Vel, D):
+    """허용진동 기준 지발당 최대 장약량 Q2 (K, n, Vel, D 중 하나라도 없으면 None)"""
+    if not all([K, n, Vel, D]):
+        return None
+    return round((D**2) * ((Vel/K)**(2/(-n))), 2)
+
+
+def design_charge(Q1, Q2):
+    """설계 장약량 Q3: Q1, Q2 중 작은 값 (없는 쪽은 무시)"""
+    if Q1 is None:
+        if Q2 is None:
+            raise ValueError("Q1이 비어있을 때는 K, n, Vel, D를 모두 입력해야 합니다.")
+        return Q2
+    return round(min(Q1, Q2), 2) if Q2 is not None else round(Q1, 2)
+
+
+def user_pd(pd_choice=None, pd_text=None):
+    """
+    사용자 폭약직경 → (pd 또는 None, 직접입력 여부). 직접입력(양수) > 선택
+    - 직접입력(pd_text) 은 숫자가 아니거나 0 이하면 무시 (선택/자동으로)
+    - 선택(pd_choice) 은 숫자가 아니거나 0 이하면 ValueError
+    """
+    pd = _positive(pd_text) if pd_text else None
+    if pd is not None:
+        return pd, True
+    if pd_choice is not None:
+        pd = _positive(pd_choice)
+        if pd is None:
+            raise ValueError(f"폭약직경 선택값이 올바르지 않습니다: {pd_choice!r}")
+        return pd, False
+    return None, False
+
+
+# ================= 계산 로직 =================
+_PD_DEFAULT = {pa: CATALOGUE.default_pd(pa) for pa in PA_NAMES}
+_spec = CATALOGUE.spec
+# (Pa, 카탈로그 직경) → (W1, h1): 선택/기본 pd 는 카탈로그 직경이므로 색인 검색 없이 조회
+_CARTRIDGE = {(pa, d): _spec(pa, d)[:2] for pa in PA_NAMES
+              for d in {_PD_DEFAULT[pa], *(p.diameter for p in CATALOGUE.products)}}
+_sqrt = math.sqrt
+_new = tuple.__new__
+
+
+class Design(namedtuple("Design", "B S T h H Q c1 K_step Pa pd msg")):
+    """design() 결과 (불변, __slots__). as_dict() 는 compute 결과 dict"""
+    __slots__ = ()
+
+    def as_dict(self):
+        return {"B": self.B, "S": self.S, "T": self.T, "h": self.h, "H": self.H, "Q": self.Q,
+                "c1": self.c1, "K_step": self.K_step, "Pa": self.Pa, "pd": self.pd, "_msg": self.msg}
+
+
+def design(K=None, n=None, Vel=None, D=None, Q1=None, C=0.33, V=1.2,
+           pd=None, pd_custom=False, k1=0.7, V1_theory=1.2):
+    """
+    단일 설계 계산 (반복 호출용). 입력은 숫자 그대로, pd: 폭약직경(None/0 이하 = 자동),
+    pd_custom: pd 가 직접입력(ANFO) 값인지. 결과는 compute 와 비트 단위로 같은 Design
+    (결과 캐시가 필요하면 cache.ResultCache 를 거침)
+    """
+    # Q2 (max_charge) / Q3 (design_charge)
+    Q2 = round((D**2) * ((Vel/K)**(2/(-n))), 2) if K and n and Vel and D else None
+    if Q1 is None:
+        if Q2 is None:
+            raise ValueError("Q1이 비어있을 때는 K, n, Vel, D를 모두 입력해야 합니다.")
+        Q3 = Q2
+    else:
+        Q3 = round(min(Q1, Q2), 2) if Q2 is not None else round(Q1, 2)
+
+    # Pa → pd → 장약 → B/S → T, H, K_step, c1
+    Pa = 1 if Q3 < 0.125 else 2 if Q3 < 0.5 else 3 if Q3 < 1.6 else 4 if Q3 < 5 else 5 if Q3 < 15 else 6
+
+    # pd: 사용자 값(양수) > Pa 기본, Pa 1,2 는 0.032 초과 불가
+    msg = None
+    if pd is not None and pd > 0:
+        pd = round(pd, 3)
+        custom = pd_custom
+        if Pa <= 2 and pd > 0.032:
+            pd = 0.032
+            msg = PD_FORCED_MSG
+    else:
+        pd = _PD_DEFAULT[Pa]
+        custom = False
+
+    if custom:
+        W1, h1, _ = _spec(Pa, pd, True)
+    else:
+        W1, h1 = _CARTRIDGE.get((Pa, pd)) or _spec(Pa, pd)[:2]
+
+    if custom and Q3 >= 0.5:
+        Q = float(Q3)
+        h = h1 * (Q3/W1)
+    elif W1 <= 2.0:
+        Q = (int((Q3/W1)*2.0)/2.0)*W1
+        h = 0.95 * h1 * Q / W1
+    else:
+        Q = float(int(Q3))
+        h = 0.95 * h1 * Q / W1
+
+    denom = C * V1_theory * (0.7*h + 0.77*(Q**(1/3)) + 10*pd)
+    if denom <= 0: raise ValueError("계산 오류")
+
+    B1 = 0.94 * _sqrt(Q/denom)
+    S1 = V1_theory * B1
+    if abs(V-1.2) < 1e-12:
+        B, S = round(B1, 2), round(S1, 2)
+    else:
+        B = _sqrt((B1*S1)/V)
+        B, S = round(B, 2), round(V * B, 2)
+
+    T = round((k1*(pd**-0.25) if Pa==1 else k1*(pd**-0.18)) * _sqrt(B*S), 2)
+    H = round(T + h, 2)
+    K_step = round(H - 0.2*B, 2)
+    c1 = round(Q/(B*S*K_step) if B*S*K_step else 0, 2)
+    return _new(Design, (B, S, T, round(H-T, 2), H, Q, c1, K_step, Pa, pd, msg))
+
+
+def compute(K=None, n=None, Vel=None, D=None, Q1=None, C=0.33, V=1.2,
+            pd_choice=None, pd_text=None, k1=0.7, V1_theory=1.2):
+    pd, pd_from_custom = user_pd(pd_choice, pd_text)
+    return design(K, n, Vel, D, Q1, C, V, pd, pd_from_custom, k1, V1_theory).as_dict()
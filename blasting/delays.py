@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+기폭 시차 배정 (지발당 장약량 제한)
+- 공마다 기폭 시각(ms)을 뇌관 지연시간 목록(delays)에서 골라, 시간창(window, 예: 8 ms) 안에서
+  함께 터지는 장약량 합이 허용값(limit, 보통 Q3 또는 공별 Q2)을 넘지 않게 함
+    window 안의 공들 = 같은 지발. 공별 limit 이면 그 공들 중 가장 작은 limit 기준
+- 발파 순서(order, 기본: 자유면 열부터, 열 안에서는 공 번호 순)대로 시각이 줄지 않게 배정 →
+  새 공은 시각순 목록의 끝에 붙으므로 직전 window 안의 공만 거꾸로 훑어 가장 이른 가능 시각을 구함
+  (공 쌍 비교 없음, 공당 window 안 공 수만큼)
+- 검증: max_window_charge (정렬 + 누적합 + searchsorted 로 모든 window 의 장약량 합)
+
+사용 예:
+    lay = layout(polygon, face, res, structures=st, K=200, n=-1.6)
+    sch = schedule_layout(lay, limit=res["Q"] * 2, window=8.0, delays=programmable(10000))
+    sch.summary()          # {"holes": ..., "duration": ..., "max_window_charge": ..., "delays": ...}
+"""
+import csv
+from bisect import bisect_left
+
+import numpy as np
+
+WINDOW = 8.0               # ms
+_EPS = 1e-9                # 장약량 합 비교 허용 (kg)
+
+
+def programmable(max_ms=20000, step=1):
+    """전자뇌관: 0 ~ max_ms 를 step ms 간격으로 설정 가능"""
+    return np.arange(0, max_ms + step / 2, step, dtype=float)
+
+
+def series(nominal):
+    """비전기/전기 뇌관 단차별 공칭 지연시간(ms) 목록 → 정렬된 지연시간 배열"""
+    return np.unique(np.asarray(nominal, dtype=float))
+
+
+def max_window_charge(times, Q, window=WINDOW):
+    """각 공을 끝으로 하는 window (t - window, t] 의 장약량 합 중 최대값"""
+    t = np.asarray(times, dtype=float)
+    q = np.asarray(Q, dtype=float)
+    if not t.size:
+        return 0.0
+    o = np.argsort(t, kind="stable")
+    t, c = t[o], np.concatenate([[0.0], np.cumsum(q[o])])
+    last = np.searchsorted(t, t, side="right")          # 같은 시각 공까지 포함
+    first = np.searchsorted(t, t - window, side="right")
+    return float((c[last] - c[first]).max())
+
+
+class Schedule:
+    def __init__(self, time, delay, order, Q, limit, window):
+        """time: 공별 기폭 시각 (ms, 입력 공 순서), delay: delays 안의 번호, order: 발파 순서"""
+        self.time, self.delay, self.order = time, delay, order
+        self.Q, self.limit, self.window = Q, limit, window
+
+    def __len__(self):
+        return len(self.time)
+
+    def max_window_charge(self):
+        return max_window_charge(self.time, self.Q, self.window)
+
+    def summary(self):
+        """공 수, 전체 기폭 시간 (ms), window 장약량 합 최대 (kg), 쓴 지연시간 종류 수"""
+        return {"holes": len(self), "duration": float(self.time.max() - self.time.min()) if len(self) else 0.0,
+                "max_window_charge": self.max_window_charge(), "delays": int(np.unique(self.time).size)}
+
+    def to_csv(self, path, hole=None):
+        """공 번호, 발파 순서, 기폭 시각, 장약량, 허용값 CSV (hole: 공 번호 배열, 기본 1부터)"""
+        hole = np.arange(1, len(self) + 1) if hole is None else np.asarray(hole)
+        seq = np.empty(len(self), dtype=np.int64)
+        seq[self.order] = np.arange(1, len(self) + 1)
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            w = csv.writer(f)
+            w.writerow(("hole", "seq", "time_ms", "Q", "limit"))
+            w.writerows(zip(hole.tolist(), seq.tolist(), self.time.tolist(), self.Q.tolist(), self.limit.tolist()))
+
+
+def schedule(Q, limit, window=WINDOW, delays=None, order=None):
+    """
+    공별 장약량 Q 에 기폭 시각 배정 → Schedule.
+    limit: 지발당 허용 장약량 (스칼라 또는 공별 배열), delays: 쓸 수 있는 기폭 시각 목록 (기본 programmable()),
+    order: 발파 순서 (공 번호 배열, 기본 입력 순서).
+    한 공의 장약량이 limit 을 넘거나 지연시간 목록이 모자라면 ValueError
+    """
+    Q = np.asarray(Q, dtype=float)
+    size = Q.size
+    limit = np.broadcast_to(np.asarray(limit, dtype=float), Q.shape).astype(float)
+    delays = programmable() if delays is None else series(delays)
+    order = np.arange(size) if order is None else np.asarray(order)
+    if sorted(order.tolist()) != list(range(size)):
+        raise ValueError("order 는 모든 공 번호를 한 번씩 포함해야 합니다.")
+    over = np.flatnonzero(Q > limit + _EPS)
+    if over.size:
+        i = int(over[0])
+        raise ValueError(f"{i}번 공 장약량 {Q[i]} kg 이 허용값 {limit[i]} kg 을 넘습니다 "
+                         f"(분할 장약 필요, 초과 {over.size}공).")
+
+    d = delays.tolist()
+    q, lim = Q[order].tolist(), limit[order].tolist()
+    times = []             # 발파 순서대로 배정한 시각 (줄지 않음)
+    picks = []
+    k = 0                  # 직전 공의 delays 번호
+    for h in range(size):
+        t_prev = d[k] if times else d[0]
+        # 직전 window 안의 공을 최근 것부터: 합/최소 limit 을 넘는 첫 공 j 가 있으면 t > times[j] + window 필요
+        t_min = t_prev
+        total, cap = q[h], lim[h]
+        j = len(times) - 1
+        while j >= 0 and times[j] > t_prev - window:
+            total += q[j]
+            cap = min(cap, lim[j])
+            if total > cap + _EPS:
+                t_min = times[j] + window
+                break
+            j -= 1
+        k = bisect_left(d, t_min, k)
+        if k >= len(d):
+            raise ValueError(f"지연시간이 모자랍니다: {h + 1}번째 공에 {t_min:g} ms 이후 시각이 필요하지만 "
+                             f"목록은 {d[-1]:g} ms 까지입니다.")
+        times.append(d[k])
+        picks.append(k)
+
+    time = np.empty(size)
+    delay = np.empty(size, dtype=np.int64)
+    time[order], delay[order] = times, picks
+    return Schedule(time, delay, order, Q, limit, window)
+
+
+def schedule_layout(lay, limit=None, window=WINDOW, delays=None):
+    """
+    layout.Layout 에 기폭 시각 배정. limit 기본: 공별 Q2 (보호 대상 검토를 한 배치만).
+    발파 순서: 자유면 열부터, 열 안에서는 공 번호 순
+    """
+    if limit is None:
+        limit = lay["Q2"]
+        if np.isnan(limit).any():
+            raise ValueError("limit 을 주거나 보호 대상을 검토한 배치(layout(..., structures=...))를 넘겨야 합니다.")
+    order = np.lexsort((lay["hole"], lay["row"]))
+    return schedule(lay["Q"], limit, window, delays, order)
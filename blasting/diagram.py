@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+발파 패턴 도면 (벡터) — 결과 dict 의 실제 B, S, T, h, H, K_step 으로 그림
+- 왼쪽: 단면도 (계단, 천공장 H = 전색장 T + 장약장 h, 저항선 B, 계단높이 K)
+- 오른쪽: 평면도 (자유면, 저항선 B x 공간격 S 공 배치)
+- 도형 목록은 반올림한 형상(geometry_key)으로 메모이즈 → 같은 형상은 한 번만 계산
+- 출력: svg() (Streamlit 화면, 인쇄 HTML), draw_pdf() (reportlab 캔버스, 벡터 그대로)
+- B, S, H 가 0 인 결과(장약량 Q=0 등)는 그릴 형상이 없으므로 해당 도면 자리에 안내 문구만 표시
+- 의존성 없음 (draw_pdf 는 호출자가 넘긴 reportlab 캔버스만 사용)
+"""
+from functools import lru_cache
+
+VERSION = 1                        # 도면 모양을 바꾸면 올림 (저장된 인쇄 문서 키)
+VW, VH = 480, 280                  # 도면 좌표계 (px, y 아래 방향)
+FONT_FAMILY = "'Malgun Gothic', 'NanumGothic', sans-serif"
+
+ROCK, EDGE, STEM, CHARGE, DIM = "#e5e7eb", "#6b7280", "#9ca3af", "#dc2626", "#1f2937"
+ROWS, COLS = 3, 4                  # 평면도 공 배치 (행 x 열)
+EMPTY_TEXT = "표시할 형상 없음"
+
+
+def geometry_key(result):
+    """도면을 결정하는 값 (cm 단위 반올림, pd 는 mm)"""
+    return (round(result["B"], 2), round(result["S"], 2), round(result["T"], 2),
+            round(result["H"], 2), round(result["K_step"], 2), round(result["pd"], 3))
+
+
+# ================= 도형 =================
+def _fit(box, xmin, xmax, ymin, ymax):
+    """세계 좌표(m) 범위를 box(x, y, w, h) 가운데에 같은 축척으로 맞추는 변환"""
+    x0, y0, w, h = box
+    s = min(w / (xmax - xmin), h / (ymax - ymin))
+    ox = x0 + (w - s * (xmax - xmin)) / 2 - s * xmin
+    oy = y0 + (h - s * (ymax - ymin)) / 2 - s * ymin
+    return s, (lambda x, y: (ox + s * x, oy + s * y))
+
+
+def _dim(out, p1, p2, label, anchor, dx=0, dy=0):
+    """치수선 (양 끝 눈금) + 값"""
+    (x1, y1), (x2, y2) = p1, p2
+    out.append(("line", x1, y1, x2, y2, DIM, 0.8))
+    vertical = abs(x2 - x1) < abs(y2 - y1)
+    for x, y in (p1, p2):
+        if vertical:
+            out.append(("line", x - 3, y, x + 3, y, DIM, 0.8))
+        else:
+            out.append(("line", x, y - 3, x, y + 3, DIM, 0.8))
+    out.append(("text", (x1 + x2) / 2 + dx, (y1 + y2) / 2 + dy, label, 10, anchor, DIM))
+
+
+def _empty(out, box):
+    """형상이 없는 도면 자리 (치수가 0 → 축척을 정할 수 없음)"""
+    x0, y0, w, h = box
+    out.append(("text", x0 + w / 2, y0 + h / 2, EMPTY_TEXT, 11, "middle", EDGE))
+
+
+def _section(out, B, T, H, K, pd, box):
+    if not (B > 0 and H > 0):
+        return _empty(out, box)
+    s, P = _fit(box, -1.0 * B, 2.2 * B, -0.25 * H, 1.06 * H)
+    yb = 1.04 * H
+    out.append(("poly", [P(-0.8 * B, 0), P(B, 0), P(B, K), P(1.9 * B, K), P(1.9 * B, yb), P(-0.8 * B, yb)],
+                ROCK, EDGE, 1))
+    hw = max(pd * s, 4)
+    (x0, y0), (_, yT), (_, yH) = P(0, 0), P(0, T), P(0, H)
+    out.append(("rect", x0 - hw / 2, y0, hw, yT - y0, STEM, EDGE, 0.6))
+    out.append(("rect", x0 - hw / 2, yT, hw, yH - yT, CHARGE, EDGE, 0.6))
+    _dim(out, P(0, -0.12 * H), P(B, -0.12 * H), f"B {B:.2f}", "middle", dy=-4)
+    _dim(out, P(-0.35 * B, 0), P(-0.35 * B, H), f"H {H:.2f}", "end", dx=-6, dy=4)
+    _dim(out, P(0.3 * B, 0), P(0.3 * B, T), f"T {T:.2f}", "start", dx=5, dy=4)
+    _dim(out, P(0.3 * B, T), P(0.3 * B, H), f"h {H - T:.2f}", "start", dx=5, dy=4)
+    _dim(out, P(1.3 * B, 0), P(1.3 * B, K), f"K {K:.2f}", "start", dx=5, dy=4)
+
+
+def _plan(out, B, S, pd, box):
+    if not (B > 0 and S > 0):
+        return _empty(out, box)
+    s, P = _fit(box, -0.9 * S, (COLS - 0.3) * S, -0.5 * B, (ROWS + 0.7) * B)
+    (fx1, fy), (fx2, _) = P(-0.6 * S, 0), P((COLS - 0.4) * S, 0)
+    out.append(("line", fx1, fy, fx2, fy, EDGE, 2.5))
+    out.append(("text", (fx1 + fx2) / 2, fy - 6, "자유면", 10, "middle", EDGE))
+    r = max(pd / 2 * s, 3)
+    for i in range(1, ROWS + 1):
+        for j in range(COLS):
+            x, y = P(j * S, i * B)
+            out.append(("circle", x, y, r, CHARGE, EDGE, 0.6))
+    _dim(out, P(-0.5 * S, 0), P(-0.5 * S, B), f"B {B:.2f}", "start", dx=5, dy=4)
+    _dim(out, P(0, (ROWS + 0.35) * B), P(S, (ROWS + 0.35) * B), f"S {S:.2f}", "middle", dy=14)
+
+
+@lru_cache(maxsize=256)
+def _shapes(key):
+    B, S, T, H, K, pd = key
+    out = [("text", 120, 18, "단면도", 12, "middle", DIM), ("text", 360, 18, "평면도", 12, "middle", DIM)]
+    _section(out, B, T, H, K, pd, (10, 28, 220, 246))
+    _plan(out, B, S, pd, (250, 28, 220, 246))
+    return tuple(out)
+
+
+def shapes(result):
+    """도형 목록 (도면 좌표계 VW x VH): ("poly"|"rect"|"line"|"circle"|"text", ...)"""
+    return _shapes(geometry_key(result))
+
+
+# ================= SVG =================
+def _n(v):
+    return f"{v:.1f}".rstrip("0").rstrip(".")
+
+
+def _svg_item(item):
+    kind = item[0]
+    if kind == "poly":
+        _, pts, fill, stroke, sw = item
+        return (f'<polygon points="{" ".join(f"{_n(x)},{_n(y)}" for x, y in pts)}" '
+                f'fill="{fill}" stroke="{stroke}" stroke-width="{sw}"/>')
+    if kind == "rect":
+        _, x, y, w, h, fill, stroke, sw = item
+        return (f'<rect x="{_n(x)}" y="{_n(y)}" width="{_n(w)}" height="{_n(h)}" '
+                f'fill="{fill}" stroke="{stroke}" stroke-width="{sw}"/>')
+    if kind == "line":
+        _, x1, y1, x2, y2, stroke, sw = item
+        return f'<line x1="{_n(x1)}" y1="{_n(y1)}" x2="{_n(x2)}" y2="{_n(y2)}" stroke="{stroke}" stroke-width="{sw}"/>'
+    if kind == "circle":
+        _, x, y, r, fill, stroke, sw = item
+        return f'<circle cx="{_n(x)}" cy="{_n(y)}" r="{_n(r)}" fill="{fill}" stroke="{stroke}" stroke-width="{sw}"/>'
+    _, x, y, text, size, anchor, fill = item
+    return f'<text x="{_n(x)}" y="{_n(y)}" font-size="{size}" text-anchor="{anchor}" fill="{fill}">{text}</text>'
+
+
+@lru_cache(maxsize=256)
+def _svg(key):
+    body = "".join(_svg_item(i) for i in _shapes(key))
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {VW} {VH}" width="100%" '
+            f'font-family="{FONT_FAMILY}">{body}</svg>')
+
+
+def svg(result):
+    """도면 SVG 문자열 (HTML 에 그대로 넣을 수 있음, 폭 100%)"""
+    return _svg(geometry_key(result))
+
+
+# ================= reportlab =================
+def _rgb(c):
+    return tuple(int(c[i:i + 2], 16) / 255.0 for i in (1, 3, 5))
+
+
+def draw_pdf(c, result, x, y, width, height, font="Helvetica"):
+    """reportlab 캔버스 c 의 (x, y, width, height) 영역(왼쪽 위 맞춤)에 도면을 벡터로 그림"""
+    k = min(width / VW, height / VH)
+    top = y + height
+    P = lambda px, py: (x + px * k, top - py * k)
+    c.saveState()
+    for item in shapes(result):
+        kind = item[0]
+        if kind == "text":
+            _, px, py, text, size, anchor, fill = item
+            c.setFillColorRGB(*_rgb(fill))
+            c.setFont(font, size * k)
+            draw = {"start": c.drawString, "middle": c.drawCentredString, "end": c.drawRightString}[anchor]
+            draw(*P(px, py), text)
+            continue
+        fill, stroke, sw = item[-3:] if kind != "line" else (None,) + item[-2:]
+        c.setStrokeColorRGB(*_rgb(stroke))
+        c.setLineWidth(sw * k)
+        if fill:
+            c.setFillColorRGB(*_rgb(fill))
+        if kind == "line":
+            c.line(*P(*item[1:3]), *P(*item[3:5]))
+        elif kind == "circle":
+            c.circle(*P(item[1], item[2]), item[3] * k, stroke=1, fill=1)
+        elif kind == "rect":
+            _, px, py, w, h = item[:5]
+            c.rect(*P(px, py + h), w * k, h * k, stroke=1, fill=1)
+        else:
+            p = c.beginPath()
+            p.moveTo(*P(*item[1][0]))
+            for pt in item[1][1:]:
+                p.lineTo(*P(*pt))
+            p.close()
+            c.drawPath(p, stroke=1, fill=1)
+    c.restoreState()
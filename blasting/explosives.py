@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+폭약 카탈로그 (explosives.csv)
+- 제품: 이름, 종류(cartridge/bulk), 직경, 1개 무게/길이, 밀도, nu, 쓸 수 있는 Pa, 기본으로 쓰는 Pa
+- import 시 한 번 읽어 Pa 별 직경 정렬 색인으로 변환
+    lookup(Pa, pd, custom): 직접입력이면 벌크 → 가장 가까운 직경의 카트리지(DIAMETER_TOL 이내) → Pa 기본 제품
+    find_batch: 같은 규칙을 (Pa, 직경) 정렬 키에 대한 np.searchsorted 로 (분기 없음)
+- 제품 추가는 CSV 한 줄 (코드 수정 없음). 다른 파일은 환경변수 BLASTING_EXPLOSIVES
+"""
+import os
+import csv
+from bisect import bisect_left
+from collections import namedtuple
+
+CATALOGUE_PATH = os.environ.get("BLASTING_EXPLOSIVES") or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                        "explosives.csv")
+DIAMETER_TOL = 0.0005           # 직경 일치 허용 (m) — pd 는 mm 단위로 반올림되므로 같은 mm 만 일치
+KINDS = ("cartridge", "bulk")
+
+
+class Product(namedtuple("Product", "name kind diameter weight length density nu pa default_pa")):
+    """카탈로그 한 줄 (diameter/length m, weight kg, density g/cm³, pa/default_pa: Pa 등급 tuple)"""
+    __slots__ = ()
+
+    def spec(self, pd):
+        """폭약경 pd 에서 (W1 kg, h1 m, nu). 벌크는 길이 length_m 만큼의 무게"""
+        if self.kind == "bulk":
+            return (1000*self.density*3.1415*(pd**2))/4.0 * self.length, self.length, self.nu
+        return self.weight, self.length, self.nu
+
+
+def _classes(text):
+    return tuple(int(v) for v in text.split())
+
+
+def _float(row, key, required=True):
+    text = (row.get(key) or "").strip()
+    if not text:
+        if required:
+            raise ValueError(f"{key} 값이 없습니다.")
+        return None
+    return float(text)
+
+
+def read_products(path):
+    """CSV → Product 목록 (# 로 시작하는 줄은 주석)"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        lines = [ln for ln in f if ln.strip() and not ln.lstrip().startswith("#")]
+    out = []
+    for i, row in enumerate(csv.DictReader(lines), 1):
+        try:
+            kind = row["kind"].strip()
+            if kind not in KINDS:
+                raise ValueError(f"kind 는 {'/'.join(KINDS)} 중 하나: {kind!r}")
+            out.append(Product(row["name"].strip(), kind, _float(row, "diameter_mm") / 1000,
+                               _float(row, "weight_kg", kind == "cartridge"), _float(row, "length_m"),
+                               _float(row, "density", kind == "bulk"), _float(row, "nu"),
+                               _classes(row["pa"]), _classes(row.get("default_pa") or "")))
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"{path} {i}번째 제품: {e}") from None
+    return out
+
+
+class Catalogue:
+    def __init__(self, products):
+        """products: Product 목록. Pa 마다 기본 제품 1개, 같은 Pa 에 같은 직경 카트리지 1개"""
+        self.products = tuple(products)
+        self.default = {}       # Pa → 제품 번호
+        self.bulk = {}          # Pa → 제품 번호 (직접입력 폭약경용)
+        by_pa = {}              # Pa → [(직경, 제품 번호)]
+        for i, p in enumerate(self.products):
+            for pa in p.default_pa:
+                if pa in self.default:
+                    raise ValueError(f"Pa {pa} 기본 제품이 둘입니다: {self.products[self.default[pa]].name}, {p.name}")
+                self.default[pa] = i
+            for pa in p.pa:
+                if p.kind == "bulk":
+                    self.bulk.setdefault(pa, i)
+                else:
+                    by_pa.setdefault(pa, []).append((p.diameter, i))
+        missing = sorted(set(by_pa).union(self.bulk) - set(self.default))
+        if missing:
+            raise ValueError(f"기본 제품(default_pa)이 없는 Pa: {missing}")
+        self._index = {}        # Pa → (정렬된 직경 목록, 제품 번호 목록)
+        for pa, items in by_pa.items():
+            items.sort()
+            for (d1, a), (d2, b) in zip(items, items[1:]):
+                if d2 - d1 < DIAMETER_TOL:
+                    raise ValueError(f"Pa {pa} 에 같은 직경 제품이 둘입니다: {self.products[a].name}, {self.products[b].name}")
+            self._index[pa] = ([d for d, _ in items], [i for _, i in items])
+        # 배치 조회용: (Pa, 직경) 순으로 정렬된 키 = Pa*10 + 직경 (직경 < 10 m)
+        flat = sorted((pa, d, i) for pa, (ds, ids) in self._index.items() for d, i in zip(ds, ids))
+        self._keys = [pa * 10 + d for pa, d, _ in flat]
+        self._key_pa = [pa for pa, _, _ in flat]
+        self._key_product = [i for _, _, i in flat]
+
+    @classmethod
+    def load(cls, path=None):
+        return cls(read_products(path or CATALOGUE_PATH))
+
+    def default_pd(self, Pa):
+        """Pa 기본 폭약경 (기본 제품 직경)"""
+        return self.products[self.default[Pa]].diameter
+
+    def find(self, Pa, pd, custom=False):
+        """제품 번호: 직접입력(custom)이면 Pa 의 벌크 > 가장 가까운 직경 카트리지 > Pa 기본 제품"""
+        if custom and Pa in self.bulk:
+            return self.bulk[Pa]
+        index = self._index.get(Pa)
+        if index:
+            ds, ids = index
+            j = bisect_left(ds, pd)
+            for k in (j - 1, j):
+                if 0 <= k < len(ds) and abs(ds[k] - pd) < DIAMETER_TOL:
+                    return ids[k]
+        return self.default[Pa]
+
+    def lookup(self, Pa, pd, custom=False):
+        return self.products[self.find(Pa, pd, custom)]
+
+    def spec(self, Pa, pd, custom=False):
+        """(W1, h1, nu) — core.cartridge"""
+        return self.lookup(Pa, pd, custom).spec(pd)
+
+    def find_batch(self, Pa, pd, custom):
+        """find 의 배열 버전 (Pa, pd, custom 배열 → 제품 번호 배열)"""
+        import numpy as np
+
+        Pa = np.asarray(Pa, dtype=np.int64)
+        pd = np.asarray(pd, dtype=float)
+        out = np.array([self.default.get(int(pa), -1) for pa in range(Pa.max() + 1)] if Pa.size else [-1],
+                       dtype=np.int64)[Pa]
+        if self._keys:
+            keys = np.asarray(self._keys)
+            key = Pa * 10 + pd
+            j = np.searchsorted(keys, key).clip(1, len(keys) - 1) if len(keys) > 1 else np.zeros(Pa.shape, int)
+            left = np.maximum(j - 1, 0)
+            j = np.where(np.abs(keys[left] - key) <= np.abs(keys[j] - key), left, j)
+            hit = (np.asarray(self._key_pa)[j] == Pa) & (np.abs(keys[j] - key) < DIAMETER_TOL)
+            out = np.where(hit, np.asarray(self._key_product)[j], out)
+        if self.bulk:
+            bulk = np.full(out.shape, -1)
+            for pa, i in self.bulk.items():
+                bulk[Pa == pa] = i
+            out = np.where(np.asarray(custom, dtype=bool) & (bulk >= 0), bulk, out)
+        return out
+
+
+CATALOGUE = Catalogue.load()
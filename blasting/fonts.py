@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+reportlab 한글 폰트 등록 (프로세스당 1회)
+- 후보 경로를 한 번만 탐색하고, TTF 파싱/registerFont 도 한 번만 수행
+- 여러 스레드(Streamlit 세션, 작업 스레드)에서 동시에 호출해도 안전
+- BLASTING_KOR_FONT 환경변수로 폰트 파일을 직접 지정 가능
+"""
+import os
+import threading
+
+FONT_NAME = "KOR"
+
+_lock = threading.Lock()
+_state = {}   # "name": 등록된 폰트 이름 또는 None, "path": 사용한 파일
+
+
+def candidates():
+    paths = []
+    env = os.environ.get("BLASTING_KOR_FONT")
+    if env:
+        paths.append(env)
+    win = os.environ.get("WINDIR")
+    if win:
+        paths += [
+            os.path.join(win, "Fonts", "malgun.ttf"),
+            os.path.join(win, "Fonts", "NanumGothic.ttf"),
+        ]
+    paths += [
+        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf",
+        "/usr/share/fonts/opentype/nanum/NanumGothic.otf",
+        "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
+        "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+        "C:\\Windows\\Fonts\\malgun.ttf",
+        "C:\\Windows\\Fonts\\NanumGothic.ttf",
+    ]
+    return paths
+
+
+def korean_font():
+    """한글 폰트를 등록하고 이름("KOR")을 반환. 찾지 못하면 None (reportlab 이 없으면 ImportError)"""
+    if "name" in _state:
+        return _state["name"]
+    with _lock:
+        if "name" in _state:
+            return _state["name"]
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        name = path = None
+        for p in candidates():
+            if os.path.isfile(p):
+                try:
+                    pdfmetrics.registerFont(TTFont(FONT_NAME, p))
+                    name, path = FONT_NAME, p
+                    break
+                except Exception:
+                    continue
+        _state["path"] = path
+        _state["name"] = name
+        return name
+
+
+def korean_font_path():
+    """등록에 사용한 폰트 파일 경로 (없으면 None)"""
+    korean_font()
+    return _state.get("path")
+
+
+def reset():
+    """다음 호출 때 다시 탐색 (폰트 설치 후 등)"""
+    with _lock:
+        _state.clear()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+계단 발파 공 배치 (공 하나하나의 좌표와 장약)
+- 계단 평면 다각형 + 자유면 선분 + compute 결과(B, S, H, T, h, Q) → 공 격자
+    열(row)은 자유면과 나란히, 자유면에서 B, 2B, 3B ... 안쪽
+    열 안에서 공 간격 S (자유면 시작점에서 S/2 부터), pattern="staggered" 면 홀수 열을 S/2 밀어 엇갈림
+    다각형 안(경계에서 margin 이상)의 공만 남김
+- 보호 대상(structures.Structures)을 주면 공마다 실제 좌표에서 지배 대상, 거리, 허용 장약량 Q2 를 계산하여
+  공 장약량 Q 와 비교 (1공 1지발 기준, 초과 공은 ok=False)
+- 모든 단계가 공 배열 연산 (공 수 x 다각형 변 수)
+
+사용 예:
+    res = compute(K=200, n=-1.6, Vel=0.3, D=80)
+    lay = layout(polygon, face, res, pattern="staggered", structures=st, K=200, n=-1.6)
+    lay.summary()          # {"holes": ..., "explosive": ..., "drilled": ..., "over": ...}
+    lay.to_csv("공배치.csv")
+"""
+import csv
+
+import numpy as np
+
+PATTERNS = ("square", "staggered")
+COLUMNS = ("hole", "row", "x", "y", "H", "T", "h", "Q", "structure", "D", "Q2", "ok")
+
+
+def _inside(x, y, poly):
+    """점들이 다각형 안에 있는지 (짝홀 규칙, 점 x 변 배열 연산)"""
+    x0, y0 = poly[:, 0], poly[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    px, py = x[:, None], y[:, None]
+    cross = (y0 > py) != (y1 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xi = x0 + (py - y0) * (x1 - x0) / (y1 - y0)
+    return ((cross & (px < xi)).sum(axis=1) % 2) == 1
+
+
+def _edge_distance(x, y, poly):
+    """점에서 다각형 경계까지 최단 거리"""
+    a = poly
+    b = np.roll(poly, -1, axis=0)
+    ab = b - a
+    L2 = np.maximum((ab ** 2).sum(axis=1), 1e-300)
+    t = np.clip(((x[:, None] - a[:, 0]) * ab[:, 0] + (y[:, None] - a[:, 1]) * ab[:, 1]) / L2, 0, 1)
+    return np.hypot(a[:, 0] + t * ab[:, 0] - x[:, None], a[:, 1] + t * ab[:, 1] - y[:, None]).min(axis=1)
+
+
+def hole_grid(polygon, face, B, S, pattern="staggered", margin=0.0):
+    """다각형 + 자유면 (p0, p1) → (x, y, row) 배열 (열 순서, 열 안에서는 자유면 방향 순서)"""
+    if pattern not in PATTERNS:
+        raise ValueError(f"pattern 은 {'/'.join(PATTERNS)} 중 하나: {pattern!r}")
+    if not (B > 0 and S > 0):
+        raise ValueError(f"B, S 는 양수여야 합니다 (B={B}, S={S}).")
+    poly = np.asarray(polygon, dtype=float)
+    if poly.ndim != 2 or poly.shape[0] < 3 or poly.shape[1] != 2:
+        raise ValueError("계단 다각형은 (x, y) 점 3개 이상이어야 합니다.")
+    p0, p1 = (np.asarray(p, dtype=float) for p in face)
+    length = np.hypot(*(p1 - p0))
+    if length <= 0:
+        raise ValueError("자유면 선분의 두 점이 같습니다.")
+    u = (p1 - p0) / length                     # 자유면 방향
+    v = np.array([-u[1], u[0]])                # 안쪽 방향 (다각형 중심 쪽)
+    if (poly.mean(axis=0) - p0) @ v < 0:
+        v = -v
+
+    # 다각형을 (자유면 방향 t, 안쪽 거리 s) 좌표로
+    t_all, s_all = (poly - p0) @ u, (poly - p0) @ v
+    rows = np.arange(1, int(np.floor(s_all.max() / B)) + 1)
+    k = np.arange(int(np.floor((t_all.min() - S / 2) / S)) - 1, int(np.ceil((t_all.max() - S / 2) / S)) + 1)
+    shift = (pattern == "staggered") * (rows - 1) % 2 * (S / 2)
+    t = (S / 2 + k * S)[None, :] + shift[:, None]
+    s = np.broadcast_to((rows * B)[:, None], t.shape)
+    row = np.broadcast_to(rows[:, None], t.shape)
+    x = (p0[0] + t * u[0] + s * v[0]).ravel()
+    y = (p0[1] + t * u[1] + s * v[1]).ravel()
+    keep = _inside(x, y, poly)
+    if margin > 0:
+        keep[keep] = _edge_distance(x[keep], y[keep], poly) >= margin
+    return x[keep], y[keep], row.ravel()[keep]
+
+
+class Layout:
+    def __init__(self, columns):
+        """columns: COLUMNS 이름 → 공 수 길이 배열"""
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["hole"])
+
+    def __getitem__(self, key):
+        return self.columns[key]
+
+    def summary(self):
+        """공 수, 총 장약량 (kg), 총 천공장 (m), 허용 장약량 초과 공 수"""
+        c = self.columns
+        return {"holes": len(self), "explosive": float(c["Q"].sum()), "drilled": float(c["H"].sum()),
+                "over": int((~c["ok"]).sum())}
+
+    def to_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            w = csv.writer(f)
+            w.writerow(COLUMNS)
+            w.writerows(zip(*(self.columns[k].tolist() for k in COLUMNS)))
+
+    def to_dicts(self):
+        return [dict(zip(COLUMNS, r)) for r in zip(*(self.columns[k].tolist() for k in COLUMNS))]
+
+
+def layout(polygon, face, result, pattern="staggered", margin=0.0, structures=None, K=None, n=None):
+    """
+    compute 결과(result)의 B, S 로 공 격자를 만들고 공마다 H, T, h, Q 를 붙인 Layout.
+    structures (structures.Structures) 와 K, n 을 주면 공 좌표에서 지배 대상/거리/Q2 와 ok (Q <= Q2)
+    """
+    x, y, row = hole_grid(polygon, face, result["B"], result["S"], pattern, margin)
+    size = x.size
+    full = lambda v: np.full(size, float(v))
+    cols = {"hole": np.arange(1, size + 1), "row": row, "x": x, "y": y,
+            "H": full(result["H"]), "T": full(result["T"]), "h": full(result["h"]), "Q": full(result["Q"])}
+    if structures is not None:
+        if K is None or n is None:
+            raise ValueError("보호 대상을 검토하려면 K, n 이 필요합니다.")
+        g = structures.governing(x, y, K, n)
+        cols.update(structure=g.index, D=g.D, Q2=g.Q2, ok=cols["Q"] <= g.Q2)
+    else:
+        cols.update(structure=np.full(size, -1), D=full(np.nan), Q2=full(np.nan), ok=np.ones(size, dtype=bool))
+    return Layout(cols)
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+인쇄용 HTML 문서 (Streamlit '인쇄' 버튼)
+- 문서는 결과 + 이미지 내용 해시(content_key)로 이름 붙여 static/print/ 에 한 번만 기록
+    <key>.json : {"html": 인쇄 문서}  (패턴 도면은 SVG 로 문서에 포함, 이미지를 주면 파일 이름으로 참조)
+    <digest>.jpg : 인쇄 크기 패턴 이미지 (같은 이미지는 모든 문서가 공유, base64 로 넣지 않음)
+- Streamlit 정적 파일 서비스(server.enableStaticServing)로 app/static/print/ 에서 제공
+  (.html 은 Streamlit 버전에 따라 text/plain 으로 내려가므로 JSON 에 담아 창에 document.write)
+- 출력날짜는 인쇄 창을 열 때 브라우저에서 채움 → 같은 결과는 날짜와 무관하게 같은 문서
+- 화면에는 문서 키만 담긴 작은 버튼만 보냄. 인쇄를 누를 때 한 번 내려받음
+"""
+import os
+import json
+import shutil
+
+from .assets import BASE_DIR, derivative, file_digest
+from .core import PA_NAMES
+from .diagram import VERSION as DIAGRAM_VERSION, svg
+
+PRINT_DIR = os.path.join(BASE_DIR, "static", "print")
+PRINT_URL = "app/static/print/"
+MAX_DOCS = int(os.environ.get("BLASTING_PRINT_DOCS", "2000"))   # 넘으면 오래된 문서부터 정리
+
+
+def print_html(result, img_src=None):
+    """인쇄 문서 HTML. img_src: 패턴 이미지 URL(상대 경로 또는 data:), 없으면 벡터 도면(SVG)"""
+    r = result
+    pa_name = PA_NAMES.get(r['Pa'], '일반발파')
+    return f'''<!DOCTYPE html>
+<html><head><meta charset="UTF-8"><title>스마트스템 발파설계</title>
+<style>
+body {{ font-family: 'Malgun Gothic', sans-serif; padding: 30px; }}
+h2 {{ text-align: center; margin-bottom: 5px; }}
+.date-line {{ text-align: right; margin-bottom: 15px; font-size: 12px; color: #555; }}
+h3 {{ margin-bottom: 20px; }}
+.container {{ display: flex; gap: 30px; align-items: flex-start; }}
+.left {{ flex: 0 0 auto; }}
+.right {{ flex: 1; display: flex; align-items: flex-start; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #333; padding: 8px 15px; text-align: left; }}
+th {{ background: #f0f0f0; }}
+.right img {{ height: 380px; width: auto; object-fit: contain; }}
+.right svg {{ max-height: 380px; }}
+</style>
+</head><body>
+<h2>스마트스템 발파설계</h2>
+<div class="date-line">출력날짜: <span id="out-date"></span></div>
+<h3>{pa_name}</h3>
+<div class="container">
+<div class="left">
+<table>
+<tr><th>항목</th><th>값</th></tr>
+<tr><td>저항선 (B)</td><td>{r['B']:.2f} m</td></tr>
+<tr><td>공간격 (S)</td><td>{r['S']:.2f} m</td></tr>
+<tr><td>전색장 (T)</td><td>{r['T']:.2f} m</td></tr>
+<tr><td>장약장 (h)</td><td>{r['h']:.2f} m</td></tr>
+<tr><td>천공장 (H)</td><td>{r['H']:.2f} m</td></tr>
+<tr><td>계단높이</td><td>{r['K_step']:.2f} m</td></tr>
+<tr><td>장약량/공 (Q)</td><td>{r['Q']} kg</td></tr>
+<tr><td>비장약량 (c1)</td><td>{r['c1']} kg/m³</td></tr>
+<tr><td>폭약경 (pd)</td><td>{r['pd']} m</td></tr>
+</table>
+</div>
+<div class="right">
+{f"<img src='{img_src}'/>" if img_src else svg(r)}
+</div>
+</div>
+<script>
+var d = new Date(), p = function(x) {{ return (x < 10 ? '0' : '') + x; }};
+document.getElementById('out-date').textContent =
+    d.getFullYear() + '-' + p(d.getMonth() + 1) + '-' + p(d.getDate()) + ' ' + p(d.getHours()) + ':' + p(d.getMinutes());
+window.onload = function() {{ window.print(); }};
+</script>
+</body></html>'''
+
+
+def _write(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _publish_image(img_path, print_dir):
+    """인쇄 크기 이미지를 <digest>.<확장자> 로 한 번만 복사. 반환: 파일 이름"""
+    src = derivative(img_path, "print")
+    name = file_digest(src)[:24] + (os.path.splitext(src)[1].lower() or ".jpg")
+    dst = os.path.join(print_dir, name)
+    if not os.path.isfile(dst):
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    return name
+
+
+def _prune(print_dir, keep):
+    docs = sorted((e for e in os.scandir(print_dir) if e.name.endswith(".json")),
+                  key=lambda e: e.stat().st_mtime)
+    for e in docs[:max(0, len(docs) - keep)]:
+        try:
+            os.remove(e.path)
+        except OSError:
+            pass
+
+
+def publish(result, img_path, print_dir=None):
+    """
+    인쇄 문서를 print_dir 에 기록(이미 있으면 그대로)하고 문서 키 반환. img_path 가 없으면 벡터 도면.
+    브라우저에서는 PRINT_URL + 키 + ".json" 으로 받음 (이미지 src 는 같은 폴더 기준 상대 경로)
+    """
+    from .report import content_key
+
+    print_dir = print_dir or PRINT_DIR
+    key = content_key(result, img_path, "print",
+                      file_digest(derivative(img_path, "print")) if img_path else DIAGRAM_VERSION)[:32]
+    path = os.path.join(print_dir, key + ".json")
+    if os.path.isfile(path):
+        return key
+    os.makedirs(print_dir, exist_ok=True)
+    img = _publish_image(img_path, print_dir) if img_path and os.path.isfile(img_path) else None
+    _write(path, json.dumps({"html": print_html(result, img)}, ensure_ascii=False).encode("utf-8"))
+    if len(os.listdir(print_dir)) > MAX_DOCS * 1.25:
+        _prune(print_dir, MAX_DOCS)
+    return key
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+PDF 렌더링 프로세스 풀 (설계 1건 = PDF 1개를 대량으로 출력)
+- 레이아웃: "web" = report.make_pdf (Streamlit), "desktop" = report.make_desktop_pdf (Tkinter 결과출력)
+- 작업자 프로세스는 시작할 때 한글 폰트 등록 + 패턴 이미지 XObject 준비 (warm) → 작업마다 반복하지 않음
+- queue_depth: 풀에 동시에 맡겨 둔 작업 수 상한 (작업 수와 무관하게 메모리 일정)
+- timeout: 작업별 제한시간(초). 작업자가 작업을 시작할 때 (작업 번호, pid) 를 큐로 알리고 그 시점부터 잼
+  (풀 안에서 대기 중인 작업은 시간이 가지 않음). 초과한 작업은 TimeoutError 로 보고하고, 그 작업자를 끝낸 뒤
+  풀을 다시 만들어 나머지 작업을 이어서 처리
+- 작업자가 비정상 종료하면 그때 처리 중이던 작업을 새 풀에서 하나씩 단독으로 다시 시도
+  (단독으로도 실패한 작업만 오류로 보고)
+- 결과는 끝나는 순서대로 RenderResult(key, data, error, seconds) 로 yield
+  (data: out 경로를 준 작업은 그 경로, 아니면 PDF bytes)
+- 명령행 종료 코드: 실패하거나 제한시간을 넘긴 작업이 하나라도 있으면 1
+
+사용 예:
+    jobs = (RenderJob(i, res, out=f"pdf/{i}.pdf") for i, res in enumerate(results))
+    with RenderPool(workers=8, queue_depth=32, timeout=30) as pool:
+        for r in pool.imap(jobs):
+            if r.error: print(r.key, r.error)
+
+    python -m blasting.render 설계결과.csv -d pdf -j 8 --layout desktop --timeout 30
+"""
+import os
+import re
+import sys
+import time
+import queue
+import signal
+import argparse
+import multiprocessing
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from .fonts import korean_font
+from .report import get_pattern_path, image_size, make_desktop_pdf, make_pdf, pattern_paths
+
+LAYOUTS = {"web": make_pdf, "desktop": make_desktop_pdf}
+
+# img_path None → Pa 기본 패턴 이미지
+RenderJob = namedtuple("RenderJob", "key result img_path layout out", defaults=(None, "web", None))
+RenderResult = namedtuple("RenderResult", "key data error seconds")
+
+
+# ================= 작업자 =================
+_started = None            # 작업자: 작업 시작 알림 큐
+
+
+def _warm(paths, started=None):
+    global _started
+    _started = started
+    korean_font()
+    for p in paths:
+        try:
+            image_size(p)
+        except Exception:
+            pass
+
+
+def _run(seq, job):
+    """작업자에서 작업 시작을 알린 뒤 렌더링"""
+    if _started is not None:
+        _started.put((seq, os.getpid()))
+    return render_job(job)
+
+
+def render_job(job):
+    """작업 1건 렌더링 (작업자 프로세스 또는 현재 프로세스). 오류는 error 로 반환"""
+    t = time.perf_counter()
+    try:
+        img = job.img_path if job.img_path is not None else get_pattern_path(job.result)[0]
+        data = LAYOUTS[job.layout](job.result, img)
+        if data is None:
+            raise RuntimeError("PDF 생성을 위해 reportlab이 필요합니다.")
+        if job.out:
+            with open(job.out, "wb") as f:
+                f.write(data)
+            data = job.out
+        return RenderResult(job.key, data, None, time.perf_counter() - t)
+    except Exception as e:
+        return RenderResult(job.key, None, f"{type(e).__name__}: {e}", time.perf_counter() - t)
+
+
+# ================= 풀 =================
+class RenderPool:
+    def __init__(self, workers=None, queue_depth=None, timeout=None, warm_paths=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_depth = max(1, queue_depth or 2 * self.workers)
+        self.timeout = timeout
+        self.warm_paths = tuple(pattern_paths() if warm_paths is None else warm_paths)
+        self._ex = None
+        self._started = None
+        self._seq = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _executor(self):
+        if self._ex is None:
+            ctx = multiprocessing.get_context()
+            self._started = ctx.Queue() if self.timeout else None
+            self._ex = ProcessPoolExecutor(self.workers, mp_context=ctx, initializer=_warm,
+                                           initargs=(self.warm_paths, self._started))
+        return self._ex
+
+    def _kill(self, pids=()):
+        """pids 작업자(멈춘 작업)를 끝내고 풀을 닫음 (다음 제출 때 새 풀). 남은 작업자는 풀이 정리"""
+        ex, started = self._ex, self._started
+        self._ex = self._started = None
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        ex.shutdown(wait=True, cancel_futures=True)
+        if started is not None:
+            started.close()
+
+    def close(self):
+        if self._ex is not None:
+            self._ex.shutdown()
+            self._ex = None
+        if self._started is not None:
+            self._started.close()
+            self._started = None
+
+    def _drain_started(self, running, now):
+        """작업 시작 알림을 읽어 running (작업 번호 → 상태) 에 시작 시각(주 프로세스 시계)과 pid 기록"""
+        while True:
+            try:
+                seq, pid = self._started.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                return
+            st = running.get(seq)
+            if st is not None:
+                st[2], st[3] = now, pid
+
+    def imap(self, jobs):
+        """jobs(RenderJob iterable) 를 렌더링하여 RenderResult 를 끝나는 순서대로 yield"""
+        jobs = iter(jobs)
+        pending = {}           # future → [작업, 작업 번호, 시작 시각 또는 None, 작업자 pid, 단독 재시도 여부]
+        retry = deque()        # 작업자 비정상 종료 때 처리 중이던 작업 (하나씩 단독 실행)
+        more = True
+        poll = None if not self.timeout else min(0.5, self.timeout / 10)
+
+        def submit(job, alone=False):
+            self._seq += 1
+            pending[self._executor().submit(_run, self._seq, job)] = [job, self._seq, None, None, alone]
+
+        while True:
+            if retry:
+                if not pending:
+                    submit(retry.popleft(), True)
+            else:
+                while more and len(pending) < self.queue_depth:
+                    job = next(jobs, None)
+                    if job is None:
+                        more = False
+                        break
+                    submit(job)
+            if not pending:
+                return
+
+            done, _ = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+            broken = False
+            for fut in done:
+                job, _, _, _, alone = pending.pop(fut)
+                try:
+                    yield fut.result()
+                except BrokenProcessPool as e:
+                    broken = True
+                    if alone:          # 단독으로도 작업자를 죽인 작업
+                        yield RenderResult(job.key, None, f"{type(e).__name__}: {e}", 0.0)
+                    else:
+                        retry.append(job)
+                except Exception as e:
+                    yield RenderResult(job.key, None, f"{type(e).__name__}: {e}", 0.0)
+
+            expired = []
+            if self.timeout and pending:
+                now = time.monotonic()
+                self._drain_started({st[1]: st for st in pending.values()}, now)
+                expired = [fut for fut, st in pending.items() if st[2] is not None and now - st[2] > self.timeout]
+                for fut in expired:
+                    job = pending[fut][0]
+                    yield RenderResult(job.key, None, f"TimeoutError: {self.timeout}초 초과", float(self.timeout))
+
+            if broken or expired:
+                # 멈춘/죽은 작업자 정리. 비정상 종료면 처리 중이던 작업은 단독 재시도, 시간 초과면 나머지를 그대로 다시 제출
+                pids = [pending.pop(fut)[3] for fut in expired]
+                rest = list(pending.values())
+                pending.clear()
+                self._kill(pids)
+                for job, _, _, _, alone in rest:
+                    if broken:
+                        retry.append(job)
+                    else:
+                        submit(job, alone)
+
+
+def render_all(jobs, workers=None, queue_depth=None, timeout=None):
+    """RenderPool 을 만들어 jobs 를 모두 처리 (끝나는 순서대로 yield)"""
+    with RenderPool(workers, queue_depth, timeout) as pool:
+        yield from pool.imap(jobs)
+
+
+# ================= runner 결과 CSV → PDF 파일들 =================
+def _file_name(i, label):
+    label = re.sub(r'[\\/:*?"<>|\s]+', "_", label or "").strip("_")
+    return f"{i:06d}_{label}.pdf" if label else f"{i:06d}.pdf"
+
+
+def main(argv=None):
+    from .runner import read_results
+
+    ap = argparse.ArgumentParser(prog="python -m blasting.render",
+                                 description="일괄 설계 결과 CSV → 설계별 PDF (프로세스 풀)")
+    ap.add_argument("input", help="python -m blasting.runner 결과 CSV")
+    ap.add_argument("-d", "--outdir", required=True, help="PDF 저장 폴더")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    ap.add_argument("--layout", choices=sorted(LAYOUTS), default="web")
+    ap.add_argument("--queue-depth", type=int, default=None, help="동시에 맡기는 작업 수 (기본: 작업자 x2)")
+    ap.add_argument("--timeout", type=float, default=None, help="작업별 제한시간(초)")
+    ap.add_argument("--label", default=None, help="파일 이름에 붙일 입력 열 이름")
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.outdir, exist_ok=True)
+    jobs = (RenderJob(i, res, layout=args.layout,
+                      out=os.path.join(args.outdir, _file_name(i, row.get(args.label) if args.label else None)))
+            for i, (row, res) in enumerate(read_results(args.input), 1) if res is not None)
+    t = time.perf_counter()
+    total = errors = 0
+    for r in render_all(jobs, args.jobs, args.queue_depth, args.timeout):
+        total += 1
+        if r.error:
+            errors += 1
+            print(f"[{r.key}] {r.error}", file=sys.stderr)
+    print(f"완료: PDF {total - errors:,}개 (오류 {errors:,}) {time.perf_counter() - t:.1f}초 → {args.outdir}",
+          file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
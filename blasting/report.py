@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+결과 리포트(PDF) / 패턴 이미지 경로
+- reportlab 은 make_pdf 호출 시점에만 import (core/batch import 비용에 포함되지 않음)
+- make_pdf: Streamlit 레이아웃(표 + 패턴, draw_design_page — campaign 과 공용), make_desktop_pdf: Tkinter 결과출력/인쇄 레이아웃
+- make_pdf 에 이미지 경로를 주지 않으면 결과 값으로 그린 벡터 도면(diagram) → 이미지 스트림 없음
+- 패턴 이미지는 canvas.drawImage 에 JPEG 파일 경로를 넘김 (reportlab 이 픽셀 해석 없이 DCT 스트림 그대로 기록)
+  이미지 스트림의 ASCII85 인코딩은 drawImage 동안만 끔 (rl_config.useA85, C 가속 모듈이 없으면 PDF 1건 시간의 대부분)
+  이미지 크기와 JPEG 이외 이미지의 RGB 변환본은 프로세스당 한 번만 만듦
+- 이미지는 assets 의 "pdf"(인쇄용은 "print") 파생본을 사용 (없으면 원본)
+- cached_pdf: 결과 dict + 패턴 이미지 내용 해시 + 출력날짜(일 단위)로 PDF bytes 를 프로세스 공용 저장소에 캐시
+"""
+import os
+import io
+import json
+import hashlib
+import importlib.util
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+from .core import PA_NAMES
+from .diagram import draw_pdf
+from .assets import BASE_DIR, derivative, file_digest, on_white
+from .cache import ByteStore
+from .fonts import korean_font
+
+PDF_CACHE_BYTES = int(os.environ.get("BLASTING_PDF_CACHE_MB", "64")) * 1024 * 1024
+_pdf_store = ByteStore(PDF_CACHE_BYTES)
+_A85_LOCK = threading.Lock()          # draw_image 가 rl_config.useA85 를 잠시 바꾸는 구간
+
+
+def get_pattern_path(result):
+    # Pa 값에 따라 다른 패턴 이미지 사용
+    pa = result.get('Pa', 5)
+    # Pa 1,2 -> 패턴1, Pa 3 -> 패턴2, Pa 4 -> 패턴3, Pa 5 -> 패턴4, Pa 6 -> 패턴5
+    pattern_map = {1: 1, 2: 1, 3: 2, 4: 3, 5: 4, 6: 5}
+    idx = pattern_map.get(pa, 4)
+    path = os.path.join(BASE_DIR, "발파프로그램", f"발파패턴{idx}_1.jpg")
+    return (path, idx) if os.path.exists(path) else (None, idx)
+
+
+def pattern_paths():
+    """존재하는 패턴 이미지 경로 (Pa 1~6 기준, 중복 제거)"""
+    paths = (get_pattern_path({"Pa": pa})[0] for pa in sorted(PA_NAMES))
+    return list(dict.fromkeys(p for p in paths if p))
+
+
+# ================= 패턴 이미지 (프로세스당 1회 준비) =================
+@lru_cache(maxsize=32)
+def _image_source(path, mtime_ns, size):
+    """drawImage 에 넘길 이미지와 크기: JPEG 는 경로 그대로, 그 밖(PNG 등)은 흰 배경 RGB ImageReader"""
+    from reportlab.lib.utils import ImageReader
+
+    ir = ImageReader(path)
+    if ir.jpeg_fh():
+        return path, ir.getSize()
+    # JPEG 이외(PNG 등)는 투명 배경을 흰색으로 합쳐 RGB 로 (인쇄 시 검정 배경 방지)
+    from PIL import Image
+    with Image.open(path) as im:
+        img = on_white(im).convert("RGB")
+    return ImageReader(img), img.size
+
+
+def image_source(path, profile="pdf"):
+    """path 의 (drawImage 이미지, (가로, 세로) 픽셀). profile 파생본 기준, 경로/수정시각/크기가 같으면 재사용"""
+    path = derivative(path, profile)
+    st = os.stat(path)
+    return _image_source(path, st.st_mtime_ns, st.st_size)
+
+
+def image_size(path, profile="pdf"):
+    return image_source(path, profile)[1]
+
+
+def draw_image(c, path, x, y, width, height, profile="pdf"):
+    """
+    c.drawImage 로 패턴 이미지 (profile 파생본). 이미지 스트림은 ASCII85 없이 바이너리로 기록
+    (인코딩은 이미지 객체를 만들 때 rl_config.useA85 로 정해짐 → 이 호출 동안만 끄고 되돌림,
+     다른 스트림과 프로세스의 다른 reportlab 사용에는 영향 없음)
+    """
+    from reportlab import rl_config
+
+    src = image_source(path, profile)[0]
+    with _A85_LOCK:
+        saved = rl_config.useA85
+        rl_config.useA85 = 0
+        try:
+            c.drawImage(src, x, y, width, height)
+        finally:
+            rl_config.useA85 = saved
+
+
+def design_rows(result):
+    """결과 표 행 [(항목, 값)] (첫 행은 머리글). make_pdf / campaign 공용"""
+    return [
+        ("항목", "값"),
+        ("저항선 (B)", f"{result['B']:.2f} m"),
+        ("공간격 (S)", f"{result['S']:.2f} m"),
+        ("전색장 (T)", f"{result['T']:.2f} m"),
+        ("장약장 (h)", f"{result['h']:.2f} m"),
+        ("천공장 (H)", f"{result['H']:.2f} m"),
+        ("계단높이", f"{result['K_step']:.2f} m"),
+        ("장약량/공 (Q)", f"{result['Q']} kg"),
+        ("비장약량 (c1)", f"{result['c1']} kg/m³"),
+        ("폭약경 (pd)", f"{result['pd']} m"),
+    ]
+
+
+def draw_design_page(c, result, img_path, font, output_date, title="스마트스템 발파설계", note=None):
+    """
+    make_pdf 레이아웃 한 페이지 (타이틀, 출력날짜, Pa 이름, 결과 표, 패턴). showPage 는 호출한 쪽에서.
+    font: 등록된 폰트 이름 (None → Helvetica), note: 우측 Pa 이름 줄에 표시할 문구 (campaign 의 No./라벨)
+    """
+    from reportlab.lib.pagesizes import A4
+
+    W, H = A4
+    mm = lambda x: x * 72.0 / 25.4
+
+    def setf(s):
+        try: c.setFont(font or "Helvetica", s)
+        except: c.setFont("Helvetica", s)
+
+    # 타이틀
+    setf(16)
+    c.drawCentredString(W/2, H-mm(25), title)
+
+    # 출력날짜 (우측 정렬)
+    setf(10)
+    c.drawRightString(W - mm(15), H-mm(35), f"출력날짜: {output_date}")
+
+    # Pa 이름
+    setf(12)
+    c.drawString(mm(25), H-mm(40), PA_NAMES.get(result['Pa'], '일반발파'))
+    if note:
+        setf(10)
+        c.drawRightString(W - mm(15), H-mm(40), note)
+
+    # 테이블 그리기
+    table_x = mm(25)
+    table_y = H - mm(50)
+    col1_w = mm(35)  # 항목 열 너비
+    col2_w = mm(30)  # 값 열 너비
+    row_h = mm(8)    # 행 높이
+
+    rows = design_rows(result)
+
+    # 테이블 테두리 및 텍스트
+    c.setStrokeColorRGB(0.3, 0.3, 0.3)
+    c.setLineWidth(0.5)
+    for i, (label, value) in enumerate(rows):
+        y = table_y - i * row_h
+        # 셀 테두리
+        c.rect(table_x, y - row_h, col1_w, row_h)
+        c.rect(table_x + col1_w, y - row_h, col2_w, row_h)
+        # 헤더 배경
+        if i == 0:
+            c.setFillColorRGB(0.94, 0.94, 0.94)
+            c.rect(table_x, y - row_h, col1_w + col2_w, row_h, fill=1)
+            c.setFillColorRGB(0, 0, 0)
+        # 텍스트
+        setf(9 if i == 0 else 9)
+        c.drawString(table_x + mm(2), y - row_h + mm(2.5), label)
+        c.drawString(table_x + col1_w + mm(2), y - row_h + mm(2.5), value)
+
+    # 이미지 (오른쪽) - 표와 높이 맞춤. 이미지 경로가 없으면 벡터 도면
+    if img_path is None:
+        img_x = table_x + col1_w + col2_w + mm(10)
+        draw_pdf(c, result, img_x, table_y - len(rows) * row_h, W - img_x - mm(10), len(rows) * row_h,
+                 font=font or "Helvetica")
+    elif os.path.isfile(img_path):
+        try:
+            iw, ih = image_size(img_path)
+            img_x = table_x + col1_w + col2_w + mm(15)
+            img_max_w = W - img_x - mm(15)
+            table_height = len(rows) * row_h  # 표 전체 높이
+            img_max_h = table_height  # 이미지 높이를 표 높이에 맞춤
+            scale = min(img_max_w/iw, img_max_h/ih)
+            img_y = table_y - table_height  # 표 하단과 맞춤
+            draw_image(c, img_path, img_x, img_y, iw*scale, ih*scale)
+        except: pass
+
+
+def make_pdf(result, img_path, output_date=None):
+    """output_date: 출력날짜 문자열 (기본: 현재 시각 "%Y-%m-%d %H:%M")"""
+    try:
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4
+    except: return None
+
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
+    draw_design_page(c, result, img_path, korean_font(),
+                     output_date or datetime.now().strftime("%Y-%m-%d %H:%M"))
+    c.showPage()
+    c.save()
+    buf.seek(0)
+    return buf.getvalue()
+
+
+def make_desktop_pdf(result, img_path, notice=True, profile="pdf"):
+    """
+    Tkinter 결과출력/인쇄 레이아웃 (위 30mm/왼쪽 30mm 여백, 패턴은 좌 10mm·위 10mm 이동).
+    notice: 폰트 안내 문구, profile: 이미지 파생본 ("pdf" 또는 인쇄용 "print")
+    """
+    try:
+        from reportlab.pdfgen import canvas as pdfcanvas
+        from reportlab.lib.pagesizes import A4
+    except Exception: return None
+
+    font_name = korean_font()  # 프로세스당 1회 등록
+
+    # 페이지/여백(mm)
+    PAGE_W, PAGE_H = A4  # 595x842 pt
+    def mm(x): return x * 72.0 / 25.4
+    margin_l, margin_r = mm(30), mm(20)    # 왼쪽 30 mm
+    margin_t, margin_b = mm(30), mm(15)    # 위쪽 30 mm
+
+    buf = io.BytesIO()
+    c = pdfcanvas.Canvas(buf, pagesize=A4)
+    def setfont(size):
+        try:
+            c.setFont(font_name if font_name else "Helvetica", size)
+        except Exception:
+            c.setFont("Helvetica", size)
+
+    # 타이틀 (가운데 정렬)
+    setfont(18)
+    c.drawCentredString(PAGE_W / 2.0, PAGE_H - margin_t, "스마트스템 발파설계")
+
+    # 출력날짜 (우측 정렬)
+    setfont(10)
+    output_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+    c.drawRightString(PAGE_W - margin_r, PAGE_H - margin_t - mm(8), f"출력날짜: {output_date}")
+    y = PAGE_H - margin_t - mm(16)
+
+    # Pa 라벨
+    pa_title = PA_NAMES.get(result.get("Pa",5),"일반발파")
+    setfont(12)
+    c.drawString(margin_l, y, f"발파공법 : {pa_title}")
+    y -= mm(8)
+
+    # 좌측 정보 블록
+    lines = [
+        ("저항선(B)", f"{result['B']:.2f} m"),
+        ("공간격(S)", f"{result['S']:.2f} m"),
+        ("전색장(T)", f"{result['T']:.2f} m"),
+        ("장약장(h)", f"{result['h']:.2f} m"),
+        ("천공장(H)", f"{result['H']:.2f} m"),
+        ("계단높이(K_step)", f"{result['K_step']:.2f} m"),
+        ("장약량/공(Q)", f"{result['Q']} kg"),
+        ("비장약량(c1)", f"{result['c1']} kg/m³"),
+        ("폭약경(pd)", f"{result['pd']} m"),
+    ]
+    setfont(11)
+    col_w = (PAGE_W - margin_l - margin_r) * 0.50  # 왼쪽 영역 폭
+    line_h = mm(7)
+    y0 = y
+    for lab, val in lines:
+        c.drawString(margin_l, y, f"{lab} : {val}")
+        y -= line_h
+
+    # 우측 패턴 이미지 (← 왼쪽 10mm 이동, ↑ 위쪽 10mm 이동)
+    x_img_base = margin_l + col_w + mm(8)
+    x_img = max(margin_l + mm(5), x_img_base - mm(10))  # 최소 여백 보호하며 왼쪽으로 10mm
+    img_area_w = PAGE_W - margin_r - x_img
+    img_area_h = y0 - margin_b
+    if img_area_w > 0 and img_area_h > 0:
+        try:
+            if img_path and os.path.isfile(img_path):
+                iw, ih = image_size(img_path, profile)
+                scale = min(img_area_w/iw, img_area_h/ih)
+                new_w, new_h = iw*scale, ih*scale
+
+                # top 기준을 y0에서 10mm 올림, 상단여백(30mm) 아래 2mm 버퍼 확보
+                y_top_target = min(y0 + mm(10), PAGE_H - margin_t - mm(2))
+                y_img = max(margin_b, y_top_target - new_h)  # bottom y
+                draw_image(c, img_path, x_img, y_img, new_w, new_h, profile)
+            else:
+                c.setStrokeColorRGB(0.8,0.8,0.8)
+                c.rect(x_img, margin_b, img_area_w, img_area_h, stroke=1, fill=0)
+                setfont(10)
+                c.drawString(x_img+mm(5), margin_b+img_area_h/2, "패턴 이미지 없음")
+        except Exception as e:
+            setfont(10)
+            c.drawString(x_img, margin_b+img_area_h/2, f"이미지 오류: {e}")
+
+    # 폰트 안내(옵션)
+    if notice and font_name is None:
+        c.setFillColorRGB(1,0,0)
+        setfont(9)
+        c.drawString(margin_l, margin_b/2,
+                     "참고: 시스템 한글 폰트를 찾지 못했습니다. 글자가 깨지면 malgun.ttf 또는 NanumGothic.ttf를 설치해 주세요.")
+
+    c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+# ================= PDF 캐시 =================
+def pdf_available():
+    """reportlab 설치 여부 (import 하지 않고 확인)"""
+    return importlib.util.find_spec("reportlab") is not None
+
+
+def content_key(result, img_path, *extra):
+    """결과 dict + 이미지 내용 (+ 추가 값)의 해시"""
+    payload = json.dumps([result, file_digest(img_path), extra], sort_keys=True,
+                         ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached_pdf(result, img_path):
+    """
+    make_pdf 결과를 내용 해시로 캐시 (세션 간 공유, 크기 제한).
+    출력날짜는 날짜 단위로 찍고 키에 포함 → 같은 날 같은 결과는 모든 세션이 한 PDF 를 공유
+    """
+    output_date = datetime.now().strftime("%Y-%m-%d")
+    key = content_key(result, img_path, "pdf", output_date,
+                      file_digest(derivative(img_path, "pdf")) if img_path else None)
+    return _pdf_store.get_or_create(key, lambda: make_pdf(result, img_path, output_date))
+
+
+def pdf_cache_stats():
+    return _pdf_store.stats()
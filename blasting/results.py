@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+대량 설계 결과 컨테이너 (열 단위 배열)
+- compute 결과 dict(11개 항목, 파이썬 객체) 대신 열마다 고정폭 배열 하나
+    실수 열 9개: float64 (dtype=np.float32 로 절반 크기, 값은 근사)
+    Pa: int8, _msg: int8 코드 (MESSAGES[code], 0 = None)
+  설계 1건 74 바이트 (float32 38 바이트) — compute 결과 dict 1건은 약 700 바이트
+- rs[i]: compute 결과 dict 처럼 쓰는 행 뷰 (복사 없음, dict 와 == 비교 가능)
+- rs[a:b]: 배열 뷰 (복사 없음), rs[mask] / rs[idx] / rs.sort("B"): 원본 열을 공유하고 행 번호만 보관
+- 내보내기: to_batch() (compute_batch 형식), to_numpy() (구조화 배열), to_arrow(), to_dicts()
+
+사용 예:
+    rs = ResultSet.from_batch(compute_batch(Q1=q1_arr, C=0.3))
+    big = rs[(rs["Pa"] == 4) & (rs["B"] > 1.5)].sort("c1")
+    big[0]                       # {'B': ..., 'S': ..., ...}
+    big.to_arrow()
+"""
+from collections.abc import Mapping
+
+import numpy as np
+
+from .core import PD_FORCED_MSG
+
+FLOAT_COLUMNS = ("B", "S", "T", "h", "H", "Q", "c1", "K_step", "pd")
+COLUMNS = ("B", "S", "T", "h", "H", "Q", "c1", "K_step", "Pa", "pd", "_msg")
+MESSAGES = (None, PD_FORCED_MSG)          # _msg 코드표 (새 안내 문구는 끝에 추가)
+_MSG_CODE = {m: i for i, m in enumerate(MESSAGES)}
+
+
+def encode_messages(msgs):
+    """안내 문구 배열/목록 → int8 코드 (코드표에 없는 문구는 ValueError)"""
+    try:
+        return np.fromiter((_MSG_CODE[m] for m in msgs), dtype=np.int8)
+    except KeyError as e:
+        raise ValueError(f"코드표(MESSAGES)에 없는 안내 문구: {e.args[0]!r}")
+
+
+class ResultRow(Mapping):
+    """ResultSet 의 한 행 (compute 결과 dict 와 같은 키/값, 읽기 전용)"""
+    __slots__ = ("_cols", "_i")
+
+    def __init__(self, cols, i):
+        self._cols = cols
+        self._i = i
+
+    def __getitem__(self, key):
+        v = self._cols[key][self._i]
+        if key == "_msg":
+            return MESSAGES[v]
+        return int(v) if key == "Pa" else float(v)
+
+    def __iter__(self):
+        return iter(COLUMNS)
+
+    def __len__(self):
+        return len(COLUMNS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ResultSet:
+    def __init__(self, columns, index=None):
+        """columns: COLUMNS 의 배열 (같은 길이, _msg 는 int8 코드). index: 보이는 행 번호 (None = 전체)"""
+        self._cols = columns
+        self._index = index
+
+    # ---------- 생성 ----------
+    @classmethod
+    def from_batch(cls, out, dtype=np.float64):
+        """compute_batch 결과 dict (또는 DataFrame) → ResultSet"""
+        cols = {k: np.ascontiguousarray(out[k], dtype=dtype) for k in FLOAT_COLUMNS}
+        cols["Pa"] = np.asarray(out["Pa"]).astype(np.int8)
+        cols["_msg"] = encode_messages(out["_msg"])
+        return cls(cols)
+
+    @classmethod
+    def from_dicts(cls, rows, dtype=np.float64):
+        """compute 결과 dict 목록 → ResultSet"""
+        rows = list(rows)
+        cols = {k: np.fromiter((r[k] for r in rows), dtype=dtype, count=len(rows)) for k in FLOAT_COLUMNS}
+        cols["Pa"] = np.fromiter((r["Pa"] for r in rows), dtype=np.int8, count=len(rows))
+        cols["_msg"] = encode_messages(r["_msg"] for r in rows)
+        return cls(cols)
+
+    @classmethod
+    def concat(cls, sets):
+        sets = list(sets)
+        return cls({k: np.concatenate([s[k] for s in sets]) for k in COLUMNS})
+
+    # ---------- 조회 ----------
+    def __len__(self):
+        return len(self._cols["Pa"]) if self._index is None else len(self._index)
+
+    def _column(self, key):
+        col = self._cols[key]
+        return col if self._index is None else col[self._index]
+
+    def __getitem__(self, key):
+        """
+        "B" 등 열 이름 → 배열 (_msg 는 int8 코드, 문자열은 messages()),
+        정수 → 행 뷰, 슬라이스/불리언 마스크/정수 배열 → ResultSet
+        """
+        if isinstance(key, str):
+            return self._column(key)
+        if isinstance(key, (int, np.integer)):
+            n = len(self)
+            if not -n <= key < n:
+                raise IndexError(key)
+            i = key % n
+            return ResultRow(self._cols, i if self._index is None else self._index[i])
+        if isinstance(key, slice) and self._index is None:
+            return ResultSet({k: v[key] for k, v in self._cols.items()})
+        base = np.arange(len(self)) if self._index is None else self._index
+        return ResultSet(self._cols, base[key])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def messages(self):
+        """_msg 열 (문자열 또는 None, object 배열)"""
+        return np.array(MESSAGES, dtype=object)[self._column("_msg")]
+
+    def sort(self, by, descending=False):
+        """by 열 기준 정렬한 ResultSet (열은 공유, 안정 정렬)"""
+        order = np.argsort(self._column(by), kind="stable")
+        if descending:
+            order = order[::-1]
+        base = np.arange(len(self)) if self._index is None else self._index
+        return ResultSet(self._cols, base[order])
+
+    def compact(self):
+        """보이는 행만 새 배열로 복사 (원본 열과의 공유를 끊음)"""
+        return ResultSet({k: np.ascontiguousarray(self._column(k)) for k in COLUMNS})
+
+    def astype(self, dtype):
+        """실수 열을 dtype (np.float32 / np.float64) 으로 바꾼 ResultSet"""
+        cols = {k: self._column(k).astype(dtype) if k in FLOAT_COLUMNS else self._column(k) for k in COLUMNS}
+        return ResultSet(cols)
+
+    @property
+    def nbytes(self):
+        """열 배열이 차지하는 바이트 (행 번호 포함)"""
+        return sum(v.nbytes for v in self._cols.values()) + (0 if self._index is None else self._index.nbytes)
+
+    # ---------- 내보내기 ----------
+    def to_batch(self):
+        """compute_batch 와 같은 형식 (실수 float64, Pa int64, _msg object)"""
+        out = {k: self._column(k).astype(np.float64) for k in FLOAT_COLUMNS}
+        out["Pa"] = self._column("Pa").astype(np.int64)
+        out["_msg"] = self.messages()
+        return {k: out[k] for k in COLUMNS}
+
+    def to_numpy(self):
+        """구조화 배열 (_msg 는 int8 코드, 열 이름 "_msg")"""
+        arr = np.empty(len(self), dtype=[(k, self._cols[k].dtype) for k in COLUMNS])
+        for k in COLUMNS:
+            arr[k] = self._column(k)
+        return arr
+
+    def to_arrow(self):
+        """pyarrow Table (_msg 는 dictionary 형식 문자열 열, 안내 문구 없음 = null)"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise RuntimeError("Arrow 변환을 위해 pyarrow가 필요합니다.\n  pip install pyarrow")
+        code = self._column("_msg")
+        msg = pa.array(np.array(MESSAGES, dtype=object)[code], mask=code == 0,
+                       type=pa.dictionary(pa.int8(), pa.string()))
+        return pa.table({k: msg if k == "_msg" else pa.array(self._column(k)) for k in COLUMNS})
+
+    def to_dicts(self):
+        """compute 결과와 같은 dict 목록"""
+        return [dict(r) for r in self]
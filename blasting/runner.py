@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+현장 일괄 설계 (CSV → 프로세스 풀 → CSV)
+- 입력 CSV: 한 행 = 한 공 그룹. 열 이름은 Streamlit 입력폼과 같음
+    Q1, K, n, Vel, D, C, V, pd, pd_text, k1
+    (빈 값 = 미입력, pd 는 "자동"/빈 값/0.032/0.050/0.065 등, pd_text 는 직접입력(ANFO),
+     k1 은 숫자 또는 목적 라벨 "비산제어(0.7)" 등)
+- 행을 chunk 로 묶어 프로세스 풀에 분배, 각 행은 core.compute 로 계산
+- 결과는 입력 순서대로 기록. 행 단위 오류(ValueError 등)는 error 열에 남기고 계속 진행
+  (명령행 종료 코드: 오류 행이 하나라도 있으면 1)
+- 동시에 처리 중인 chunk 수를 제한하여 파일 크기와 무관하게 메모리 일정
+
+사용 예:
+    python -m blasting.runner 현장목록.csv -o 설계결과.csv -j 32
+"""
+import os
+import io
+import sys
+import csv
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import PURPOSE_K1, compute
+
+INPUT_COLUMNS = ("Q1", "K", "n", "Vel", "D", "C", "V", "pd", "pd_text", "k1")
+RESULT_COLUMNS = ("B", "S", "T", "h", "H", "Q", "c1", "K_step", "Pa", "pd_used", "msg", "error")
+DEFAULT_CHUNK = 2000
+
+
+def _opt(row, key):
+    s = (row.get(key) or "").strip()
+    return float(s) if s else None
+
+
+def _k1(raw):
+    raw = (raw or "").strip()
+    if not raw:
+        return 0.7
+    if raw in PURPOSE_K1:
+        return PURPOSE_K1[raw]
+    return float(raw)
+
+
+def run_row(row):
+    """입력 행(dict, 문자열 값) → RESULT_COLUMNS 순서의 값 목록. 오류는 error 열로"""
+    try:
+        C, V = _opt(row, "C"), _opt(row, "V")
+        pd_sel = (row.get("pd") or "").strip()
+        res = compute(K=_opt(row, "K"), n=_opt(row, "n"), Vel=_opt(row, "Vel"), D=_opt(row, "D"),
+                      Q1=_opt(row, "Q1"),
+                      C=0.33 if C is None else C, V=1.2 if V is None else V,
+                      pd_choice=None if pd_sel in ("", "자동", "auto") else pd_sel,
+                      pd_text=(row.get("pd_text") or "").strip() or None,
+                      k1=_k1(row.get("k1")))
+    except Exception as e:
+        return [""] * (len(RESULT_COLUMNS) - 1) + [f"{type(e).__name__}: {e}"]
+    return [res["B"], res["S"], res["T"], res["h"], res["H"], res["Q"], res["c1"],
+            res["K_step"], res["Pa"], res["pd"], res["_msg"] or "", ""]
+
+
+def run_chunk(header, text):
+    """
+    작업 프로세스: 원본 CSV 텍스트 chunk → (결과 CSV 텍스트, 행 수, 오류 행 수).
+    파싱/계산/문자열 변환을 모두 작업자에서 하여 주 프로세스는 읽기/쓰기만 담당
+    """
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    rows = errors = 0
+    for raw in csv.reader(io.StringIO(text)):
+        if not raw:
+            continue
+        res = run_row(dict(zip(header, raw)))
+        rows += 1
+        errors += bool(res[-1])
+        w.writerow(raw + res)
+    return buf.getvalue(), rows, errors
+
+
+def _chunks(f, size):
+    """파일에서 size 줄씩 잘라 텍스트로 반환. 따옴표 안의 줄바꿈에서는 자르지 않음"""
+    lines, quotes = [], 0
+    for line in f:
+        lines.append(line)
+        quotes += line.count('"')
+        if len(lines) >= size and quotes % 2 == 0:
+            yield "".join(lines)
+            lines, quotes = [], 0
+    if lines:
+        yield "".join(lines)
+
+
+def run_chunks(header, chunks, jobs=None):
+    """
+    chunk 들을 프로세스 풀에서 계산하여 run_chunk 결과를 입력 순서대로 yield.
+    jobs=1 이면 현재 프로세스에서 계산
+    """
+    if jobs == 1:
+        for chunk in chunks:
+            yield run_chunk(header, chunk)
+        return
+
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(ex.submit(run_chunk, header, chunk))
+            # 처리 중인 chunk 를 작업자 수의 2배로 제한 (메모리 일정, 순서 유지)
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_csv(src, dst, jobs=None, chunk_size=DEFAULT_CHUNK):
+    """입력 CSV → 결과 CSV. 반환: (전체 행 수, 오류 행 수)"""
+    total = errors = 0
+    with open(src, newline="", encoding="utf-8-sig") as fi, \
+         open(dst, "w", newline="", encoding="utf-8-sig") as fo:
+        header = next(csv.reader(fi), [])
+        csv.writer(fo).writerow(header + list(RESULT_COLUMNS))
+        for text, n_rows, n_err in run_chunks(header, _chunks(fi, chunk_size), jobs=jobs):
+            fo.write(text)
+            total += n_rows
+            errors += n_err
+    return total, errors
+
+
+def read_results(path):
+    """결과 CSV → (행 dict, compute 형식 결과 dict 또는 오류 행이면 None) 를 순서대로 yield"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            if row.get("error"):
+                yield row, None
+                continue
+            res = {k: float(row[k]) for k in ("B", "S", "T", "h", "H", "Q", "c1", "K_step")}
+            res.update(Pa=int(row["Pa"]), pd=float(row["pd_used"]), _msg=row.get("msg") or None)
+            yield row, res
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m blasting.runner",
+                                 description="현장 CSV 일괄 발파설계")
+    ap.add_argument("input", help=f"입력 CSV (열: {', '.join(INPUT_COLUMNS)})")
+    ap.add_argument("-o", "--output", required=True, help="결과 CSV")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    ap.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    args = ap.parse_args(argv)
+
+    total, errors = run_csv(args.input, args.output, jobs=args.jobs, chunk_size=args.chunk_size)
+    print(f"완료: {total:,}행 (오류 {errors:,}행) → {args.output}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+시험발파 추정식 회귀 (계측 기록 → K, n)
+- 추정식: PPV = K * SD^n, SD = D / sqrt(W)  (자승근 환산거리, compute 의 Q2 식과 같은 형태)
+    PPV: 최대진동속도 (cm/s = kine), D: 이격거리 (m), W: 지발당 장약량 (kg)
+- log10 공간 최소제곱: log10(PPV) = log10(K) + n * log10(SD)
+- 기록은 chunk 단위로 누적 (건수, 평균, 편차 제곱합 — Chan 병합) → 전체 기록을 메모리에 올리지 않음
+  (여러 파일/프로세스의 누적값은 merge 로 합침)
+- 결과 SiteLaw: 50% (회귀선) / 95% 등 신뢰수준 추정식의 K, 신뢰구간/예측구간
+    law.compute_args(0.95) → {"K": ..., "n": ...}  → compute(**law.compute_args(0.95), Vel=0.3, D=30)
+
+사용 예:
+    python -m blasting.sitelaw 계측2023.csv 계측2024.csv --levels 50,95
+"""
+import sys
+import csv
+import math
+import argparse
+from statistics import NormalDist
+
+import numpy as np
+
+# 입력 CSV 기본 열 이름
+PPV_COLUMN, DISTANCE_COLUMN, CHARGE_COLUMN = "PPV", "D", "W"
+DEFAULT_CHUNK = 200_000
+LEVELS = (0.50, 0.95)
+
+
+def scaled_distance(D, W):
+    """자승근 환산거리 D / sqrt(W)"""
+    return np.asarray(D, dtype=float) / np.sqrt(np.asarray(W, dtype=float))
+
+
+def t_ppf(p, dof):
+    """t 분포 분위수 (Cornish-Fisher 전개, 자유도 3 이상에서 소수 셋째 자리까지)"""
+    z = NormalDist().inv_cdf(p)
+    if dof > 1e6:
+        return z
+    g1 = (z**3 + z) / 4
+    g2 = (5*z**5 + 16*z**3 + 3*z) / 96
+    g3 = (3*z**7 + 19*z**5 + 17*z**3 - 15*z) / 384
+    g4 = (79*z**9 + 776*z**7 + 1482*z**5 - 1920*z**3 - 945*z) / 92160
+    return z + g1/dof + g2/dof**2 + g3/dof**3 + g4/dof**4
+
+
+class SiteLawAccumulator:
+    """(log10 SD, log10 PPV) 의 건수/평균/편차 제곱합 누적. add 는 chunk 배열, merge 는 다른 누적값"""
+
+    def __init__(self):
+        self.count = 0
+        self.mx = self.my = 0.0           # 평균
+        self.sxx = self.sxy = self.syy = 0.0   # 편차 제곱합 / 곱합
+        self.sd_min, self.sd_max = math.inf, -math.inf
+        self.skipped = 0                  # 빈 값, 0 이하 값 행
+
+    def add(self, ppv, D, W):
+        ppv, D, W = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (ppv, D, W)))
+        with np.errstate(invalid="ignore"):
+            ok = (ppv > 0) & (D > 0) & (W > 0) & np.isfinite(ppv) & np.isfinite(D) & np.isfinite(W)
+        self.skipped += int(ok.size - ok.sum())
+        if not ok.any():
+            return self
+        sd = scaled_distance(D[ok], W[ok])
+        x, y = np.log10(sd), np.log10(ppv[ok])
+        mx, my = x.mean(), y.mean()
+        dx, dy = x - mx, y - my
+        self._merge(x.size, mx, my, dx @ dx, dx @ dy, dy @ dy)
+        self.sd_min, self.sd_max = min(self.sd_min, sd.min()), max(self.sd_max, sd.max())
+        return self
+
+    def merge(self, other):
+        self._merge(other.count, other.mx, other.my, other.sxx, other.sxy, other.syy)
+        self.sd_min, self.sd_max = min(self.sd_min, other.sd_min), max(self.sd_max, other.sd_max)
+        self.skipped += other.skipped
+        return self
+
+    def _merge(self, n, mx, my, sxx, sxy, syy):
+        if not n:
+            return
+        total = self.count + n
+        ex, ey = mx - self.mx, my - self.my
+        w = self.count * n / total
+        self.sxx += float(sxx) + ex * ex * w
+        self.sxy += float(sxy) + ex * ey * w
+        self.syy += float(syy) + ey * ey * w
+        self.mx += ex * n / total
+        self.my += ey * n / total
+        self.count = total
+
+    def fit(self):
+        """누적값 → SiteLaw (유효 기록 3건 이상, 환산거리가 모두 같으면 ValueError)"""
+        if self.count < 3:
+            raise ValueError(f"유효한 계측 기록이 부족합니다 ({self.count}건, 3건 이상 필요).")
+        if self.sxx <= 0:
+            raise ValueError("환산거리가 모두 같아 추정식을 구할 수 없습니다.")
+        n = self.sxy / self.sxx
+        resid = max(self.syy - n * self.sxy, 0.0)
+        return SiteLaw(self.my - n * self.mx, n, math.sqrt(resid / (self.count - 2)), self.count,
+                       self.mx, self.sxx, 1 - resid / self.syy if self.syy else 1.0,
+                       (self.sd_min, self.sd_max), self.skipped)
+
+
+class SiteLaw:
+    """PPV = K * SD^n 회귀 결과 (log10 공간 절편 a, 기울기 n, 잔차 표준편차 s)"""
+
+    def __init__(self, a, n, s, count, mean_x, sxx, r2, sd_range, skipped=0):
+        self.a, self.n, self.s = a, n, s
+        self.count, self.mean_x, self.sxx = count, mean_x, sxx
+        self.r2, self.sd_range, self.skipped = r2, sd_range, skipped
+
+    @property
+    def K(self):
+        """50% (회귀선) K"""
+        return 10 ** self.a
+
+    def ppv(self, sd):
+        """회귀선(50%) 진동속도"""
+        return self.K * np.asarray(sd, dtype=float) ** self.n
+
+    def bounds(self, sd, level=0.95, kind="prediction"):
+        """
+        환산거리 sd 에서 양측 level 구간 (하한, 상한) 진동속도.
+        kind: "confidence" = 회귀선의 신뢰구간, "prediction" = 새 기록 1건의 예측구간
+        """
+        if kind not in ("confidence", "prediction"):
+            raise ValueError(f"kind 는 confidence/prediction: {kind!r}")
+        x = np.log10(np.asarray(sd, dtype=float))
+        se = self.s * np.sqrt((kind == "prediction") + 1 / self.count + (x - self.mean_x) ** 2 / self.sxx)
+        half = t_ppf(0.5 + level / 2, self.count - 2) * se
+        y = self.a + self.n * x
+        return 10 ** (y - half), 10 ** (y + half)
+
+    def K_at(self, level=0.95):
+        """
+        level 신뢰수준 추정식의 K (기울기 n 은 그대로, 단측 예측 상한을 평균 환산거리에서 평행 이동).
+        level 0.5 는 회귀선 K
+        """
+        return 10 ** (self.a + t_ppf(level, self.count - 2) * self.s * math.sqrt(1 + 1 / self.count))
+
+    def compute_args(self, level=0.95):
+        """compute 의 K, n 인자"""
+        return {"K": self.K_at(level), "n": self.n}
+
+    def summary(self, levels=LEVELS):
+        rows = [f"기록 {self.count:,}건 (제외 {self.skipped:,}건), 환산거리 {self.sd_range[0]:.1f} ~ {self.sd_range[1]:.1f}",
+                f"R² {self.r2:.3f}, 잔차 표준편차(log10) {self.s:.4f}"]
+        for lv in levels:
+            rows.append(f"{lv * 100:g}% 추정식: PPV = {self.K_at(lv):.1f} * SD^({self.n:.3f})")
+        return "\n".join(rows)
+
+    def __repr__(self):
+        return f"SiteLaw(K={self.K:.2f}, n={self.n:.4f}, s={self.s:.4f}, count={self.count})"
+
+
+# ================= CSV =================
+def _float(s):
+    try:
+        return float(s)
+    except ValueError:
+        return math.nan
+
+
+def read_records(path, chunk_size=DEFAULT_CHUNK, columns=(PPV_COLUMN, DISTANCE_COLUMN, CHARGE_COLUMN)):
+    """CSV → (ppv, D, W) 배열 chunk 를 yield (빈 값/숫자 아닌 값은 NaN)"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = [h.strip() for h in next(reader, [])]
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise ValueError(f"{path}: 열 {', '.join(missing)} 이(가) 없습니다 (열: {', '.join(header)})")
+        idx = [header.index(c) for c in columns]
+        buf = []
+        for row in reader:
+            if len(row) > max(idx):
+                buf.append([_float(row[i]) for i in idx])
+            if len(buf) >= chunk_size:
+                yield tuple(np.asarray(buf, dtype=float).T)
+                buf = []
+        if buf:
+            yield tuple(np.asarray(buf, dtype=float).T)
+
+
+def fit_csv(paths, chunk_size=DEFAULT_CHUNK, columns=(PPV_COLUMN, DISTANCE_COLUMN, CHARGE_COLUMN)):
+    """계측 CSV 파일들 → SiteLaw (chunk 단위 누적)"""
+    acc = SiteLawAccumulator()
+    for path in ([paths] if isinstance(paths, str) else paths):
+        for ppv, D, W in read_records(path, chunk_size, columns):
+            acc.add(ppv, D, W)
+    return acc.fit()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m blasting.sitelaw",
+                                 description="계측 기록으로 시험발파 추정식(K, n) 회귀")
+    ap.add_argument("input", nargs="+", help="계측 CSV (열: PPV cm/s, D m, W kg/지발)")
+    ap.add_argument("--levels", default="50,95", help="신뢰수준 %% 목록 (기본 50,95)")
+    ap.add_argument("--columns", default=",".join((PPV_COLUMN, DISTANCE_COLUMN, CHARGE_COLUMN)),
+                    help="PPV, 거리, 장약량 열 이름 (쉼표 구분)")
+    ap.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    args = ap.parse_args(argv)
+
+    columns = tuple(c.strip() for c in args.columns.split(","))
+    if len(columns) != 3:
+        ap.error("--columns 는 PPV, 거리, 장약량 열 이름 3개")
+    try:
+        law = fit_csv(args.input, args.chunk_size, columns)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    print(law.summary(tuple(float(v) / 100 for v in args.levels.split(","))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
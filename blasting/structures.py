@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+보호 대상 다수에 대한 허용 장약량 (Q2)
+- 보호 대상(주택, 관로, 학교 등)마다 좌표 (x, y m) 와 허용 진동속도 Vel (cm/s)
+- 발파 위치에서 Q2_i = D_i² (Vel_i/K)^(2/(-n)) 의 최소값이 지배 (그 대상 = 지배 대상)
+    Q2_i 순서 = w_i * D_i 순서 (w_i = Vel_i^(-1/n)) → 가중 최근접 대상 찾기
+- 공간 색인: 발파 영역을 격자로 나누고 칸마다 지배할 수 있는 대상만 후보로 미리 골라 둠
+    (칸에서 가장 가까울 때의 w*D 가 다른 대상의 가장 멀 때 w*D 보다 크면 제외,
+     격자를 2배씩 나누며 부모 칸 후보 안에서만 고름)
+  조회 = 칸 번호 → 후보 몇 개만 배열 연산. 격자 밖 발파 위치만 전체 대상과 비교
+- 색인은 n 마다 한 번 생성 (가중치가 n 에 의존)
+- Q2 는 지배 대상의 (Vel, D) 로 core.max_charge 와 같은 식/반올림 → compute(K, n, Vel, D) 와 동일
+
+사용 예:
+    st = Structures.from_csv("보호대상.csv")               # 열: name, x, y, Vel
+    g = st.governing(bx_arr, by_arr, K=200, n=-1.6)       # 발파 위치 배열 → Q2, 지배 대상
+    res, gov = st.design(120.0, 80.0, K=200, n=-1.6)      # 발파 1곳 설계 + 지배 대상
+"""
+import csv
+from collections import namedtuple
+
+import numpy as np
+
+from .core import compute, max_charge
+from .batch import compute_batch, max_charge_batch
+
+# index: 지배 대상 번호, D: 거리 (m), Vel: 그 대상의 허용 진동속도, Q2: 허용 장약량 (kg/지발)
+Governing = namedtuple("Governing", "index D Vel Q2")
+
+CELL_TARGET = 1.0          # 칸 수 ≈ 대상 수 x CELL_TARGET (한 변 칸 수는 2의 거듭제곱으로 올림)
+MARGIN = 0.5               # 기본 격자 범위: 대상 범위를 양쪽으로 (폭 x MARGIN) 만큼 넓힘
+_BLOCK = 1024              # 색인 생성/격자 밖 조회 때 한 번에 비교할 칸/위치 수
+
+
+class Structures:
+    def __init__(self, x, y, Vel, names=None, bounds=None):
+        """
+        x, y: 좌표 (m), Vel: 허용 진동속도 (cm/s, 양수), names: 이름 목록.
+        bounds: 색인 격자 범위 (xmin, ymin, xmax, ymax) — 발파 위치가 주로 있는 영역 (기본: 대상 범위 + MARGIN)
+        """
+        self.xy = np.column_stack([np.asarray(x, dtype=float), np.asarray(y, dtype=float)])
+        self.Vel = np.asarray(Vel, dtype=float)
+        if not len(self.Vel):
+            raise ValueError("보호 대상이 없습니다.")
+        if self.Vel.shape != (len(self.xy),) or not (self.Vel > 0).all():
+            raise ValueError("보호 대상마다 양수 Vel 이 필요합니다.")
+        self.names = list(names) if names is not None else [str(i) for i in range(len(self.Vel))]
+        if bounds is None:
+            lo, hi = self.xy.min(axis=0), self.xy.max(axis=0)
+            pad = max((hi - lo).max(), 1.0) * MARGIN
+            bounds = (lo[0] - pad, lo[1] - pad, hi[0] + pad, hi[1] + pad)
+        self.bounds = tuple(float(v) for v in bounds)
+        self._indexes = {}       # n → (격자 칸 수, 칸 크기, 후보 표, 가중치)
+
+    @classmethod
+    def from_csv(cls, path, bounds=None):
+        """CSV (열: name, x, y, Vel) → Structures"""
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+        try:
+            return cls([float(r["x"]) for r in rows], [float(r["y"]) for r in rows],
+                       [float(r["Vel"]) for r in rows], [(r.get("name") or "").strip() for r in rows], bounds)
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"{path}: 보호 대상 CSV 는 name, x, y, Vel 열이 필요합니다 ({e})") from None
+
+    def __len__(self):
+        return len(self.Vel)
+
+    # ---------- 색인 ----------
+    def _weights(self, n):
+        if not n < 0:
+            raise ValueError(f"n 은 음수여야 합니다: {n}")
+        return self.Vel ** (-1.0 / n)
+
+    def _index(self, n):
+        idx = self._indexes.get(n)
+        if idx is None:
+            idx = self._indexes[n] = self._build(self._weights(n))
+        return idx
+
+    def _build(self, w):
+        """격자를 2배씩 나누며 후보를 좁힘 (자식 칸 후보 ⊆ 부모 칸 후보) → 칸 x 전체 대상 비교 없음"""
+        xmin, ymin, xmax, ymax = self.bounds
+        side = max(xmax - xmin, ymax - ymin, 1e-9)
+        target = max(1, int(np.sqrt(len(w) * CELL_TARGET)))
+        table = np.arange(len(w), dtype=np.int32)[None, :]
+        g = 1
+        while g < target:
+            g *= 2
+            cell = side / g
+            # 부모 칸 (g/2 격자) 후보를 자식 4칸에 물려줌. 칸 번호 = iy * g + ix
+            c = np.arange(g * g)
+            parent = table[(c // g // 2) * (g // 2) + (c % g) // 2]
+            rows = []
+            for s in range(0, g * g, _BLOCK):
+                rows.append(self._prune(parent[s:s + _BLOCK], c[s:s + _BLOCK], g, cell, w))
+            width = max(int((r >= 0).sum(axis=1).max()) for r in rows)
+            table = np.concatenate([r[:, :width] for r in rows])
+        return g, side / g, table, w
+
+    def _prune(self, cand, c, g, cell, w):
+        """칸 c 들의 후보 cand (-1 = 빈 자리) 중 지배할 수 없는 대상을 빼고 앞으로 모음"""
+        valid = cand >= 0
+        i = np.where(valid, cand, 0)
+        px, py, wi = self.xy[i, 0], self.xy[i, 1], w[i]
+        x0 = self.bounds[0] + (c % g)[:, None] * cell
+        y0 = self.bounds[1] + (c // g)[:, None] * cell
+        # 칸(사각형)까지 최소/최대 거리
+        dx_in = np.maximum(np.maximum(x0 - px, px - (x0 + cell)), 0)
+        dy_in = np.maximum(np.maximum(y0 - py, py - (y0 + cell)), 0)
+        dx_out = np.maximum(np.abs(px - x0), np.abs(px - (x0 + cell)))
+        dy_out = np.maximum(np.abs(py - y0), np.abs(py - (y0 + cell)))
+        lo = wi * np.hypot(dx_in, dy_in)
+        hi = np.where(valid, wi * np.hypot(dx_out, dy_out), np.inf).min(axis=1, keepdims=True)
+        keep = valid & (lo <= hi * (1 + 1e-9))
+        order = np.argsort(~keep, axis=1, kind="stable")
+        return np.where(np.take_along_axis(keep, order, axis=1), np.take_along_axis(cand, order, axis=1), -1)
+
+    def candidates(self, n):
+        """격자 칸 수, 칸별 평균/최대 후보 수 (색인 확인용)"""
+        g, _, table, _ = self._index(n)
+        count = (table >= 0).sum(axis=1)
+        return {"cells": g * g, "mean": float(count.mean()), "max": int(count.max())}
+
+    # ---------- 조회 ----------
+    def nearest(self, bx, by, n):
+        """발파 위치 배열 → (지배 대상 번호, 거리) 배열. 가중 거리 w*D 가 가장 작은 대상"""
+        bx, by = np.broadcast_arrays(np.asarray(bx, dtype=float), np.asarray(by, dtype=float))
+        shape = bx.shape
+        bx, by = bx.ravel(), by.ravel()
+        g, cell, table, w = self._index(n)
+        xmin, ymin = self.bounds[:2]
+        ix = np.floor((bx - xmin) / cell).astype(np.int64)
+        iy = np.floor((by - ymin) / cell).astype(np.int64)
+        inside = (ix >= 0) & (ix < g) & (iy >= 0) & (iy < g)
+        out_i = np.empty(bx.size, dtype=np.int64)
+        out_d = np.empty(bx.size)
+
+        q = np.flatnonzero(inside)
+        if q.size:
+            cand = table[iy[q] * g + ix[q]]
+            valid = cand >= 0
+            c = np.where(valid, cand, 0)
+            d = np.hypot(self.xy[c, 0] - bx[q, None], self.xy[c, 1] - by[q, None])
+            j = np.argmin(np.where(valid, w[c] * d, np.inf), axis=1)
+            rows = np.arange(q.size)
+            out_i[q], out_d[q] = c[rows, j], d[rows, j]
+
+        # 격자 밖: 전체 대상과 비교
+        q = np.flatnonzero(~inside)
+        for s in range(0, q.size, _BLOCK):
+            b = q[s:s + _BLOCK]
+            d = np.hypot(self.xy[:, 0] - bx[b, None], self.xy[:, 1] - by[b, None])
+            j = np.argmin(w * d, axis=1)
+            out_i[b], out_d[b] = j, d[np.arange(b.size), j]
+        return out_i.reshape(shape), out_d.reshape(shape)
+
+    def governing(self, bx, by, K, n):
+        """발파 위치 배열 → Governing 배열 (Q2 는 max_charge 와 같은 값, 대상 위치와 같으면 0)"""
+        i, D = self.nearest(bx, by, n)
+        Vel = self.Vel[i]
+        Q2 = np.where(D > 0, max_charge_batch(K, n, Vel, D), 0.0)
+        return Governing(i, D, Vel, Q2)
+
+    def design(self, bx, by, K, n, **kwargs):
+        """
+        발파 1곳 설계: 지배 대상의 (Vel, D) 로 compute. 반환: (compute 결과 dict, 지배 대상 dict)
+        kwargs 는 compute 의 나머지 인자 (Q1, C, V, pd_choice, ...)
+        """
+        i, D = self.nearest(bx, by, n)
+        i, D = int(i), float(D)
+        if D <= 0:
+            raise ValueError(f"발파 위치가 보호 대상 '{self.names[i]}' 위치와 같습니다.")
+        Vel = float(self.Vel[i])
+        res = compute(K=K, n=n, Vel=Vel, D=D, **kwargs)
+        return res, {"index": i, "name": self.names[i], "D": D, "Vel": Vel, "Q2": max_charge(K, n, Vel, D)}
+
+    def design_batch(self, bx, by, K, n, **kwargs):
+        """
+        발파 위치 배열 설계: compute_batch 결과 dict + structure (지배 대상 번호), D, Vel, Q2.
+        kwargs 는 compute_batch 의 나머지 인자. 대상 위치와 같은 발파 위치는 ValueError
+        """
+        g = self.governing(bx, by, K, n)
+        if (g.D <= 0).any():
+            i = int(np.flatnonzero(np.ravel(g.D <= 0))[0])
+            raise ValueError(f"{i}번째 발파 위치가 보호 대상 위치와 같습니다.")
+        out = compute_batch(K=K, n=n, Vel=g.Vel, D=g.D, **kwargs)
+        out.update(structure=g.index, D=g.D, Vel=g.Vel, Q2=g.Q2)
+        return out
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+설계표(파라미터 스윕) 생성
+- 입력별 값 목록/범위의 카르테시안 곱을 chunk 단위로 계산하여 generator 로 반환
+- 결과는 CSV 또는 Parquet 로 chunk 마다 바로 기록 → 점 개수와 무관하게 메모리 일정
+- 계산은 compute_batch (compute 와 행 단위 동일)
+
+사용 예:
+    python -m blasting.sweep --D 10:300:10 --Vel 0.2,0.3,0.5 --C 0.25:0.5:0.05 \\
+        --V 1.0:1.25:0.05 --pd auto,0.032,0.050,0.065 -o 설계표.csv
+"""
+import os
+import sys
+import csv
+import math
+import argparse
+
+import numpy as np
+
+from .batch import OUTPUT_COLUMNS, compute_batch
+
+SWEEP_INPUTS = ("K", "n", "Vel", "D", "Q1", "C", "V", "pd", "k1")
+# Streamlit 입력폼 기본값 (Q1, pd 는 미입력 = 자동)
+DEFAULTS = {"K": 200.0, "n": -1.60, "Vel": 0.30, "D": None, "Q1": None,
+            "C": 0.33, "V": 1.2, "pd": None, "k1": 0.7}
+DEFAULT_CHUNK = 100_000
+
+
+def parse_values(spec):
+    """
+    "a:b:step" → a 부터 b 까지(포함) step 간격, "x,y,z" → 목록.
+    "auto"/"none"/빈 값은 미입력(NaN)
+    """
+    out = []
+    for part in str(spec).split(","):
+        part = part.strip()
+        if part.lower() in ("", "auto", "none", "자동"):
+            out.append(np.nan)
+        elif ":" in part:
+            a, b, step = (float(x) for x in part.split(":"))
+            if step <= 0:
+                raise ValueError(f"범위 간격은 양수여야 합니다: {part}")
+            count = int(math.floor((b - a) / step + 1e-9)) + 1
+            out.extend(np.round(a + step * np.arange(count), 10))
+        else:
+            out.append(float(part))
+    return np.asarray(out, dtype=float)
+
+
+def _axis(v):
+    return np.atleast_1d(np.asarray(np.nan if v is None else v, dtype=float))
+
+
+def grid_size(**ranges):
+    size = 1
+    for name in SWEEP_INPUTS:
+        size *= _axis(ranges.get(name, DEFAULTS[name])).size
+    return size
+
+
+def sweep(chunk_size=DEFAULT_CHUNK, pd_custom=False, V1_theory=1.2, **ranges):
+    """
+    ranges: 입력 이름(SWEEP_INPUTS) → 값 목록/배열/스칼라. 없는 입력은 DEFAULTS.
+    카르테시안 곱을 chunk_size 행씩 계산하여 {열 이름: 배열} 을 yield.
+    열: 입력(pd 입력값은 "pd_in") + OUTPUT_COLUMNS
+    """
+    unknown = set(ranges) - set(SWEEP_INPUTS)
+    if unknown:
+        raise ValueError(f"알 수 없는 입력: {', '.join(sorted(unknown))}")
+    axes = [_axis(ranges.get(name, DEFAULTS[name])) for name in SWEEP_INPUTS]
+    shape = tuple(a.size for a in axes)
+    total = int(np.prod(shape))
+
+    for start in range(0, total, chunk_size):
+        idx = np.unravel_index(np.arange(start, min(start + chunk_size, total)), shape)
+        cols = {name: axis[i] for name, axis, i in zip(SWEEP_INPUTS, axes, idx)}
+        res = compute_batch(K=cols["K"], n=cols["n"], Vel=cols["Vel"], D=cols["D"],
+                            Q1=cols["Q1"], C=cols["C"], V=cols["V"], pd=cols["pd"],
+                            pd_custom=pd_custom, k1=cols["k1"], V1_theory=V1_theory)
+        cols["pd_in"] = cols.pop("pd")
+        cols.update(res)
+        yield cols
+
+
+def columns():
+    return [c for c in SWEEP_INPUTS if c != "pd"] + ["pd_in"] + list(OUTPUT_COLUMNS)
+
+
+# ================= 출력 =================
+def write_csv(chunks, path):
+    """chunk 를 CSV 로 순차 기록. 반환: 기록한 행 수"""
+    names = columns()
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(names)
+        for chunk in chunks:
+            data = [np.where(np.isnan(chunk[k]), None, chunk[k]).tolist()
+                    if chunk[k].dtype.kind == "f" else chunk[k].tolist() for k in names]
+            w.writerows(zip(*data))
+            rows += len(data[0])
+    return rows
+
+
+def write_parquet(chunks, path):
+    """chunk 마다 Parquet row group 하나로 기록 (pyarrow 필요)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet 저장을 위해 pyarrow가 필요합니다.\n  pip install pyarrow")
+    names = columns()
+    writer, rows = None, 0
+    try:
+        for chunk in chunks:
+            table = pa.table({k: pa.array(chunk[k], type=pa.string() if k == "_msg" else None)
+                              for k in names})
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_table(chunks, path, fmt=None):
+    fmt = fmt or ("parquet" if os.path.splitext(path)[1].lower() in (".parquet", ".pq") else "csv")
+    return write_parquet(chunks, path) if fmt == "parquet" else write_csv(chunks, path)
+
+
+# ================= CLI =================
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m blasting.sweep",
+                                 description="발파설계 설계표(파라미터 스윕) 생성")
+    for name in SWEEP_INPUTS:
+        ap.add_argument(f"--{name}", metavar="값", help=f"{name} 값 (예: 0.1:1.0:0.1 또는 a,b,c; 기본 {DEFAULTS[name]})")
+    ap.add_argument("--pd-custom", action="store_true", help="pd 값을 직접입력(ANFO)으로 취급")
+    ap.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    ap.add_argument("--format", choices=["csv", "parquet"], help="미지정 시 확장자로 판단")
+    ap.add_argument("-o", "--output", required=True, help="출력 파일 (.csv / .parquet)")
+    args = ap.parse_args(argv)
+
+    ranges = {name: parse_values(getattr(args, name)) for name in SWEEP_INPUTS
+              if getattr(args, name) is not None}
+    total = grid_size(**ranges)
+    print(f"설계점 {total:,}개 계산 → {args.output}", file=sys.stderr)
+    chunks = sweep(chunk_size=args.chunk_size, pd_custom=args.pd_custom, **ranges)
+    try:
+        rows = write_table(chunks, args.output, args.format)
+    except (ValueError, RuntimeError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    print(f"완료: {rows:,}행", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
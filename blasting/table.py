@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Q3 격자 설계표 (현장 프로파일별 사전 계산)
+- compute 에서 Q2/Q3 이후 단계는 Q3(0.01 kg 반올림), pd, C, V, k1 에만 의존
+- 현장 프로파일(pd, C, V, k1)을 고정하고 Q3 = 0.00 ~ q3_max (0.01 kg 간격)의 결과를 미리 계산
+- 평가 = Q2 식 + 배열 인덱스 (분기 없음). 격자 밖 Q3 는 compute_batch 로 계산
+- .npz 파일로 저장/불러오기, verify() 로 compute 와 전 격자 일치 확인
+
+사용 예:
+    t = DesignTable.build(q3_max=100.0, pd=0.050, C=0.33, V=1.2, k1=0.7)
+    t.save("현장A.npz")
+    t = DesignTable.load("현장A.npz")
+    t.compute(K=200, n=-1.6, Vel=0.3, D=120)          # 단일 설계 (dict)
+    t.evaluate(K=200, n=-1.6, Vel=vel_arr, D=d_arr)   # 배열
+"""
+import json
+
+import numpy as np
+
+from .core import PD_FORCED_MSG, compute, design_charge, max_charge
+from .batch import compute_batch, design_charge_batch, max_charge_batch
+
+FLOAT_COLUMNS = ("B", "S", "T", "h", "H", "Q", "c1", "K_step", "pd")
+STEP = 0.01
+
+
+class DesignTable:
+    def __init__(self, profile, columns):
+        self.profile = dict(profile)
+        self.columns = columns
+        self.size = columns["Pa"].size
+
+    @property
+    def q3_max(self):
+        return (self.size - 1) * STEP
+
+    # ---------- 생성 / 저장 ----------
+    @classmethod
+    def build(cls, q3_max=100.0, pd=None, pd_custom=False, C=0.33, V=1.2, k1=0.7, V1_theory=1.2):
+        profile = dict(pd=pd, pd_custom=bool(pd_custom), C=float(C), V=float(V),
+                       k1=float(k1), V1_theory=float(V1_theory))
+        k = np.arange(int(round(q3_max / STEP)) + 1)
+        res = compute_batch(Q1=k / 100.0, **profile)
+        columns = {c: res[c] for c in FLOAT_COLUMNS}
+        columns["Pa"] = res["Pa"].astype(np.int8)
+        columns["forced"] = np.array([m is not None for m in res["_msg"]])
+        return cls(profile, columns)
+
+    def save(self, path):
+        np.savez_compressed(path, profile=np.array(json.dumps(self.profile)), **self.columns)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as f:
+            profile = json.loads(str(f["profile"]))
+            columns = {k: f[k] for k in f.files if k != "profile"}
+        return cls(profile, columns)
+
+    # ---------- 평가 ----------
+    def _scalar(self, q3):
+        """프로파일로 compute 직접 계산 (격자 밖 / 검증용)"""
+        p = self.profile
+        custom = p["pd_custom"] and p["pd"] is not None
+        return compute(Q1=q3, C=p["C"], V=p["V"], k1=p["k1"], V1_theory=p["V1_theory"],
+                       pd_choice=None if custom else p["pd"],
+                       pd_text=repr(p["pd"]) if custom else None)
+
+    def _row(self, i):
+        c = self.columns
+        out = {k: c[k][i].item() for k in ("B", "S", "T", "h", "H", "Q", "c1", "K_step")}
+        out.update(Pa=int(c["Pa"][i]), pd=c["pd"][i].item(),
+                   _msg=PD_FORCED_MSG if c["forced"][i] else None)
+        return out
+
+    def compute(self, K=None, n=None, Vel=None, D=None, Q1=None):
+        """프로파일 고정 compute (결과 dict 동일)"""
+        Q3 = design_charge(Q1, max_charge(K, n, Vel, D))
+        i = int(round(Q3 / STEP))
+        return self._row(i) if 0 <= i < self.size else self._scalar(Q3)
+
+    def evaluate(self, K=None, n=None, Vel=None, D=None, Q1=None):
+        """배열 평가. 반환: compute_batch 와 같은 형식의 dict"""
+        nan = lambda v: np.nan if v is None else v
+        Q3 = design_charge_batch(nan(Q1), max_charge_batch(nan(K), nan(n), nan(Vel), nan(D)))
+        Q3 = np.atleast_1d(Q3)
+        idx = np.rint(Q3 / STEP).astype(np.int64)
+        inside = (idx >= 0) & (idx < self.size)
+        idx = np.where(inside, idx, 0)
+
+        c = self.columns
+        out = {k: c[k][idx] for k in FLOAT_COLUMNS}
+        out["Pa"] = c["Pa"][idx].astype(np.int64)
+        out["_msg"] = np.where(c["forced"][idx], PD_FORCED_MSG, None).astype(object)
+        if not inside.all():
+            rest = compute_batch(Q1=Q3[~inside], **self.profile)
+            for k in out:
+                out[k][~inside] = rest[k]
+        return out
+
+    def verify(self):
+        """전 격자를 compute 로 다시 계산하여 비교. 반환: 불일치 Q3 목록"""
+        return [i / 100.0 for i in range(self.size) if self._scalar(i / 100.0) != self._row(i)]
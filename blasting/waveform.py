@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+진동 파형 수집 (3성분 계측 파일 → 이벤트 표)
+- 파일 1개 = 발파 1회 계측, 성분 순서 T(접선), V(수직), L(진행)
+    .bin : 고정 형식 바이너리 (HEADER 64 바이트 + 샘플 인터리브), np.memmap 으로 읽음 (읽기 버퍼 복사 없음)
+    .csv : "# sample_rate=1024" 등 주석 줄 + 머리글(T,V,L 포함) + 값, NumPy C 파서(np.loadtxt)로 읽음
+- 이벤트마다 성분별 PPV, 최대 벡터합(PVS), FFT 최대 진폭 주파수(주 주파수)를 배열 연산으로 계산
+  샘플은 CHUNK 행씩 읽음 (PPV 는 파일 형식 그대로 최대/최소, 부동소수 변환은 chunk 단위)
+  → 기록 길이와 무관하게 메모리 일정. 주파수는 WINDOW 샘플 구간 스펙트럼 합의 최대 (기록이 WINDOW 이하면 기록 전체 FFT)
+- file 열: 파일 경로 (기준 폴더 root 에 대한 상대 경로, 기본 현재 폴더) → 폴더가 달라도 이름이 겹치지 않음
+- 파일은 프로세스 풀에서 병렬 처리, 결과는 입력 순서대로. 파일 단위 오류는 error 열에 남기고 계속 진행
+- 이벤트 표 CSV 의 PPV, D, W 열을 sitelaw 가 그대로 읽음 → K, n (compute 입력)
+    (Vel 은 허용기준이므로 계측값이 아님. freq 열로 주파수별 기준을 고를 수 있음)
+
+사용 예:
+    python -m blasting.waveform 계측/2024-05/*.bin -o 이벤트.csv -j 8
+    python -m blasting.waveform 계측 -o 이벤트.csv --root 계측        # file 열: 2024-05/ev001.bin
+    python -m blasting.sitelaw 이벤트.csv --levels 50,95
+"""
+import os
+import sys
+import csv
+import struct
+import argparse
+from functools import partial
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+CHANNELS = ("T", "V", "L")
+
+# 바이너리 머리글 (리틀엔디언 64 바이트):
+#   magic "BLWF", version, 성분 수, sample_rate(Hz), 샘플 수, scale(샘플 값 → cm/s),
+#   이격거리 D(m), 지발당 장약량 W(kg), 발파 시각(유닉스 초), 샘플 형식("h" int16 / "i" int32 / "f" float32)
+HEADER = struct.Struct("<4sHHdqdddqc7x")
+MAGIC, VERSION = b"BLWF", 1
+SAMPLE_TYPES = {b"h": np.int16, b"i": np.int32, b"f": np.float32}
+
+EVENT_COLUMNS = ("file", "time", "PPV", "D", "W", "SD", "PVS",
+                 "ppv_T", "ppv_V", "ppv_L", "freq", "freq_T", "freq_V", "freq_L", "error")
+Event = namedtuple("Event", EVENT_COLUMNS)
+
+CHUNK = 1 << 16        # 한 번에 부동소수로 바꾸는 샘플 행 수
+WINDOW = 1 << 16       # 주 주파수 FFT 구간 길이 (샘플)
+
+
+# ================= 읽기 =================
+def write_bin(path, samples, sample_rate, scale=1.0, D=float("nan"), W=float("nan"), time=0):
+    """samples (샘플 수 x 3) → 고정 형식 바이너리 (계측기 변환 도구/시험용)"""
+    samples = np.ascontiguousarray(samples)
+    code = {np.dtype(t): c for c, t in SAMPLE_TYPES.items()}.get(samples.dtype)
+    if code is None:
+        raise ValueError(f"샘플 형식은 int16/int32/float32: {samples.dtype}")
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, samples.shape[1], sample_rate, samples.shape[0],
+                            scale, D, W, int(time), code))
+        f.write(samples.astype(samples.dtype.newbyteorder("<"), copy=False).tobytes())
+
+
+def read_bin(path):
+    """바이너리 → (메타 dict, 샘플 memmap (샘플 수 x 성분 수), scale)"""
+    with open(path, "rb") as f:
+        head = f.read(HEADER.size)
+    if len(head) < HEADER.size:
+        raise ValueError("머리글이 잘렸습니다.")
+    magic, version, nch, rate, count, scale, D, W, t, code = HEADER.unpack(head)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"파형 파일 형식이 아닙니다 (magic {magic!r}, version {version}).")
+    if code not in SAMPLE_TYPES:
+        raise ValueError(f"알 수 없는 샘플 형식: {code!r}")
+    dtype = np.dtype(SAMPLE_TYPES[code]).newbyteorder("<")
+    if os.path.getsize(path) < HEADER.size + count * nch * dtype.itemsize:
+        raise ValueError("샘플이 머리글의 샘플 수보다 적습니다.")
+    data = np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size, shape=(count, nch))
+    return {"sample_rate": rate, "D": D, "W": W, "time": t}, data, scale
+
+
+def read_csv(path):
+    """CSV → (메타 dict, 샘플 배열 (샘플 수 x 3), scale). 주석 줄: # key=value (sample_rate, scale, D, W, time, 그 밖의 키는 무시)"""
+    meta = {"D": float("nan"), "W": float("nan"), "time": 0, "scale": 1.0}
+    with open(path, encoding="utf-8-sig") as f:
+        line = f.readline()
+        while line.startswith("#"):
+            key, _, value = line[1:].partition("=")
+            key = key.strip()
+            if key in ("sample_rate", "scale", "D", "W", "time") and value.strip():
+                meta[key] = float(value)
+            line = f.readline()
+        header = [h.strip() for h in line.split(",")]
+        missing = [c for c in CHANNELS if c not in header]
+        if missing:
+            raise ValueError(f"열 {', '.join(missing)} 이(가) 없습니다 (열: {', '.join(header)})")
+        if "sample_rate" not in meta:
+            raise ValueError("주석 줄에 sample_rate 가 없습니다.")
+        data = np.loadtxt(f, delimiter=",", usecols=[header.index(c) for c in CHANNELS], ndmin=2)
+    meta["time"] = int(meta["time"])
+    return meta, data, meta.pop("scale")
+
+
+READERS = {".bin": read_bin, ".csv": read_csv}
+
+
+# ================= 계산 =================
+def dominant_frequency(x, sample_rate, mean=None, window=None):
+    """
+    각 열의 FFT 최대 진폭 주파수 (Hz, 직류 성분 제외). mean: 열 평균 (이미 구했으면 전달)
+    기록이 window(기본 WINDOW) 이하면 기록 전체 FFT, 길면 window 샘플 구간별 진폭 스펙트럼의 합 (마지막 구간은 0 으로 채움)
+    """
+    n = x.shape[0]
+    if n < 2:
+        return np.full(x.shape[1], np.nan)
+    if mean is None:
+        mean = sum(x[i:i + CHUNK].sum(axis=0, dtype=np.float64) for i in range(0, n, CHUNK)) / n
+    size = min(n, window or WINDOW)
+    spec = 0
+    for i in range(0, n, size):
+        seg = x[i:i + size].astype(np.float64) - mean
+        spec = spec + np.abs(np.fft.rfft(seg, n=size, axis=0))
+    return (np.argmax(spec[1:], axis=0) + 1) * sample_rate / size
+
+
+def analyse(samples, sample_rate, scale=1.0):
+    """샘플 (샘플 수 x 3, memmap 가능) → (성분별 PPV, PVS, 성분별 주 주파수). 단위 cm/s"""
+    x = samples if isinstance(samples, np.ndarray) else np.asarray(samples, dtype=np.float64)
+    if x.ndim != 2 or x.shape[1] != len(CHANNELS) or not x.shape[0]:
+        raise ValueError(f"3성분 샘플이 필요합니다 (형태 {x.shape}).")
+    n = x.shape[0]
+    hi = lo = total = None
+    sq = 0.0
+    for i in range(0, n, CHUNK):
+        c = x[i:i + CHUNK]
+        # 최대/최소는 파일 형식 그대로 (int16 -32768 의 abs 넘침 없음)
+        c_hi, c_lo = c.max(axis=0).astype(np.float64), c.min(axis=0).astype(np.float64)
+        c_sum = c.sum(axis=0, dtype=np.float64)
+        f = c.astype(np.float64)
+        sq = max(sq, float(np.einsum("ij,ij->i", f, f).max()))
+        if hi is None:
+            hi, lo, total = c_hi, c_lo, c_sum
+        else:
+            hi, lo, total = np.maximum(hi, c_hi), np.minimum(lo, c_lo), total + c_sum
+    scale = abs(scale)
+    ppv = np.maximum(hi, -lo) * scale
+    pvs = float(np.sqrt(sq)) * scale
+    return ppv, pvs, dominant_frequency(x, sample_rate, total / n)
+
+
+def file_label(path, root=None):
+    """file 열 값: root(기본 현재 폴더) 기준 상대 경로, '/' 구분. 다른 드라이브 등으로 못 구하면 경로 그대로"""
+    try:
+        rel = os.path.relpath(path, root or os.curdir)
+    except ValueError:
+        rel = path
+    return rel.replace(os.sep, "/")
+
+
+def process_file(path, root=None):
+    """파형 파일 1개 → Event (오류는 error 열). root: file 열 상대 경로의 기준 폴더"""
+    name = file_label(path, root)
+    try:
+        reader = READERS.get(os.path.splitext(path)[1].lower())
+        if reader is None:
+            raise ValueError(f"지원하지 않는 확장자 (지원: {', '.join(READERS)})")
+        meta, data, scale = reader(path)
+        ppv, pvs, freq = analyse(data, meta["sample_rate"], scale)
+    except Exception as e:
+        nan = float("nan")
+        return Event(name, 0, *([nan] * 12), f"{type(e).__name__}: {e}")
+    D, W = meta["D"], meta["W"]
+    sd = D / W ** 0.5 if D > 0 and W > 0 else float("nan")
+    peak = int(np.argmax(ppv))
+    return Event(name, meta["time"], float(ppv[peak]), D, W, sd, pvs, *map(float, ppv),
+                 float(freq[peak]), *map(float, freq), "")
+
+
+def process_files(paths, jobs=None, chunksize=16, root=None):
+    """파일들을 프로세스 풀에서 처리하여 Event 를 입력 순서대로 yield. jobs=1 이면 현재 프로세스"""
+    work = partial(process_file, root=root)
+    if jobs == 1:
+        yield from map(work, paths)
+        return
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as ex:
+        yield from ex.map(work, paths, chunksize=chunksize)
+
+
+def write_events(events, dst):
+    """Event 들 → 이벤트 표 CSV. 반환: (이벤트 수, 오류 수)"""
+    total = errors = 0
+    with open(dst, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(EVENT_COLUMNS)
+        for ev in events:
+            w.writerow(["" if isinstance(v, float) and v != v else v for v in ev])
+            total += 1
+            errors += bool(ev.error)
+    return total, errors
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m blasting.waveform",
+                                 description="3성분 진동 파형 → 이벤트 표 (PPV, PVS, 주 주파수)")
+    ap.add_argument("input", nargs="+", help="파형 파일 (.bin / .csv) 또는 폴더")
+    ap.add_argument("-o", "--output", required=True, help="이벤트 표 CSV")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    ap.add_argument("--root", default=None, help="file 열 상대 경로의 기준 폴더 (기본: 현재 폴더)")
+    args = ap.parse_args(argv)
+
+    paths = []
+    for p in args.input:
+        if os.path.isdir(p):
+            paths += sorted(os.path.join(p, n) for n in os.listdir(p) if os.path.splitext(n)[1].lower() in READERS)
+        else:
+            paths.append(p)
+    total, errors = write_events(process_files(paths, jobs=args.jobs, root=args.root), args.output)
+    print(f"완료: {total:,}개 (오류 {errors:,}개) → {args.output}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,12 +10,18 @@
 - PDF: "발파설계결과" 중앙 정렬, 위 30mm/왼쪽 30mm 여백
       패턴 이미지는 좌로 10mm, 위로 10mm 이동(제목과 충돌 방지)
 """
-import os, sys, io, math, base64, tempfile
+import os, sys, io, base64, tempfile, threading, queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from tkinter import font as tkfont
 
+from blasting.core import PA_NAMES, compute
+from blasting import assets
+from blasting.report import make_desktop_pdf, pdf_available
+
 AUTO_CROP = False  # True로 하면 흰 여백만 살짝 트리밍(콘텐츠 크롭 아님)
 
 # 1x1 PNG placeholder (이미지 미발견 시)
@@ -30,168 +36,28 @@ except Exception:
     Image = None
     ImageTk = None
 
+# 이미지 캐시 크기 (항목 수)
+IMAGE_CACHE_SIZE = 8
+PHOTO_CACHE_SIZE = 16
 
-# ================= 계산 로직 =================
-def compute_outputs_full_with_inputs(
-    K=None, n=None, Vel=None, D=None,
-    Q1=None, C=0.33, V=1.2,
-    pd_choice=None, pd_text=None,
-    k1=0.7, V1_theory=1.2
-):
-    def round_n(x, n): return round(x, n)
-
-    # --- Q1/Q2/Q3 ---
-    have_all = (K is not None and n is not None and Vel is not None and D is not None)
-    have_Q1 = (Q1 is not None)
-    Q2 = None
-    if have_all:
-        # Q2 = (D^2) * ((Vel/K)^(2/(-n)))  → 소수 2자리
-        Q2 = round_n((D**2) * ((Vel / K) ** (2 / (-n))), 2)
-    if not have_Q1:
-        if have_all:
-            Q3 = Q2
-        else:
-            raise ValueError("입력오류: Q1이 비어있을 때는 K, n, Vel, D를 모두 입력해야 합니다.")
-    else:
-        # Q1이 있고 모든 파라미터도 있으면 Q3 = min(Q1, Q2); 아니면 Q3 = Q1
-        Q3 = round_n(min(Q1, Q2), 2) if have_all else round_n(Q1, 2)
-
-    # --- Pa ---
-    if   Q3 < 0.125: Pa = 1
-    elif Q3 < 0.5:   Pa = 2
-    elif Q3 < 1.6:   Pa = 3
-    elif Q3 < 5:     Pa = 4
-    elif Q3 < 15:    Pa = 5
-    else:            Pa = 6
-
-    # --- pd 결정: ANFO 직접입력 > 라디오 선택 > Pa 기본 ---
-    pd = None; pd_from_custom = False
-    if pd_text:
-        try:
-            val = float(pd_text)
-            if val > 0:
-                pd = val
-                pd_from_custom = True
-        except:
-            pass
-    if pd is None and (pd_choice is not None):
-        pd = float(pd_choice)
-    if pd is None:
-        if Pa in [1,2,3]: pd = 0.032
-        elif Pa in [4,5]: pd = 0.050
-        else: pd = 0.076
-    pd = round_n(pd, 3)
-
-    # --- [Pa=1,2 전용] pd 허용 규칙 ---
-    pd_forced_msg = None
-    user_pd_supplied = pd_from_custom or (pd_choice is not None)
-    if Pa in (1, 2) and user_pd_supplied:
-        if pd > 0.032:
-            pd = 0.032
-            pd_forced_msg = "폭약경이 적합하지 않아 0.032 m로 선택하였습니다."
-
-    # --- ANFO 공식(0.815) ---
-    def anfo_formula(pd_val):
-        return (1000 * 0.815 * 3.1415 * (pd_val ** 2)) / 4.0, 1.0, 0.1
-
-    # --- W1/h1/nu 테이블 ---
-    tol = 1e-9
-    if Pa == 1:
-        W1, h1, nu = 0.12, 0.2, 0.5
-    elif Pa == 2:
-        W1, h1, nu = 0.25, 0.295, 0.5
-    elif Pa == 3:
-        if pd_from_custom:
-            W1, h1, nu = anfo_formula(pd)
-        elif abs(pd - 0.032) < tol:
-            W1, h1, nu = 0.25, 0.295, 0.5
-        elif abs(pd - 0.050) < tol:
-            W1, h1, nu = 1.0, 0.420, 0.5
-        else:
-            W1, h1, nu = 0.25, 0.295, 0.5
-    elif Pa == 4:
-        if pd_from_custom:
-            W1, h1, nu = anfo_formula(pd)
-        elif abs(pd - 0.032) < tol:
-            W1, h1, nu = 0.25, 0.295, 0.5
-        elif abs(pd - 0.050) < tol:
-            W1, h1, nu = 1.0, 0.42, 0.5
-        elif abs(pd - 0.065) < tol:
-            W1, h1, nu = 2.0, 0.52, 0.5
-        else:
-            W1, h1, nu = 1.0, 0.42, 0.5
-    elif Pa == 5:
-        if pd_from_custom:
-            W1, h1, nu = anfo_formula(pd)
-        elif abs(pd - 0.032) < tol:
-            W1, h1, nu = 0.25, 0.295, 0.5
-        elif abs(pd - 0.050) < tol:
-            W1, h1, nu = 1.0, 0.42, 0.5
-        elif abs(pd - 0.065) < tol:
-            W1, h1, nu = 2.0, 0.52, 0.5
-        else:
-            W1, h1, nu = 1.0, 0.42, 0.5
-    elif Pa == 6:
-        if abs(pd - 0.065) < tol:
-            W1, h1, nu = 2.0, 0.52, 1.0
-        elif abs(pd - 0.050) < tol:
-            W1, h1, nu = 1.0, 0.42, 0.5
-        elif abs(pd - 0.032) < tol:
-            W1, h1, nu = 0.25, 0.295, 0.5
-        elif pd_from_custom:
-            W1, h1, nu = anfo_formula(pd)
-        else:
-            W1, h1, nu = anfo_formula(pd)
-    else:
-        W1, h1, nu = 1.0, 0.42, 0.5
-
-    # --- Q4/Q/h  (ANFO 선택 규칙: Q=Q3, h=h1*(Q3/W1) if Q>=0.5, else 기본 경로) ---
-    if pd_from_custom:
-        Q = float(Q3)  # ANFO 선택 시 Q는 Q3
-        if Q >= 0.5:
-            Q4 = int((Q / W1) * 2.0) if W1 <= 2.0 else int(Q)
-            h  = h1 * (Q3 / W1)
-        else:
-            # Q<0.5 → ANFO 특수처리 해제(기본 경로)
-            Q4 = int((Q3 / W1) * 2.0) if W1 <= 2.0 else int(Q3)
-            Q  = (Q4 / 2.0) * W1 if W1 <= 2.0 else float(Q4)
-            h  = 0.95 * h1 * Q / W1
-    else:
-        # 기본(비-ANFO) 경로
-        Q4 = int((Q3 / W1) * 2.0) if W1 <= 2.0 else int(Q3)
-        Q  = (Q4 / 2.0) * W1 if W1 <= 2.0 else float(Q4)
-        h  = 0.95 * h1 * Q / W1
-
-    # --- B,S 산정 ---
-    denom = C * V1_theory * (0.7*h + 0.77*(Q**(1/3)) + 10*pd)
-    if denom <= 0:
-        raise ValueError("분모가 0 이하입니다.")
-    B1_raw = 0.94 * math.sqrt(Q / denom)
-    S1_raw = V1_theory * B1_raw
-
-    if abs(V - 1.2) < 1e-12:
-        B, S = round_n(B1_raw, 2), round_n(S1_raw, 2)
-    else:
-        # 면적 보존 기반 보정
-        B_corr = math.sqrt((B1_raw * S1_raw) / V)
-        S_corr = V * B_corr
-        B, S = round_n(B_corr, 2), round_n(S_corr, 2)
-
-    # --- T, H, K_step, c1 ---
-    T = round_n((k1 * (pd ** -0.25) if Pa == 1 else k1 * (pd ** -0.18)) * math.sqrt(B * S), 2)
-    H = round_n(T + h, 2)
-    K_step = round_n(H - 0.2 * B, 2)
-    denom_c1 = B * S * K_step
-    c1_val = 0.0 if denom_c1 == 0 else Q / denom_c1
-    c1 = round_n(c1_val, 2)
-
-    return {
-        "B": B, "S": S, "T": T, "h": H - T, "H": H, "Q": Q, "c1": c1, "K_step": K_step,
-        "Q1": Q1, "Q2": Q2, "Q3": Q3, "Pa": Pa, "pd": pd, "W1": W1, "h1": h1, "nu": nu, "Q4": Q4,
-        "B1": round(B1_raw,4), "S1": round(S1_raw,4),
-        "_pd_from_custom": pd_from_custom,
-        "_pd_forced_msg": pd_forced_msg,
-    }
+
+class _LRU:
+    """항목 수 제한 LRU (Tk 메인 스레드 전용)"""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key):
+        v = self._data.get(key)
+        if v is not None:
+            self._data.move_to_end(key)
+        return v
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
 
 
 # ================= GUI =================
@@ -301,6 +167,15 @@ class App(tk.Tk):
         tk.Button(btn, text="인쇄", width=10, relief="raised",
                   bg="#22c55e", activebackground="#16a34a", fg="white", bd=2,
                   font=self.font_btn, command=self.print_result).pack(side="left", padx=S(10))
+
+        # 백그라운드 작업 상태 (작업이 있을 때만 표시)
+        self.job_frame = ttk.Frame(btn)
+        self.job_progress = ttk.Progressbar(self.job_frame, mode="indeterminate", length=S(120))
+        self.job_progress.pack(side="left", padx=S(6))
+        self.job_label = ttk.Label(self.job_frame, text="", font=self.font_input)
+        self.job_label.pack(side="left", padx=S(4))
+        tk.Button(self.job_frame, text="취소", width=6, bd=2, font=self.font_btn,
+                  command=self.cancel_jobs).pack(side="left", padx=S(4))
         row += 1
 
         # ===== 표시 영역 =====
@@ -316,6 +191,18 @@ class App(tk.Tk):
 
         self._pil_image = None
         self._tk_image  = None
+        self._img_cache   = _LRU(IMAGE_CACHE_SIZE)   # 디코딩된 PIL 이미지
+        self._photo_cache = _LRU(PHOTO_CACHE_SIZE)   # 캔버스 크기로 축소된 (PIL, PhotoImage)
+
+        # 패턴 이미지 파생본(표시/인쇄/PDF 크기) 준비 — 없거나 원본이 바뀐 경우에만 생성
+        threading.Thread(target=assets.ensure, daemon=True).start()
+
+        # PDF 저장/인쇄 작업: 작업 스레드 1개에서 순서대로 처리, 결과는 after() 로 메인 스레드에서 받음
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+        self._job_results = queue.Queue()
+        self._jobs = []          # 대기/실행 중 _Job (제출 순서)
+        self._poll_id = None     # 결과 확인 after() id (확인 루프는 하나만)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ---------- 이미지 유틸 ----------
     def _mm_to_px(self, mm: float) -> int:
@@ -325,11 +212,14 @@ class App(tk.Tk):
             dpi_px_per_in = 96.0
         return int(dpi_px_per_in * (mm / 25.4))
 
-    def _autocrop_whitespace(self, img, thr=245):
+    def _autocrop_whitespace(self, img, thr=245, src=None):
         if Image is None: return img
-        gray = img.convert("L")
-        bw = gray.point(lambda p: 255 if p < thr else 0, mode="1")
-        bbox = bw.getbbox()
+        # 미리 계산된 트리밍 영역(assets manifest)이 있으면 사용
+        bbox = assets.crop_box(src, img.size) if src and thr == assets.CROP_THRESHOLD else None
+        if bbox is None:
+            gray = img.convert("L")
+            bw = gray.point(lambda p: 255 if p < thr else 0, mode="1")
+            bbox = bw.getbbox()
         return img.crop(bbox) if bbox else img
 
     def _select_pattern_image_by_ratio(self, ratio: float):
@@ -352,11 +242,21 @@ class App(tk.Tk):
             messagebox.showwarning("Pillow 필요", "이미지 표시를 위해 Pillow가 필요합니다. 'pip install pillow' 후 다시 실행하세요.")
             return
         try:
-            img = Image.open(path)
+            self._show_img_on_canvas(None, src=path)
         except Exception as e:
             messagebox.showerror("이미지 오류", f"이미지를 열 수 없습니다:\n{e}")
-            return
-        self._show_img_on_canvas(img)
+
+    def _decoded_image(self, path):
+        """화면 크기 파생본(없으면 원본)을 디코딩한 PIL 이미지. (경로, 수정시각) 기준 캐시"""
+        path = assets.derivative(path, "display")
+        key = (path, os.stat(path).st_mtime_ns)
+        img = self._img_cache.get(key)
+        if img is None:
+            with Image.open(path) as im:
+                im.load()
+                img = im.copy()
+            self._img_cache.put(key, img)
+        return img
 
     def _load_embedded_placeholder(self):
         if Image is None or ImageTk is None:
@@ -371,13 +271,8 @@ class App(tk.Tk):
             return
         self._show_img_on_canvas(img)
 
-    def _show_img_on_canvas(self, img):
-        if AUTO_CROP and Image is not None:
-            try:
-                img = self._autocrop_whitespace(img, thr=245)
-            except Exception:
-                pass
-
+    def _canvas_box(self):
+        """이미지 캔버스에서 여백(상하 15mm, 좌우 30mm)을 뺀 표시 영역 → (x0, y0, target_w, target_h)"""
         margin_top    = self._mm_to_px(15.0)
         margin_bottom = self._mm_to_px(15.0)
         margin_left   = self._mm_to_px(30.0)
@@ -405,6 +300,31 @@ class App(tk.Tk):
 
         target_w = max(1, content_w - (margin_left + margin_right) - safety)
         target_h = max(1, content_h - (margin_top + margin_bottom) - safety)
+        return hl + bd + margin_left, hl + bd + margin_top, target_w, target_h
+
+    def _show_img_on_canvas(self, img, src=None):
+        """
+        img(PIL) 또는 src(파일 경로)를 캔버스에 맞춰 표시.
+        src 로 부르면 (표시용 파생본 경로, 그 수정시각, 표시 폭, 높이) 기준으로 축소된 PhotoImage 를 재사용
+        → 같은 패턴/창 크기면 즉시 표시, 파생본을 다시 만들면 새로 읽음
+        """
+        x_base, y0, target_w, target_h = self._canvas_box()
+
+        key = None
+        if src:
+            disp = assets.derivative(src, "display")
+            key = (src, disp, os.stat(disp).st_mtime_ns, target_w, target_h, AUTO_CROP)
+            hit = self._photo_cache.get(key)
+            if hit is not None:
+                self._draw_photo(*hit, x_base, y0, target_w)
+                return
+            img = self._decoded_image(src)
+
+        if AUTO_CROP and Image is not None:
+            try:
+                img = self._autocrop_whitespace(img, thr=245, src=src)
+            except Exception:
+                pass
 
         scale = min(target_w / img.width, target_h / img.height)
         new_w = max(1, int(round(img.width  * scale)))
@@ -418,12 +338,16 @@ class App(tk.Tk):
         if (new_w, new_h) != (img.width, img.height):
             img = img.resize((new_w, new_h), resample)
 
+        photo = ImageTk.PhotoImage(img)
+        if key:
+            self._photo_cache.put(key, (img, photo))
+        self._draw_photo(img, photo, x_base, y0, target_w)
+
+    def _draw_photo(self, img, photo, x_base, y0, target_w):
         self._pil_image = img
-        self._tk_image  = ImageTk.PhotoImage(img)
+        self._tk_image  = photo
         self.image_canvas.delete("all")
-
-        x0 = hl + bd + margin_left + (target_w - new_w)//2
-        y0 = hl + bd + margin_top
+        x0 = x_base + (target_w - img.width)//2
         self.image_canvas.create_image(x0, y0, image=self._tk_image, anchor="nw")
 
     # ---------- 입력/계산 ----------
@@ -478,7 +402,7 @@ class App(tk.Tk):
         except: k1_val = 0.7
 
         try:
-            res = compute_outputs_full_with_inputs(
+            res = compute(
                 K=K, n=n, Vel=Vel, D=D, Q1=Q1, C=C, V=V,
                 pd_choice=pd_choice, pd_text=pd_text, k1=k1_val
             )
@@ -488,7 +412,7 @@ class App(tk.Tk):
         self.last_result = res
 
         # pd 강제 변경 안내
-        msg = res.get("_pd_forced_msg")
+        msg = res.get("_msg")
         if msg:
             messagebox.showinfo("폭약경 조정", msg)
 
@@ -505,10 +429,7 @@ class App(tk.Tk):
         c = self.values_panel; c.delete("all")
         S = self.S
         x0, y0 = S(18), S(16)
-        title = {
-            1:"미진동발파패턴",2:"정밀진동제어발파",3:"소규모진동제어발파",
-            4:"중규모진동제어발파",5:"일반발파",6:"대규모발파"
-        }.get(res.get("Pa",5),"일반발파")
+        title = PA_NAMES.get(res.get("Pa",5),"일반발파")
         c.create_text(x0, y0, text=title, anchor="nw", font=self.font_res_title)
 
         y = y0 + S(36)
@@ -537,6 +458,10 @@ class App(tk.Tk):
             if not self.last_result:
                 return
 
+        if not pdf_available():
+            messagebox.showerror("모듈 필요", "PDF 저장을 위해 reportlab이 필요합니다.\n명령프롬프트에서:\n  pip install reportlab")
+            return
+
         # 2) 경로 선택
         save_path = filedialog.asksaveasfilename(
             title="결과 PDF 저장",
@@ -546,135 +471,21 @@ class App(tk.Tk):
         if not save_path:
             return
 
-        # 3) reportlab 로드
-        try:
-            from reportlab.pdfgen import canvas as pdfcanvas
-            from reportlab.lib.pagesizes import A4
-            from reportlab.lib.utils import ImageReader
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-        except Exception:
-            messagebox.showerror("모듈 필요", "PDF 저장을 위해 reportlab이 필요합니다.\n명령프롬프트에서:\n  pip install reportlab")
-            return
+        # 3) PDF 생성/저장은 작업 스레드에서 (지금 결과를 복사해서 사용 → 그 사이 다시 계산해도 무관)
+        result, pattern_path = dict(self.last_result), self.last_pattern_path
 
-        # 4) 한글 폰트 등록 시도
-        font_name = None
-        candidates = []
-        win = os.environ.get("WINDIR")
-        if win:
-            candidates += [
-                os.path.join(win, "Fonts", "malgun.ttf"),
-                os.path.join(win, "Fonts", "NanumGothic.ttf"),
-            ]
-        candidates += [
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
-            "/System/Library/Fonts/AppleSDGothicNeo.ttc",
-        ]
-        for p in candidates:
-            if os.path.isfile(p):
-                try:
-                    pdfmetrics.registerFont(TTFont("KOR", p))
-                    font_name = "KOR"
-                    break
-                except Exception:
-                    continue
-
-        # 5) 페이지/여백(mm)
-        PAGE_W, PAGE_H = A4  # 595x842 pt
-        def mm(x): return x * 72.0 / 25.4
-        margin_l, margin_r = mm(30), mm(20)    # 왼쪽 30 mm
-        margin_t, margin_b = mm(30), mm(15)    # 위쪽 30 mm
-
-        # 6) 캔버스 만들기 & 폰트
-        c = pdfcanvas.Canvas(save_path, pagesize=A4)
-        def setfont(size):
-            try:
-                c.setFont(font_name if font_name else "Helvetica", size)
-            except Exception:
-                c.setFont("Helvetica", size)
+        def work(cancelled):
+            _check(cancelled)
+            data = make_desktop_pdf(result, pattern_path)
+            if data is None:
+                raise RuntimeError("PDF 저장을 위해 reportlab이 필요합니다.")
+            _check(cancelled)
+            with open(save_path, "wb") as f:
+                f.write(data)
+            return save_path
 
-        # 7) 타이틀 (가운데 정렬)
-        setfont(18)
-        c.drawCentredString(PAGE_W / 2.0, PAGE_H - margin_t, "스마트스템 발파설계")
-
-        # 출력날짜 (우측 정렬)
-        setfont(10)
-        output_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-        c.drawRightString(PAGE_W - margin_r, PAGE_H - margin_t - mm(8), f"출력날짜: {output_date}")
-        y = PAGE_H - margin_t - mm(16)
-
-        # Pa 라벨
-        pa_title = {
-            1:"미진동발파패턴",2:"정밀진동제어발파",3:"소규모진동제어발파",
-            4:"중규모진동제어발파",5:"일반발파",6:"대규모발파"
-        }.get(self.last_result.get("Pa",5),"일반발파")
-        setfont(12)
-        c.drawString(margin_l, y, f"발파공법 : {pa_title}")
-        y -= mm(8)
-
-        # 8) 좌측 정보 블록
-        lines = [
-            ("저항선(B)", f"{self.last_result['B']:.2f} m"),
-            ("공간격(S)", f"{self.last_result['S']:.2f} m"),
-            ("전색장(T)", f"{self.last_result['T']:.2f} m"),
-            ("장약장(h)", f"{self.last_result['h']:.2f} m"),
-            ("천공장(H)", f"{self.last_result['H']:.2f} m"),
-            ("계단높이(K_step)", f"{self.last_result['K_step']:.2f} m"),
-            ("장약량/공(Q)", f"{self.last_result['Q']} kg"),
-            ("비장약량(c1)", f"{self.last_result['c1']} kg/m³"),
-            ("폭약경(pd)", f"{self.last_result['pd']} m"),
-        ]
-        setfont(11)
-        col_w = (PAGE_W - margin_l - margin_r) * 0.50  # 왼쪽 영역 폭
-        line_h = mm(7)
-        y0 = y
-        for lab, val in lines:
-            c.drawString(margin_l, y, f"{lab} : {val}")
-            y -= line_h
-
-        # 9) 우측 패턴 이미지 (← 왼쪽 10mm 이동, ↑ 위쪽 10mm 이동)
-        img_path = self.last_pattern_path
-        x_img_base = margin_l + col_w + mm(8)
-        x_img = max(margin_l + mm(5), x_img_base - mm(10))  # 최소 여백 보호하며 왼쪽으로 10mm
-        img_area_w = PAGE_W - margin_r - x_img
-        img_area_h = y0 - margin_b
-        if img_area_w > 0 and img_area_h > 0:
-            try:
-                if img_path and os.path.isfile(img_path):
-                    ir = ImageReader(img_path)
-                    iw, ih = ir.getSize()
-                    scale = min(img_area_w/iw, img_area_h/ih)
-                    new_w, new_h = iw*scale, ih*scale
-
-                    # top 기준을 y0에서 10mm 올림, 상단여백(30mm) 아래 2mm 버퍼 확보
-                    y_top_base   = y0
-                    y_top_target = min(y_top_base + mm(10), PAGE_H - margin_t - mm(2))
-                    y_img = max(margin_b, y_top_target - new_h)  # bottom y
-
-                    c.drawImage(ir, x_img, y_img,
-                                width=new_w, height=new_h,
-                                preserveAspectRatio=True, mask='auto')
-                else:
-                    c.setStrokeColorRGB(0.8,0.8,0.8)
-                    c.rect(x_img, margin_b, img_area_w, img_area_h, stroke=1, fill=0)
-                    setfont(10)
-                    c.drawString(x_img+mm(5), margin_b+img_area_h/2, "패턴 이미지 없음")
-            except Exception as e:
-                setfont(10)
-                c.drawString(x_img, margin_b+img_area_h/2, f"이미지 오류: {e}")
-
-        # 10) 폰트 안내(옵션)
-        if font_name is None:
-            c.setFillColorRGB(1,0,0)
-            setfont(9)
-            c.drawString(margin_l, margin_b/2,
-                         "참고: 시스템 한글 폰트를 찾지 못했습니다. 글자가 깨지면 malgun.ttf 또는 NanumGothic.ttf를 설치해 주세요.")
-
-        # 11) 저장
-        c.showPage()
-        c.save()
-        messagebox.showinfo("완료", f"PDF 저장 완료:\n{save_path}")
+        self._submit_job("PDF 저장", work,
+                         lambda path: messagebox.showinfo("완료", f"PDF 저장 완료:\n{path}"), "저장 오류")
 
     # ---------- 인쇄 기능 ----------
     def print_result(self):
@@ -684,151 +495,36 @@ class App(tk.Tk):
             if not self.last_result:
                 return
 
-        # 2) reportlab 로드
-        try:
-            from reportlab.pdfgen import canvas as pdfcanvas
-            from reportlab.lib.pagesizes import A4
-            from reportlab.lib.utils import ImageReader
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-        except Exception:
+        if not pdf_available():
             messagebox.showerror("모듈 필요", "인쇄를 위해 reportlab이 필요합니다.\n명령프롬프트에서:\n  pip install reportlab")
             return
 
-        # 3) 임시 PDF 파일 생성
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, "발파설계결과_print.pdf")
-
-        # 4) 한글 폰트 등록 시도
-        font_name = None
-        candidates = []
-        win = os.environ.get("WINDIR")
-        if win:
-            candidates += [
-                os.path.join(win, "Fonts", "malgun.ttf"),
-                os.path.join(win, "Fonts", "NanumGothic.ttf"),
-            ]
-        candidates += [
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
-            "/System/Library/Fonts/AppleSDGothicNeo.ttc",
-        ]
-        for p in candidates:
-            if os.path.isfile(p):
-                try:
-                    pdfmetrics.registerFont(TTFont("KOR", p))
-                    font_name = "KOR"
-                    break
-                except Exception:
-                    continue
-
-        # 5) 페이지/여백(mm)
-        PAGE_W, PAGE_H = A4
-        def mm(x): return x * 72.0 / 25.4
-        margin_l, margin_r = mm(30), mm(20)
-        margin_t, margin_b = mm(30), mm(15)
-
-        # 6) 캔버스 만들기 & 폰트
-        c = pdfcanvas.Canvas(temp_path, pagesize=A4)
-        def setfont(size):
-            try:
-                c.setFont(font_name if font_name else "Helvetica", size)
-            except Exception:
-                c.setFont("Helvetica", size)
-
-        # 7) 타이틀 (가운데 정렬)
-        setfont(18)
-        c.drawCentredString(PAGE_W / 2.0, PAGE_H - margin_t, "스마트스템 발파설계")
-
-        # 출력날짜 (우측 정렬)
-        setfont(10)
-        output_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-        c.drawRightString(PAGE_W - margin_r, PAGE_H - margin_t - mm(8), f"출력날짜: {output_date}")
-        y = PAGE_H - margin_t - mm(16)
-
-        # Pa 라벨
-        pa_title = {
-            1:"미진동발파패턴",2:"정밀진동제어발파",3:"소규모진동제어발파",
-            4:"중규모진동제어발파",5:"일반발파",6:"대규모발파"
-        }.get(self.last_result.get("Pa",5),"일반발파")
-        setfont(12)
-        c.drawString(margin_l, y, f"발파공법 : {pa_title}")
-        y -= mm(8)
-
-        # 8) 좌측 정보 블록
-        lines = [
-            ("저항선(B)", f"{self.last_result['B']:.2f} m"),
-            ("공간격(S)", f"{self.last_result['S']:.2f} m"),
-            ("전색장(T)", f"{self.last_result['T']:.2f} m"),
-            ("장약장(h)", f"{self.last_result['h']:.2f} m"),
-            ("천공장(H)", f"{self.last_result['H']:.2f} m"),
-            ("계단높이(K_step)", f"{self.last_result['K_step']:.2f} m"),
-            ("장약량/공(Q)", f"{self.last_result['Q']} kg"),
-            ("비장약량(c1)", f"{self.last_result['c1']} kg/m³"),
-            ("폭약경(pd)", f"{self.last_result['pd']} m"),
-        ]
-        setfont(11)
-        col_w = (PAGE_W - margin_l - margin_r) * 0.50
-        line_h = mm(7)
-        y0 = y
-        for lab, val in lines:
-            c.drawString(margin_l, y, f"{lab} : {val}")
-            y -= line_h
-
-        # 9) 우측 패턴 이미지
-        img_path = self.last_pattern_path
-        x_img_base = margin_l + col_w + mm(8)
-        x_img = max(margin_l + mm(5), x_img_base - mm(10))
-        img_area_w = PAGE_W - margin_r - x_img
-        img_area_h = y0 - margin_b
-        if img_area_w > 0 and img_area_h > 0:
-            try:
-                if img_path and os.path.isfile(img_path):
-                    # Pillow로 이미지를 RGB로 변환하여 검정색 문제 해결
-                    from PIL import Image as PILImage
-                    pil_img = PILImage.open(img_path)
-                    if pil_img.mode in ('RGBA', 'LA', 'P'):
-                        # 투명 배경을 흰색으로 변환
-                        background = PILImage.new('RGB', pil_img.size, (255, 255, 255))
-                        if pil_img.mode == 'P':
-                            pil_img = pil_img.convert('RGBA')
-                        background.paste(pil_img, mask=pil_img.split()[-1] if pil_img.mode == 'RGBA' else None)
-                        pil_img = background
-                    elif pil_img.mode != 'RGB':
-                        pil_img = pil_img.convert('RGB')
-
-                    # 임시 파일로 저장 후 사용
-                    temp_img_path = os.path.join(temp_dir, "temp_pattern_print.jpg")
-                    pil_img.save(temp_img_path, 'JPEG', quality=95)
-
-                    ir = ImageReader(temp_img_path)
-                    iw, ih = ir.getSize()
-                    scale = min(img_area_w/iw, img_area_h/ih)
-                    new_w, new_h = iw*scale, ih*scale
-                    y_top_base   = y0
-                    y_top_target = min(y_top_base + mm(10), PAGE_H - margin_t - mm(2))
-                    y_img = max(margin_b, y_top_target - new_h)
-                    c.drawImage(ir, x_img, y_img,
-                                width=new_w, height=new_h,
-                                preserveAspectRatio=True)
-                else:
-                    c.setStrokeColorRGB(0.8,0.8,0.8)
-                    c.rect(x_img, margin_b, img_area_w, img_area_h, stroke=1, fill=0)
-                    setfont(10)
-                    c.drawString(x_img+mm(5), margin_b+img_area_h/2, "패턴 이미지 없음")
-            except Exception as e:
-                setfont(10)
-                c.drawString(x_img, margin_b+img_area_h/2, f"이미지 오류: {e}")
-
-        # 10) 저장
-        c.showPage()
-        c.save()
-
-        # 11) Windows 직접 인쇄 - 프린터 선택 후 인쇄
-        self._print_with_dialog()
-
-    def _print_with_dialog(self):
-        """프린터 선택 대화상자를 표시하고 인쇄"""
+        # 2) 프린터 선택 후 작업 스레드에서 임시 PDF 생성 + 인쇄 이미지 생성 + 전송
+        result, pattern_path = dict(self.last_result), self.last_pattern_path
+
+        def start(printer_name):
+            def work(cancelled):
+                _check(cancelled)
+                data = make_desktop_pdf(result, pattern_path, notice=False, profile="print")
+                if data is None:
+                    raise RuntimeError("인쇄를 위해 reportlab이 필요합니다.")
+                _check(cancelled)
+                temp_path = os.path.join(tempfile.gettempdir(), "발파설계결과_print.pdf")
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                page = self._render_print_page(result, pattern_path, cancelled)
+                _check(cancelled)
+                self._send_to_printer(page, printer_name)
+                return printer_name
+
+            self._submit_job("인쇄", work,
+                             lambda name: messagebox.showinfo("인쇄 완료", f"'{name}'(으)로 인쇄를 전송했습니다."),
+                             "인쇄 오류")
+
+        self._print_with_dialog(start)
+
+    def _print_with_dialog(self, on_select):
+        """프린터 선택 대화상자를 표시하고 선택한 프린터 이름으로 on_select 호출"""
         try:
             import win32print
             import win32ui
@@ -865,7 +561,7 @@ class App(tk.Tk):
         def do_print():
             selected_printer = printer_var.get()
             select_win.destroy()
-            self._do_actual_print(selected_printer)
+            on_select(selected_printer)
 
         def cancel():
             select_win.destroy()
@@ -875,140 +571,229 @@ class App(tk.Tk):
         tk.Button(btn_frame, text="인쇄", width=10, bg="#22c55e", fg="white", command=do_print).pack(side="left", padx=10)
         tk.Button(btn_frame, text="취소", width=10, command=cancel).pack(side="left", padx=10)
 
-    def _do_actual_print(self, printer_name):
-        """선택한 프린터로 실제 인쇄 수행"""
+    @staticmethod
+    def _render_print_page(result, pattern_path, cancelled=None):
+        """인쇄용 A4 이미지(200 DPI) 생성 — 작업 스레드에서 호출 (Tk 사용 안 함). cancelled 가 설정되면 단계 사이에서 중단"""
+        from PIL import Image as PILImage, ImageDraw, ImageFont
+
+        # A4 크기 이미지 생성 (200 DPI)
+        DPI = 200
+        A4_WIDTH = int(8.27 * DPI)
+        A4_HEIGHT = int(11.69 * DPI)
+
+        img = PILImage.new('RGB', (A4_WIDTH, A4_HEIGHT), 'white')
+        draw = ImageDraw.Draw(img)
+
+        # 폰트 설정
         try:
-            import win32print
-            import win32ui
-            import win32con
-            from PIL import Image as PILImage, ImageDraw, ImageFont
+            win_dir = os.environ.get("WINDIR", "C:\\Windows")
+            font_path = os.path.join(win_dir, "Fonts", "malgun.ttf")
+            font_title = ImageFont.truetype(font_path, 36)
+            font_label = ImageFont.truetype(font_path, 24)
+            font_value = ImageFont.truetype(font_path, 22)
+        except:
+            font_title = ImageFont.load_default()
+            font_label = font_title
+            font_value = font_title
 
-            # A4 크기 이미지 생성 (200 DPI)
-            DPI = 200
-            A4_WIDTH = int(8.27 * DPI)
-            A4_HEIGHT = int(11.69 * DPI)
+        margin_l = int(30 * DPI / 25.4)
+        margin_t = int(30 * DPI / 25.4)
+        margin_r = int(20 * DPI / 25.4)
 
-            img = PILImage.new('RGB', (A4_WIDTH, A4_HEIGHT), 'white')
-            draw = ImageDraw.Draw(img)
+        # 제목
+        title = "스마트스템 발파설계"
+        try:
+            title_bbox = draw.textbbox((0, 0), title, font=font_title)
+            title_w = title_bbox[2] - title_bbox[0]
+        except:
+            title_w = 280
+        draw.text(((A4_WIDTH - title_w) // 2, margin_t), title, fill='black', font=font_title)
 
-            # 폰트 설정
-            try:
-                win_dir = os.environ.get("WINDIR", "C:\\Windows")
-                font_path = os.path.join(win_dir, "Fonts", "malgun.ttf")
-                font_title = ImageFont.truetype(font_path, 36)
-                font_label = ImageFont.truetype(font_path, 24)
-                font_value = ImageFont.truetype(font_path, 22)
-            except:
-                font_title = ImageFont.load_default()
-                font_label = font_title
-                font_value = font_title
+        # 출력날짜 (우측 정렬)
+        output_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+        date_text = f"출력날짜: {output_date}"
+        try:
+            font_date = ImageFont.truetype(font_path, 18)
+            date_bbox = draw.textbbox((0, 0), date_text, font=font_date)
+            date_w = date_bbox[2] - date_bbox[0]
+        except:
+            font_date = font_value
+            date_w = 180
+        draw.text((A4_WIDTH - margin_r - date_w, margin_t + 50), date_text, fill='#555555', font=font_date)
 
-            margin_l = int(30 * DPI / 25.4)
-            margin_t = int(30 * DPI / 25.4)
-            margin_r = int(20 * DPI / 25.4)
+        # Pa 타이틀
+        pa_title = PA_NAMES.get(result.get("Pa",5),"일반발파")
 
-            # 제목
-            title = "스마트스템 발파설계"
-            try:
-                title_bbox = draw.textbbox((0, 0), title, font=font_title)
-                title_w = title_bbox[2] - title_bbox[0]
-            except:
-                title_w = 280
-            draw.text(((A4_WIDTH - title_w) // 2, margin_t), title, fill='black', font=font_title)
+        y = margin_t + 70
+        draw.text((margin_l, y), f"발파공법 : {pa_title}", fill='black', font=font_label)
+        y += 50
 
-            # 출력날짜 (우측 정렬)
-            output_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-            date_text = f"출력날짜: {output_date}"
+        # 결과 데이터
+        lines = [
+            ("저항선(B)", f"{result['B']:.2f} m"),
+            ("공간격(S)", f"{result['S']:.2f} m"),
+            ("전색장(T)", f"{result['T']:.2f} m"),
+            ("장약장(h)", f"{result['h']:.2f} m"),
+            ("천공장(H)", f"{result['H']:.2f} m"),
+            ("계단높이(K_step)", f"{result['K_step']:.2f} m"),
+            ("장약량/공(Q)", f"{result['Q']} kg"),
+            ("비장약량(c1)", f"{result['c1']} kg/m³"),
+            ("폭약경(pd)", f"{result['pd']} m"),
+        ]
+
+        for lab, val in lines:
+            draw.text((margin_l, y), f"{lab} : {val}", fill='black', font=font_value)
+            y += 40
+
+        # 패턴 이미지 삽입 (인쇄 크기 파생본, 없으면 원본)
+        _check(cancelled)
+        if pattern_path and os.path.isfile(pattern_path):
             try:
-                font_date = ImageFont.truetype(font_path, 18)
-                date_bbox = draw.textbbox((0, 0), date_text, font=font_date)
-                date_w = date_bbox[2] - date_bbox[0]
+                with PILImage.open(assets.derivative(pattern_path, "print")) as src:
+                    pattern_img = assets.on_white(src).convert('RGB')   # 투명 영역은 흰색
+                max_w = A4_WIDTH // 2 - 40
+                max_h = A4_HEIGHT - margin_t * 4
+                pattern_img.thumbnail((max_w, max_h), PILImage.LANCZOS)
+                x_pos = A4_WIDTH // 2 + 20
+                y_pos = margin_t + 70
+                img.paste(pattern_img, (x_pos, y_pos))
             except:
-                font_date = font_value
-                date_w = 180
-            draw.text((A4_WIDTH - margin_r - date_w, margin_t + 50), date_text, fill='#555555', font=font_date)
-
-            # Pa 타이틀
-            pa_title = {
-                1:"미진동발파패턴",2:"정밀진동제어발파",3:"소규모진동제어발파",
-                4:"중규모진동제어발파",5:"일반발파",6:"대규모발파"
-            }.get(self.last_result.get("Pa",5),"일반발파")
-
-            y = margin_t + 70
-            draw.text((margin_l, y), f"발파공법 : {pa_title}", fill='black', font=font_label)
-            y += 50
-
-            # 결과 데이터
-            lines = [
-                ("저항선(B)", f"{self.last_result['B']:.2f} m"),
-                ("공간격(S)", f"{self.last_result['S']:.2f} m"),
-                ("전색장(T)", f"{self.last_result['T']:.2f} m"),
-                ("장약장(h)", f"{self.last_result['h']:.2f} m"),
-                ("천공장(H)", f"{self.last_result['H']:.2f} m"),
-                ("계단높이(K_step)", f"{self.last_result['K_step']:.2f} m"),
-                ("장약량/공(Q)", f"{self.last_result['Q']} kg"),
-                ("비장약량(c1)", f"{self.last_result['c1']} kg/m³"),
-                ("폭약경(pd)", f"{self.last_result['pd']} m"),
-            ]
-
-            for lab, val in lines:
-                draw.text((margin_l, y), f"{lab} : {val}", fill='black', font=font_value)
-                y += 40
-
-            # 패턴 이미지 삽입
-            if self.last_pattern_path and os.path.isfile(self.last_pattern_path):
-                try:
-                    pattern_img = PILImage.open(self.last_pattern_path)
-                    if pattern_img.mode != 'RGB':
-                        pattern_img = pattern_img.convert('RGB')
-                    max_w = A4_WIDTH // 2 - 40
-                    max_h = A4_HEIGHT - margin_t * 4
-                    pattern_img.thumbnail((max_w, max_h), PILImage.LANCZOS)
-                    x_pos = A4_WIDTH // 2 + 20
-                    y_pos = margin_t + 70
-                    img.paste(pattern_img, (x_pos, y_pos))
-                except:
-                    pass
-
-            # 프린터 DC 생성 및 인쇄
-            hDC = win32ui.CreateDC()
-            hDC.CreatePrinterDC(printer_name)
-
-            hDC.StartDoc("스마트스템 발파설계")
-            hDC.StartPage()
-
-            # 프린터 해상도
-            printer_width = hDC.GetDeviceCaps(win32con.HORZRES)
-            printer_height = hDC.GetDeviceCaps(win32con.VERTRES)
-
-            # 비율 유지
-            scale = min(printer_width / A4_WIDTH, printer_height / A4_HEIGHT)
-            new_w = int(A4_WIDTH * scale)
-            new_h = int(A4_HEIGHT * scale)
-
-            # 이미지를 BMP로 저장
-            temp_bmp = os.path.join(tempfile.gettempdir(), "print_temp.bmp")
-            img.save(temp_bmp, "BMP")
-
-            # 비트맵 로드 및 그리기
-            import win32gui
-            hBitmap = win32gui.LoadImage(0, temp_bmp, win32con.IMAGE_BITMAP, 0, 0, win32con.LR_LOADFROMFILE)
-
-            mem_dc = hDC.CreateCompatibleDC()
-            dib = win32ui.CreateBitmapFromHandle(hBitmap)
-            mem_dc.SelectObject(dib)
-            hDC.StretchBlt((0, 0), (new_w, new_h), mem_dc, (0, 0), (A4_WIDTH, A4_HEIGHT), win32con.SRCCOPY)
-
-            hDC.EndPage()
-            hDC.EndDoc()
-            mem_dc.DeleteDC()
-            hDC.DeleteDC()
-            win32gui.DeleteObject(hBitmap)
-
-            messagebox.showinfo("인쇄 완료", f"'{printer_name}'(으)로 인쇄를 전송했습니다.")
+                pass
+        return img
 
+    @staticmethod
+    def _send_to_printer(img, printer_name):
+        """A4 이미지를 선택한 프린터로 전송 (작업 스레드에서 호출)"""
+        import win32ui
+        import win32con
+        import win32gui
+
+        A4_WIDTH, A4_HEIGHT = img.size
+
+        # 프린터 DC 생성 및 인쇄
+        hDC = win32ui.CreateDC()
+        hDC.CreatePrinterDC(printer_name)
+
+        hDC.StartDoc("스마트스템 발파설계")
+        hDC.StartPage()
+
+        # 프린터 해상도
+        printer_width = hDC.GetDeviceCaps(win32con.HORZRES)
+        printer_height = hDC.GetDeviceCaps(win32con.VERTRES)
+
+        # 비율 유지
+        scale = min(printer_width / A4_WIDTH, printer_height / A4_HEIGHT)
+        new_w = int(A4_WIDTH * scale)
+        new_h = int(A4_HEIGHT * scale)
+
+        # 이미지를 BMP로 저장
+        temp_bmp = os.path.join(tempfile.gettempdir(), "print_temp.bmp")
+        img.save(temp_bmp, "BMP")
+
+        # 비트맵 로드 및 그리기
+        hBitmap = win32gui.LoadImage(0, temp_bmp, win32con.IMAGE_BITMAP, 0, 0, win32con.LR_LOADFROMFILE)
+
+        mem_dc = hDC.CreateCompatibleDC()
+        dib = win32ui.CreateBitmapFromHandle(hBitmap)
+        mem_dc.SelectObject(dib)
+        hDC.StretchBlt((0, 0), (new_w, new_h), mem_dc, (0, 0), (A4_WIDTH, A4_HEIGHT), win32con.SRCCOPY)
+
+        hDC.EndPage()
+        hDC.EndDoc()
+        mem_dc.DeleteDC()
+        hDC.DeleteDC()
+        win32gui.DeleteObject(hBitmap)
+
+    # ---------- 백그라운드 작업 (PDF 저장/인쇄) ----------
+    def _submit_job(self, label, work, on_done, error_title):
+        """work(cancelled) 를 작업 스레드에 맡김. 결과는 메인 스레드에서 on_done(결과), 예외는 오류 대화상자"""
+        job = _Job(label, work, on_done, error_title)
+        job.future = self._executor.submit(self._run_job, job)
+        self._jobs.append(job)
+        self._update_job_status()
+        if self._poll_id is None:
+            self._poll_id = self.after(100, self._poll_jobs)
+
+    def _run_job(self, job):
+        # 작업 스레드: Tk 를 건드리지 않고 결과만 큐에 넣음
+        if job.cancelled.is_set():
+            return
+        try:
+            self._job_results.put((job, job.work(job.cancelled), None))
+        except _Cancelled:
+            pass                 # 취소: 다음 단계로 가지 않고 작업 스레드를 바로 비움
         except Exception as e:
-            messagebox.showerror("인쇄 오류", f"인쇄 중 오류가 발생했습니다:\n{e}")
+            self._job_results.put((job, None, e))
+
+    def _poll_jobs(self):
+        self._poll_id = None
+        while True:
+            try:
+                job, out, err = self._job_results.get_nowait()
+            except queue.Empty:
+                break
+            if job in self._jobs:
+                self._jobs.remove(job)
+            if job.cancelled.is_set():
+                continue
+            if err is not None:
+                messagebox.showerror(job.error_title, f"{job.label} 중 오류가 발생했습니다:\n{err}")
+            else:
+                job.on_done(out)
+        self._jobs = [j for j in self._jobs if not j.future.cancelled()]
+        self._update_job_status()
+        if self._jobs:
+            self._poll_id = self.after(100, self._poll_jobs)
+
+    def _update_job_status(self):
+        if not self._jobs:
+            self.job_progress.stop()
+            self.job_frame.pack_forget()
+            return
+        waiting = len(self._jobs) - 1
+        self.job_label.config(text=f"{self._jobs[0].label} 중…" + (f" (대기 {waiting}건)" if waiting else ""))
+        if not self.job_frame.winfo_ismapped():
+            self.job_frame.pack(side="left", padx=self.S(10))
+            self.job_progress.start(15)
+
+    def cancel_jobs(self):
+        """
+        대기 중 작업은 취소, 실행 중 작업은 다음 단계 사이에서 중단 (파일 저장/인쇄 전송 안 함).
+        실행 중이던 작업의 늦은 결과는 다음 확인 때 버림
+        """
+        for job in self._jobs:
+            job.cancelled.set()
+            job.future.cancel()
+        self._jobs = []
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._update_job_status()
+
+    def _on_close(self):
+        self.cancel_jobs()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def _check(cancelled):
+    """작업 단계 사이에서 호출: 취소되었으면 _Cancelled"""
+    if cancelled is not None and cancelled.is_set():
+        raise _Cancelled
+
+
+class _Job:
+    def __init__(self, label, work, on_done, error_title):
+        self.label = label
+        self.work = work
+        self.on_done = on_done
+        self.error_title = error_title
+        self.cancelled = threading.Event()
+        self.future = None
 
 
 if __name__ == "__main__":
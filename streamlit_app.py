@@ -5,10 +5,18 @@
 """
 import streamlit as st
 import streamlit.components.v1 as components
-import math
-import os
-import io
-from datetime import datetime
+import json
+from packaging.version import Version
+
+from blasting.core import PA_NAMES, PURPOSE_K1
+from blasting.cache import cached_compute
+from blasting import diagram, printpage
+from blasting.report import cached_pdf, content_key, pdf_available
+
+# download_button 의 data 에 함수를 넘기면 클릭 시점에 생성 (Streamlit 1.52 부터)
+DEFERRED_DOWNLOAD = Version(st.__version__) >= Version("1.52.0")
+# 인쇄 문서를 static/print/ 에서 내려받음 (.streamlit/config.toml: server.enableStaticServing)
+STATIC_PRINT = bool(st.get_option("server.enableStaticServing"))
 
 # 페이지 설정
 st.set_page_config(
@@ -130,204 +138,6 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-# ================= 계산 로직 =================
-def compute(K=None, n=None, Vel=None, D=None, Q1=None, C=0.33, V=1.2,
-            pd_choice=None, pd_text=None, k1=0.7, V1_theory=1.2):
-    def rnd(x, n): return round(x, n)
-
-    have_all = all([K, n, Vel, D])
-    Q2 = rnd((D**2) * ((Vel/K)**(2/(-n))), 2) if have_all else None
-
-    if Q1 is None:
-        if not have_all:
-            raise ValueError("Q1이 비어있을 때는 K, n, Vel, D를 모두 입력해야 합니다.")
-        Q3 = Q2
-    else:
-        Q3 = rnd(min(Q1, Q2), 2) if have_all else rnd(Q1, 2)
-
-    Pa = 1 if Q3 < 0.125 else 2 if Q3 < 0.5 else 3 if Q3 < 1.6 else 4 if Q3 < 5 else 5 if Q3 < 15 else 6
-
-    pd = None
-    pd_from_custom = False
-    if pd_text:
-        try:
-            pd = float(pd_text)
-            pd_from_custom = True
-        except: pass
-    if pd is None and pd_choice:
-        pd = float(pd_choice)
-    if pd is None:
-        pd = 0.032 if Pa in [1,2,3] else 0.050 if Pa in [4,5] else 0.076
-    pd = rnd(pd, 3)
-
-    pd_msg = None
-    if Pa in (1,2) and (pd_from_custom or pd_choice) and pd > 0.032:
-        pd = 0.032
-        pd_msg = "폭약경이 적합하지 않아 0.032m로 조정되었습니다."
-
-    def anfo(p): return (1000*0.815*3.1415*(p**2))/4.0, 1.0, 0.1
-    tol = 1e-9
-
-    W1, h1, nu = {
-        1: (0.12, 0.2, 0.5), 2: (0.25, 0.295, 0.5)
-    }.get(Pa, (0.25, 0.295, 0.5))
-
-    if Pa >= 3:
-        if pd_from_custom:
-            W1, h1, nu = anfo(pd)
-        elif abs(pd-0.050) < tol:
-            W1, h1, nu = 1.0, 0.42, 0.5
-        elif abs(pd-0.065) < tol:
-            W1, h1, nu = 2.0, 0.52, 0.5 if Pa < 6 else 1.0
-
-    if pd_from_custom and Q3 >= 0.5:
-        Q = float(Q3)
-        h = h1 * (Q3/W1)
-    else:
-        Q4 = int((Q3/W1)*2.0) if W1 <= 2.0 else int(Q3)
-        Q = (Q4/2.0)*W1 if W1 <= 2.0 else float(Q4)
-        h = 0.95 * h1 * Q / W1
-
-    denom = C * V1_theory * (0.7*h + 0.77*(Q**(1/3)) + 10*pd)
-    if denom <= 0: raise ValueError("계산 오류")
-
-    B1 = 0.94 * math.sqrt(Q/denom)
-    S1 = V1_theory * B1
-
-    if abs(V-1.2) < 1e-12:
-        B, S = rnd(B1, 2), rnd(S1, 2)
-    else:
-        B = math.sqrt((B1*S1)/V)
-        S = V * B
-        B, S = rnd(B, 2), rnd(S, 2)
-
-    T = rnd((k1*(pd**-0.25) if Pa==1 else k1*(pd**-0.18)) * math.sqrt(B*S), 2)
-    H = rnd(T + h, 2)
-    K_step = rnd(H - 0.2*B, 2)
-    c1 = rnd(Q/(B*S*K_step) if B*S*K_step else 0, 2)
-
-    return {"B": B, "S": S, "T": T, "h": rnd(H-T, 2), "H": H, "Q": Q,
-            "c1": c1, "K_step": K_step, "Pa": Pa, "pd": pd, "_msg": pd_msg}
-
-
-def get_pattern_path(result):
-    # Pa 값에 따라 다른 패턴 이미지 사용
-    pa = result.get('Pa', 5)
-    # Pa 1,2 -> 패턴1, Pa 3 -> 패턴2, Pa 4 -> 패턴3, Pa 5 -> 패턴4, Pa 6 -> 패턴5
-    pattern_map = {1: 1, 2: 1, 3: 2, 4: 3, 5: 4, 6: 5}
-    idx = pattern_map.get(pa, 4)
-    base = os.path.dirname(__file__)
-    path = os.path.join(base, "발파프로그램", f"발파패턴{idx}_1.jpg")
-    return (path, idx) if os.path.exists(path) else (None, idx)
-
-
-def make_pdf(result, img_path):
-    try:
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib.utils import ImageReader
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
-    except: return None
-
-    font = None
-    font_paths = [
-        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-        "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf",
-        "/usr/share/fonts/opentype/nanum/NanumGothic.otf",
-        "C:\\Windows\\Fonts\\malgun.ttf",
-        "C:\\Windows\\Fonts\\NanumGothic.ttf",
-    ]
-    for p in font_paths:
-        if os.path.isfile(p):
-            try:
-                pdfmetrics.registerFont(TTFont("KOR", p))
-                font = "KOR"
-                break
-            except: pass
-
-    buf = io.BytesIO()
-    c = canvas.Canvas(buf, pagesize=A4)
-    W, H = A4
-    mm = lambda x: x * 72.0 / 25.4
-
-    def setf(s):
-        try: c.setFont(font or "Helvetica", s)
-        except: c.setFont("Helvetica", s)
-
-    # 타이틀
-    setf(16)
-    c.drawCentredString(W/2, H-mm(25), "스마트스템 발파설계")
-
-    # 출력날짜 (우측 정렬)
-    setf(10)
-    output_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-    c.drawRightString(W - mm(15), H-mm(35), f"출력날짜: {output_date}")
-
-    # Pa 이름
-    pa_names = {1:"미진동발파패턴", 2:"정밀진동제어발파", 3:"소규모진동제어발파",
-                4:"중규모진동제어발파", 5:"일반발파", 6:"대규모발파"}
-    setf(12)
-    c.drawString(mm(25), H-mm(40), pa_names.get(result['Pa'], '일반발파'))
-
-    # 테이블 그리기
-    table_x = mm(25)
-    table_y = H - mm(50)
-    col1_w = mm(35)  # 항목 열 너비
-    col2_w = mm(30)  # 값 열 너비
-    row_h = mm(8)    # 행 높이
-
-    rows = [
-        ("항목", "값"),
-        ("저항선 (B)", f"{result['B']:.2f} m"),
-        ("공간격 (S)", f"{result['S']:.2f} m"),
-        ("전색장 (T)", f"{result['T']:.2f} m"),
-        ("장약장 (h)", f"{result['h']:.2f} m"),
-        ("천공장 (H)", f"{result['H']:.2f} m"),
-        ("계단높이", f"{result['K_step']:.2f} m"),
-        ("장약량/공 (Q)", f"{result['Q']} kg"),
-        ("비장약량 (c1)", f"{result['c1']} kg/m³"),
-        ("폭약경 (pd)", f"{result['pd']} m"),
-    ]
-
-    # 테이블 테두리 및 텍스트
-    c.setStrokeColorRGB(0.3, 0.3, 0.3)
-    c.setLineWidth(0.5)
-    for i, (label, value) in enumerate(rows):
-        y = table_y - i * row_h
-        # 셀 테두리
-        c.rect(table_x, y - row_h, col1_w, row_h)
-        c.rect(table_x + col1_w, y - row_h, col2_w, row_h)
-        # 헤더 배경
-        if i == 0:
-            c.setFillColorRGB(0.94, 0.94, 0.94)
-            c.rect(table_x, y - row_h, col1_w + col2_w, row_h, fill=1)
-            c.setFillColorRGB(0, 0, 0)
-        # 텍스트
-        setf(9 if i == 0 else 9)
-        c.drawString(table_x + mm(2), y - row_h + mm(2.5), label)
-        c.drawString(table_x + col1_w + mm(2), y - row_h + mm(2.5), value)
-
-    # 이미지 (오른쪽) - 표와 높이 맞춤
-    if img_path and os.path.isfile(img_path):
-        try:
-            ir = ImageReader(img_path)
-            iw, ih = ir.getSize()
-            img_x = table_x + col1_w + col2_w + mm(15)
-            img_max_w = W - img_x - mm(15)
-            table_height = len(rows) * row_h  # 표 전체 높이
-            img_max_h = table_height  # 이미지 높이를 표 높이에 맞춤
-            scale = min(img_max_w/iw, img_max_h/ih)
-            img_y = table_y - table_height  # 표 하단과 맞춤
-            c.drawImage(ir, img_x, img_y, iw*scale, ih*scale)
-        except: pass
-
-    c.showPage()
-    c.save()
-    buf.seek(0)
-    return buf.getvalue()
-
-
 # ================= UI =================
 # 타이틀 (인쇄시 숨김)
 st.markdown('<div class="no-print">', unsafe_allow_html=True)
@@ -335,70 +145,80 @@ st.title("Smart Stem")
 st.caption("Smart Stem v1")
 st.markdown('</div>', unsafe_allow_html=True)
 
-# 입력 폼 (인쇄시 숨김)
-st.markdown('<div class="no-print">', unsafe_allow_html=True)
-with st.form("calc_form"):
-    st.subheader("입력값")
 
-    c1, c2 = st.columns(2)
-    with c1:
-        Q1_in = st.text_input("공당장약량 (kg)", placeholder="미입력시 자동계산",
-                              help="입력하지 않으면 이격거리에 따라 산출")
-        K_in = st.number_input("K값", value=200.0,
-                               help="시험발파추정식 변경 가능")
-        n_in = st.number_input("n값", value=-1.60, format="%.2f",
-                               help="시험발파추정식 변경 가능")
-        Vel_in = st.number_input("허용진동기준치 (cm/sec)", value=0.30, format="%.2f",
-                                 help="보안물건의 허용기준치 입력")
+# ================= 입력 / 결과 / 출력 =================
+# 입력 위젯 key → 기본값. 폼/실시간 fragment 가 같은 key 를 쓰고, 값은 session_state 에 유지
+INPUT_DEFAULTS = dict(Q1_in="", K_in=200.0, n_in=-1.60, Vel_in=0.30, D_in="", C_in=0.33, V_in=1.2,
+                      pd_sel="자동", pd_custom="", k1_sel=next(iter(PURPOSE_K1)))
 
-    with c2:
-        D_in = st.text_input("보안물건 거리 (m)", placeholder="미입력시 무시",
-                             help="진동을 고려하고 싶은 경우 입력")
-        C_in = st.number_input("발파계수", value=0.33, format="%.2f",
-                               help="암질에 따라 풍화암 0.25 ~ 경암 0.5")
-        V_in = st.number_input("공간격비율", value=1.2, format="%.2f",
-                               help="보통 1.0 ~ 1.25 범위 설정함")
-        pd_sel = st.selectbox("폭약직경", ["자동", "0.032", "0.050", "0.065", "직접입력"],
-                              help="단위(m), 선택하지 않으면 자동선택")
-        pd_custom = st.text_input("폭약직경 직접입력 (m)", placeholder="직접입력 선택시 입력",
-                                  help="위에서 '직접입력' 선택 시 이 값이 사용됩니다")
-
-    k1_sel = st.radio("목적", ["비산제어(0.7)", "파쇄도개선(0.55)", "광산채석장(0.5)"], horizontal=True)
-
-    submitted = st.form_submit_button("계산", use_container_width=True)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# 계산 실행
-if submitted:
-    try:
-        Q1 = float(Q1_in) if Q1_in.strip() else None
-        D = float(D_in) if D_in.strip() else None
-        pd_choice = pd_sel if pd_sel in ["0.032", "0.050", "0.065"] else None
-        k1 = {"비산제어(0.7)": 0.7, "파쇄도개선(0.55)": 0.55, "광산채석장(0.5)": 0.5}[k1_sel]
 
-        result = compute(K=K_in, n=n_in, Vel=Vel_in, D=D, Q1=Q1, C=C_in, V=V_in,
-                        pd_choice=pd_choice, pd_text=pd_custom if pd_sel=="직접입력" else None, k1=k1)
+def _keep_inputs():
+    """
+    입력값을 session_state 에 유지 (기본값 채움 + 다시 대입).
+    '실시간 계산' 전환으로 위젯이 한 번 그려지지 않아도 값이 지워지지 않음
+    """
+    for k, default in INPUT_DEFAULTS.items():
+        st.session_state[k] = st.session_state.get(k, default)
 
-        st.session_state["result"] = result
-        st.session_state["img_path"], st.session_state["idx"] = get_pattern_path(result)
 
-        if result.get("_msg"):
-            st.warning(result["_msg"])
+def _touch():
+    """입력 변경 콜백: 입력 세대(input_gen) 증가 → 실시간 모드는 세대가 바뀐 실행에서만 계산"""
+    st.session_state["input_gen"] = st.session_state.get("input_gen", 0) + 1
 
-    except Exception as e:
-        st.error(f"오류: {e}")
 
-# 결과 표시
-if "result" in st.session_state:
-    r = st.session_state["result"]
-    img = st.session_state.get("img_path")
+def _inputs(live=False):
+    """
+    입력 위젯 (폼 또는 실시간 fragment 안에서 호출) → 입력값 dict
+    live=True 이면 위젯마다 on_change=_touch (폼 안 위젯에는 콜백을 달 수 없음)
+    """
+    cb = {"on_change": _touch} if live else {}
+    c1, c2 = st.columns(2)
+    with c1:
+        st.text_input("공당장약량 (kg)", placeholder="미입력시 자동계산", key="Q1_in", **cb,
+                      help="입력하지 않으면 이격거리에 따라 산출")
+        st.number_input("K값", key="K_in", **cb,
+                        help="시험발파추정식 변경 가능")
+        st.number_input("n값", format="%.2f", key="n_in", **cb,
+                        help="시험발파추정식 변경 가능")
+        st.number_input("허용진동기준치 (cm/sec)", format="%.2f", key="Vel_in", **cb,
+                        help="보안물건의 허용기준치 입력")
 
+    with c2:
+        st.text_input("보안물건 거리 (m)", placeholder="미입력시 무시", key="D_in", **cb,
+                      help="진동을 고려하고 싶은 경우 입력")
+        st.number_input("발파계수", format="%.2f", key="C_in", **cb,
+                        help="암질에 따라 풍화암 0.25 ~ 경암 0.5")
+        st.number_input("공간격비율", format="%.2f", key="V_in", **cb,
+                        help="보통 1.0 ~ 1.25 범위 설정함")
+        st.selectbox("폭약직경", ["자동", "0.032", "0.050", "0.065", "직접입력"], key="pd_sel", **cb,
+                     help="단위(m), 선택하지 않으면 자동선택")
+        st.text_input("폭약직경 직접입력 (m)", placeholder="직접입력 선택시 입력", key="pd_custom", **cb,
+                      help="위에서 '직접입력' 선택 시 이 값이 사용됩니다")
+
+    st.radio("목적", list(PURPOSE_K1), horizontal=True, key="k1_sel", **cb)
+    return {k: st.session_state[k] for k in INPUT_DEFAULTS}
+
+
+def _compute_args(v):
+    """입력값 → compute 인자. 숫자 형식 오류는 ValueError"""
+    return dict(K=v["K_in"], n=v["n_in"], Vel=v["Vel_in"],
+                D=float(v["D_in"]) if v["D_in"].strip() else None,
+                Q1=float(v["Q1_in"]) if v["Q1_in"].strip() else None,
+                C=v["C_in"], V=v["V_in"],
+                pd_choice=v["pd_sel"] if v["pd_sel"] in ["0.032", "0.050", "0.065"] else None,
+                pd_text=v["pd_custom"] if v["pd_sel"] == "직접입력" else None,
+                k1=PURPOSE_K1[v["k1_sel"]])
+
+
+def _store(result):
+    st.session_state["result"] = result
+
+
+def _show_result(r):
+    """결과 표 + 패턴 도면 (실제 B, S, T, h, H 로 그린 SVG)"""
     st.divider()
 
-    pa_names = {1:"미진동발파패턴", 2:"정밀진동제어발파", 3:"소규모진동제어발파",
-                4:"중규모진동제어발파", 5:"일반발파", 6:"대규모발파"}
-
-    st.markdown(f"### {pa_names.get(r['Pa'], '일반발파')}")
+    st.markdown(f"### {PA_NAMES.get(r['Pa'], '일반발파')}")
 
     # Pa에 따라 패딩 값 설정 (이미지 비율에 맞춤)
     padding_map = {1: 7, 2: 7, 3: 8, 4: 9, 5: 10, 6: 12}
@@ -430,123 +250,144 @@ if "result" in st.session_state:
 """)
 
     with col2:
-        if img and os.path.exists(img):
-            st.image(img, use_container_width=True)
-        else:
-            st.info("패턴 이미지 없음")
-
-    # 버튼
+        st.markdown(diagram.svg(r), unsafe_allow_html=True)
+
+
+def _pdf_button(r):
+    # PDF는 다운로드 시점에만 생성 (내용 해시 캐시, 세션 간 공유)
+    if pdf_available():
+        if DEFERRED_DOWNLOAD:
+            st.download_button("PDF 저장", lambda: cached_pdf(r, None), "발파설계결과.pdf",
+                               "application/pdf", use_container_width=True)
+        elif st.session_state.get("pdf_key") == content_key(r, None):
+            st.download_button("PDF 저장", cached_pdf(r, None), "발파설계결과.pdf",
+                               "application/pdf", use_container_width=True)
+        elif st.button("PDF 만들기", use_container_width=True):
+            st.session_state["pdf_key"] = content_key(r, None)
+            st.rerun()
+
+
+def _print_button(r):
+    # 인쇄 문서는 static/print/ 에 내용 해시 이름으로 한 번만 기록 → 버튼에는 문서 키만 담음
+    # (정적 파일 서비스가 꺼져 있으면 문서를 버튼에 직접 넣음)
+    if STATIC_PRINT:
+        key = printpage.publish(r, None)
+        load = f"""var dir = new URL('{printpage.PRINT_URL}', document.baseURI).href;
+        fetch(dir + '{key}.json').then(function(res) {{ return res.json(); }}).then(function(doc) {{
+            show(doc.html.replace('<head>', '<head><base href="' + dir + '">'));
+        }}).catch(function() {{ w.close(); alert('인쇄 문서를 불러오지 못했습니다.'); }});"""
+    else:
+        load = "show(" + json.dumps(printpage.print_html(r)).replace("</", "<\\/") + ");"
+
+    # 인쇄 버튼을 HTML로 직접 렌더링 (PDF 버튼 스타일과 동일)
+    components.html(f'''
+    <style>
+    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+    button {{ display: flex; align-items: center; justify-content: center; width: 100%;
+        padding: 0.25rem 0.75rem; min-height: 38.4px; background-color: rgb(19, 23, 32);
+        color: rgb(250, 250, 250); border: 1px solid rgba(250, 250, 250, 0.2); border-radius: 0.5rem;
+        cursor: pointer; font-size: 1rem; font-weight: 400; font-family: "Source Sans Pro", sans-serif; }}
+    button:hover {{ border-color: rgb(250, 250, 250); }}
+    button:active {{ background-color: rgb(250, 250, 250); color: rgb(19, 23, 32); }}
+    </style>
+    <button onclick="openPrint()">인쇄</button>
+    <script>
+    function openPrint() {{
+        // 팝업 차단을 피하려면 클릭 처리 안에서 바로 창을 열어야 함
+        var w = window.open('', '_blank', 'width=800,height=600');
+        if (!w) {{ alert('팝업이 차단되었습니다. 팝업 차단을 해제해주세요.'); return; }}
+        function show(html) {{ w.document.write(html); w.document.close(); }}
+        {load}
+    }}
+    </script>
+    ''', height=42)
+
+
+def _output_buttons(r, lazy_print=False):
+    """PDF 저장 / 인쇄 버튼. lazy_print: '인쇄 준비'를 누른 결과에만 인쇄 HTML 생성 (실시간 모드)"""
     st.divider()
     b1, b2, _ = st.columns([1, 1, 2])
-    pdf = make_pdf(r, img)
-
     with b1:
-        if pdf:
-            st.download_button("PDF 저장", pdf, "발파설계결과.pdf", "application/pdf", use_container_width=True)
-
+        _pdf_button(r)
     with b2:
-        # 인쇄용 HTML 생성
-        import base64
-        img_b64 = ""
-        if img and os.path.exists(img):
-            with open(img, "rb") as f:
-                img_b64 = base64.b64encode(f.read()).decode()
-
-        pa_name = pa_names.get(r['Pa'], '일반발파')
-        output_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-        print_html = f'''<!DOCTYPE html>
-<html><head><meta charset="UTF-8"><title>스마트스템 발파설계</title>
-<style>
-body {{ font-family: 'Malgun Gothic', sans-serif; padding: 30px; }}
-h2 {{ text-align: center; margin-bottom: 5px; }}
-.date-line {{ text-align: right; margin-bottom: 15px; font-size: 12px; color: #555; }}
-h3 {{ margin-bottom: 20px; }}
-.container {{ display: flex; gap: 30px; align-items: flex-start; }}
-.left {{ flex: 0 0 auto; }}
-.right {{ flex: 1; display: flex; align-items: flex-start; }}
-table {{ border-collapse: collapse; }}
-th, td {{ border: 1px solid #333; padding: 8px 15px; text-align: left; }}
-th {{ background: #f0f0f0; }}
-.right img {{ height: 380px; width: auto; object-fit: contain; }}
-</style>
-</head><body>
-<h2>스마트스템 발파설계</h2>
-<div class="date-line">출력날짜: {output_date}</div>
-<h3>{pa_name}</h3>
-<div class="container">
-<div class="left">
-<table>
-<tr><th>항목</th><th>값</th></tr>
-<tr><td>저항선 (B)</td><td>{r['B']:.2f} m</td></tr>
-<tr><td>공간격 (S)</td><td>{r['S']:.2f} m</td></tr>
-<tr><td>전색장 (T)</td><td>{r['T']:.2f} m</td></tr>
-<tr><td>장약장 (h)</td><td>{r['h']:.2f} m</td></tr>
-<tr><td>천공장 (H)</td><td>{r['H']:.2f} m</td></tr>
-<tr><td>계단높이</td><td>{r['K_step']:.2f} m</td></tr>
-<tr><td>장약량/공 (Q)</td><td>{r['Q']} kg</td></tr>
-<tr><td>비장약량 (c1)</td><td>{r['c1']} kg/m³</td></tr>
-<tr><td>폭약경 (pd)</td><td>{r['pd']} m</td></tr>
-</table>
-</div>
-<div class="right">
-{"<img src='data:image/jpeg;base64," + img_b64 + "'/>" if img_b64 else "<p>패턴 이미지 없음</p>"}
-</div>
-</div>
-<script>window.onload=function(){{window.print();}}</script>
-</body></html>'''
-
-        print_html_b64 = base64.b64encode(print_html.encode('utf-8')).decode('ascii')
-
-        # 인쇄 버튼을 HTML로 직접 렌더링 (PDF 버튼 스타일과 동일)
-        components.html(f'''
-        <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ margin: 0; padding: 0; }}
-        button {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            width: 100%;
-            padding: 0.25rem 0.75rem;
-            min-height: 38.4px;
-            background-color: rgb(19, 23, 32);
-            color: rgb(250, 250, 250);
-            border: 1px solid rgba(250, 250, 250, 0.2);
-            border-radius: 0.5rem;
-            cursor: pointer;
-            font-size: 1rem;
-            font-weight: 400;
-            font-family: "Source Sans Pro", sans-serif;
-        }}
-        button:hover {{
-            border-color: rgb(250, 250, 250);
-            color: rgb(250, 250, 250);
-        }}
-        button:active {{
-            background-color: rgb(250, 250, 250);
-            color: rgb(19, 23, 32);
-        }}
-        </style>
-        <button onclick="openPrint()">인쇄</button>
-        <script>
-        function openPrint() {{
-            var w = window.open('', '_blank', 'width=800,height=600');
-            if(w) {{
-                // UTF-8 디코딩
-                var binary = atob('{print_html_b64}');
-                var bytes = new Uint8Array(binary.length);
-                for (var i = 0; i < binary.length; i++) {{
-                    bytes[i] = binary.charCodeAt(i);
-                }}
-                var html = new TextDecoder('utf-8').decode(bytes);
-                w.document.write(html);
-                w.document.close();
-            }} else {{
-                alert('팝업이 차단되었습니다. 팝업 차단을 해제해주세요.');
-            }}
-        }}
-        </script>
-        ''', height=42)
+        if lazy_print and st.session_state.get("print_key") != content_key(r, None):
+            if not st.button("인쇄 준비", use_container_width=True):
+                return
+            st.session_state["print_key"] = content_key(r, None)
+        _print_button(r)
+
+
+@st.fragment
+def _live_panel():
+    """
+    실시간 모드: 입력이 바뀌면 이 fragment 만 다시 실행 (head/CSS 주입 등 페이지 나머지는 그대로)
+    - 위젯 on_change(_touch) 가 입력 세대를 올림. 세대가 그대로인 실행(버튼 클릭 등)은 계산 생략,
+      바뀌었을 때만 프로세스 공용 결과 캐시(cached_compute)로 계산
+    - debounce 는 브라우저 쪽: 텍스트/숫자 입력은 Enter 또는 포커스 이동 때만 값을 보내므로
+      타자 중에는 재실행이 없음 (서버에서 대기하지 않음)
+    - 입력 중간 상태(숫자 형식 오류)에서는 오류와 함께 직전 결과 유지
+    - PDF 는 다운로드 클릭 시, 인쇄 HTML 은 '인쇄 준비' 클릭 시에만 생성
+    """
+    st.markdown('<div class="no-print">', unsafe_allow_html=True)
+    st.subheader("입력값")
+    v = _inputs(live=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    gen = st.session_state.get("input_gen", 0)
+    if gen != st.session_state.get("live_gen"):
+        st.session_state["live_gen"] = gen
+        try:
+            _store(cached_compute(**_compute_args(v)))
+        except Exception as e:
+            st.session_state["live_error"] = f"오류: {e}"
+        else:
+            st.session_state.pop("live_error", None)
+    if "live_error" in st.session_state:
+        st.error(st.session_state["live_error"])
+
+    if "result" in st.session_state:
+        r = st.session_state["result"]
+        if r.get("_msg"):
+            st.warning(r["_msg"])
+        _show_result(r)
+        _output_buttons(r, lazy_print=True)
+
+
+# 실시간 모드 전환 (인쇄시 숨김)
+_keep_inputs()
+st.markdown('<div class="no-print">', unsafe_allow_html=True)
+live = st.toggle("실시간 계산", on_change=_touch,
+                 help="입력을 바꾸면 계산 버튼 없이 결과만 바로 갱신 (태블릿 권장)")
+st.markdown('</div>', unsafe_allow_html=True)
+
+if live:
+    _live_panel()
+else:
+    # 입력 폼 (인쇄시 숨김)
+    st.markdown('<div class="no-print">', unsafe_allow_html=True)
+    with st.form("calc_form"):
+        st.subheader("입력값")
+        v = _inputs()
+        submitted = st.form_submit_button("계산", use_container_width=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # 계산 실행
+    if submitted:
+        try:
+            result = cached_compute(**_compute_args(v))
+            _store(result)
+
+            if result.get("_msg"):
+                st.warning(result["_msg"])
+
+        except Exception as e:
+            st.error(f"오류: {e}")
+
+    # 결과 표시
+    if "result" in st.session_state:
+        r = st.session_state["result"]
+        _show_result(r)
+        _output_buttons(r)
 
 st.markdown('<div class="no-print">', unsafe_allow_html=True)
 st.divider()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from blasting import assets
+
+
+def _transparent_png(path, mode="RGBA"):
+    """투명 배경 + 가운데 검정 사각형"""
+    im = Image.new("RGBA", (2000, 1200), (0, 0, 0, 0))
+    im.paste((0, 0, 0, 255), (900, 500, 1100, 700))
+    if mode == "P":
+        im = im.convert("P", palette=Image.ADAPTIVE)
+        im.info["transparency"] = im.getpixel((0, 0))
+        im.save(path, transparency=im.info["transparency"])
+    else:
+        im.convert(mode).save(path)
+    return path
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "LA", "P"])
+def test_on_white(tmp_path, mode):
+    with Image.open(_transparent_png(tmp_path / "t.png", mode)) as im:
+        flat = assets.on_white(im)
+    assert flat.mode in ("RGB", "L")
+    assert flat.convert("L").getpixel((10, 10)) == 255
+    assert flat.convert("L").getpixel((1000, 600)) == 0
+
+
+def test_build_composites_transparency(tmp_path):
+    src = _transparent_png(tmp_path / "t.png")
+    out = tmp_path / "assets"
+    assert assets.build([str(src)], str(out)) == (1, 1)
+
+    e = assets.entry(str(src), str(out))
+    assert e["bbox"] == [900, 500, 1100, 700]            # 투명 영역은 여백으로 트리밍
+    with Image.open(assets.derivative(str(src), "pdf", str(out))) as d:
+        assert d.format == "JPEG"
+        assert d.convert("L").getpixel((5, 5)) > 245
+
+    assert assets.build([str(src)], str(out)) == (0, 1)    # 같은 내용은 다시 만들지 않음
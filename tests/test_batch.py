@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import math
+
+import numpy as np
+import pytest
+
+from blasting.batch import OUTPUT_COLUMNS, compute_batch, max_charge_batch
+from blasting.core import PD_FORCED_MSG, compute, max_charge
+
+
+def _cases(n, seed=0):
+    rng = np.random.default_rng(seed)
+    Q1 = np.round(rng.uniform(0.05, 40, n), 2)
+    Q1[rng.random(n) < 0.3] = np.nan
+    D = np.round(rng.uniform(5, 400, n), 1)
+    D[np.isnan(Q1) & (rng.random(n) < 0.5)] = np.round(rng.uniform(20, 100), 1)
+    D[~np.isnan(Q1) & (rng.random(n) < 0.5)] = np.nan
+    pd = rng.choice([np.nan, 0.032, 0.05, 0.065, 0.045, 0.1], n)
+    return dict(K=np.round(rng.uniform(100, 300, n), 1), n=np.round(rng.uniform(-1.9, -1.4, n), 2),
+                Vel=rng.choice([0.2, 0.3, 0.5, 1.0], n), D=D, Q1=Q1,
+                C=rng.choice([0.25, 0.33, 0.5], n), V=rng.choice([1.0, 1.2, 1.25], n),
+                pd=pd, pd_custom=~np.isnan(pd) & (rng.random(n) < 0.3),
+                k1=rng.choice([0.7, 0.55, 0.5], n))
+
+
+def _scalar(c, i):
+    opt = lambda k: None if math.isnan(c[k][i]) else float(c[k][i])
+    pd = opt("pd")
+    custom = bool(c["pd_custom"][i]) and pd is not None
+    return compute(K=opt("K"), n=opt("n"), Vel=opt("Vel"), D=opt("D"), Q1=opt("Q1"),
+                   C=float(c["C"][i]), V=float(c["V"][i]),
+                   pd_choice=None if custom else pd, pd_text=repr(pd) if custom else None,
+                   k1=float(c["k1"][i]))
+
+
+def test_matches_compute_row_by_row():
+    c = _cases(3000)
+    out = compute_batch(**c)
+    assert set(out) == set(OUTPUT_COLUMNS)
+    for i in range(3000):
+        r = _scalar(c, i)
+        assert {k: (out[k][i].item() if hasattr(out[k][i], "item") else out[k][i])
+                for k in OUTPUT_COLUMNS} == r, i
+
+
+def test_scalar_broadcast():
+    out = compute_batch(Q1=[0.1, 2.0, 30.0], C=0.33)
+    assert list(out["Pa"]) == [1, 4, 6]
+    for i, q in enumerate([0.1, 2.0, 30.0]):
+        assert out["B"][i] == compute(Q1=q)["B"]
+
+
+def test_forced_pd_message():
+    out = compute_batch(Q1=[0.3, 3.0], pd=0.065)
+    assert list(out["pd"]) == [0.032, 0.065]
+    assert list(out["_msg"]) == [PD_FORCED_MSG, None]
+
+
+def test_missing_inputs_error():
+    with pytest.raises(ValueError, match="1행"):
+        compute_batch(Q1=[1.0, np.nan], K=200, n=-1.6, Vel=0.3)
+
+
+def test_max_charge_batch_missing_is_nan():
+    Q2 = max_charge_batch([200, 200, 0], -1.6, 0.3, [50, np.nan, 50])
+    assert Q2[0] == max_charge(200, -1.6, 0.3, 50)
+    assert np.isnan(Q2[1]) and np.isnan(Q2[2])
+
+
+def test_dataframe_input():
+    pd_lib = pytest.importorskip("pandas")
+    df = pd_lib.DataFrame({"Q1": [0.4, 5.0, np.nan], "D": [np.nan, np.nan, 60.0],
+                           "K": 200.0, "n": -1.6, "Vel": 0.3}, index=["a", "b", "c"])
+    out = compute_batch(df)
+    assert list(out.index) == ["a", "b", "c"]
+    assert out.loc["c", "Q"] == compute(K=200, n=-1.6, Vel=0.3, D=60)["Q"]
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import threading
+
+import pytest
+
+from blasting.cache import ByteStore, ResultCache, cache_key
+from blasting.core import compute, design, max_charge
+
+
+def test_key_normalises_equivalent_inputs():
+    assert cache_key(Q1=2.0, pd_choice="0.050") == cache_key(Q1=2.0, pd_choice=0.05)
+    # 같은 Q3 를 주는 다른 입력 조합은 같은 키
+    assert cache_key(K=200, n=-1.6, Vel=0.3, D=80) == cache_key(Q1=max_charge(200, -1.6, 0.3, 80))
+    assert cache_key(K=200, n=-1.6, Vel=0.3, D=80, Q1=100) == cache_key(K=200, n=-1.6, Vel=0.3, D=80)
+
+
+@pytest.mark.parametrize("kw", [
+    dict(Q1=0.3), dict(Q1=0.3, pd_choice="0.065"), dict(Q1=7.5, pd_text="0.1"),
+    dict(K=200, n=-1.6, Vel=0.3, D=45), dict(Q1=3.0, C=0.5, V=1.0, k1=0.55),
+])
+def test_matches_compute(kw):
+    c = ResultCache(8)
+    assert c.compute(**kw) == compute(**kw)
+    assert c.compute(**kw) == compute(**kw)
+    assert c.stats().hits == 1
+
+
+def test_returns_copies():
+    c = ResultCache(8)
+    c.compute(Q1=2.0)["B"] = -1
+    assert c.compute(Q1=2.0)["B"] == compute(Q1=2.0)["B"]
+
+
+def test_errors_are_not_cached():
+    c = ResultCache(8)
+    with pytest.raises(ValueError):
+        c.compute(K=200, n=-1.6, Vel=0.3)
+    assert c.stats().size == 0
+
+
+def test_lru_eviction_and_resize():
+    c = ResultCache(2)
+    for q in (1.0, 2.0, 3.0):
+        c.compute(Q1=q)
+    s = c.stats()
+    assert (s.size, s.misses, s.evictions) == (2, 3, 1)
+    c.resize(10)
+    assert c.stats().size == 0 and c.stats().maxsize == 10
+    c.compute(Q1=1.0)
+    c.clear()
+    assert c.stats().size == 0
+
+
+def test_thread_safety():
+    c = ResultCache(64)
+    errors = []
+
+    def work(seed):
+        for i in range(300):
+            q = round(0.1 + (i * 7 + seed) % 100 * 0.3, 2)
+            if c.compute(Q1=q) != compute(Q1=q):
+                errors.append(q)
+
+    threads = [threading.Thread(target=work, args=(s,)) for s in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+def test_byte_store_limit():
+    s = ByteStore(10)
+    assert s.get_or_create("a", lambda: b"1234") == b"1234"
+    assert s.get_or_create("a", lambda: b"xxxx") == b"1234"
+    s.get_or_create("b", lambda: b"12345")
+    s.get_or_create("c", lambda: b"123")        # 10 바이트 초과 → 가장 오래된 a 제거
+    assert s.get("a") is None and s.get("b") == b"12345"
+    assert s.get_or_create("big", lambda: b"x" * 11) == b"x" * 11 and s.get("big") is None
+    assert s.get_or_create("none", lambda: None) is None
+    st = s.stats()
+    assert (st.hits, st.evictions, st.size) == (1, 1, 8)
+
+
+def test_design_shares_records():
+    c = ResultCache(16)
+    a = c.design(K=200, n=-1.6, Vel=0.3, D=80, pd=0.05)
+    assert a == design(K=200, n=-1.6, Vel=0.3, D=80, pd=0.05)
+    assert c.design(Q1=max_charge(200, -1.6, 0.3, 80), pd=0.050) is a      # 같은 Q3, pd
+    assert c.compute(Q1=max_charge(200, -1.6, 0.3, 80), pd_choice="0.05") == a.as_dict()
+    assert c.design(Q1=7.5, pd=0.1, pd_custom=True) == design(Q1=7.5, pd=0.1, pd_custom=True)
+    assert c.stats().hits == 2
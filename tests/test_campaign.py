@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import io
+import re
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from blasting import campaign, runner
+from blasting.core import compute
+from blasting.report import get_pattern_path
+
+
+def _pages(data):
+    return len(re.findall(rb"/Type /Page\b", data))
+
+
+def test_pages_and_index():
+    designs = [(compute(Q1=0.2 + i * 0.4), None, f"#{i}") for i in range(40)]
+    buf = io.BytesIO()
+    size = campaign.write_report(designs, buf, title="시험")
+    data = buf.getvalue()
+    assert size == len(data) and data.startswith(b"%PDF")
+    assert _pages(data) == 2 + 40                     # 목차 32행/쪽 → 2쪽
+
+
+def test_pattern_image_embedded_once(tmp_path):
+    r = compute(Q1=2.0)
+    if get_pattern_path(r)[0] is None:
+        pytest.skip("패턴 이미지 없음")
+    out = tmp_path / "c.pdf"
+    campaign.write_report([r] * 5, str(out))
+    data = out.read_bytes()
+    assert data.count(b"/Subtype /Image") == 1 and _pages(data) == 6
+
+
+def test_empty_report():
+    buf = io.BytesIO()
+    campaign.write_report([], buf)
+    assert _pages(buf.getvalue()) == 1
+
+
+def test_main_skips_error_rows(tmp_path):
+    src, res, pdf = tmp_path / "in.csv", tmp_path / "res.csv", tmp_path / "c.pdf"
+    src.write_text("id,Q1,K,n,Vel,D\na,2.5,,,,\nb,,200,-1.6,0.3,\nc,7,,,,\n", encoding="utf-8")
+    runner.run_csv(src, res, jobs=1)
+    assert campaign.main([str(res), "-o", str(pdf), "--label", "id"]) == 0
+    assert _pages(pdf.read_bytes()) == 1 + 2
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from blasting.core import (PA_NAMES, PD_FORCED_MSG, Design, compute, default_pd, design,
+                           design_charge, max_charge, pa_class, user_pd)
+
+KEYS = {"B", "S", "T", "h", "H", "Q", "c1", "K_step", "Pa", "pd", "_msg"}
+
+
+@pytest.mark.parametrize("Q3, Pa", [(0.124, 1), (0.125, 2), (0.49, 2), (0.5, 3), (1.59, 3),
+                                    (1.6, 4), (4.99, 4), (5, 5), (14.99, 5), (15, 6)])
+def test_pa_class_boundaries(Q3, Pa):
+    assert pa_class(Q3) == Pa
+    if round(Q3, 2) == Q3:                  # compute 는 Q1 을 0.01 단위로 반올림
+        assert compute(Q1=Q3)["Pa"] == Pa
+
+
+def test_result_keys_and_geometry():
+    r = compute(Q1=2.5)
+    assert set(r) == KEYS
+    assert r["pd"] == default_pd(r["Pa"]) and r["_msg"] is None
+    assert r["H"] == pytest.approx(r["T"] + r["h"], abs=0.011)
+    assert r["K_step"] == pytest.approx(r["H"] - 0.2 * r["B"], abs=0.011)
+
+
+def test_design_charge_takes_smaller():
+    Q2 = max_charge(200, -1.6, 0.3, 80)
+    assert design_charge(100.0, Q2) == Q2
+    assert design_charge(0.3, Q2) == 0.3
+    assert design_charge(None, Q2) == Q2
+    assert max_charge(200, -1.6, 0.3, None) is None
+
+
+def test_missing_inputs():
+    with pytest.raises(ValueError, match="Q1이 비어있을 때는"):
+        compute(K=200, n=-1.6, Vel=0.3)
+
+
+def test_pd_forced_for_small_charges():
+    r = compute(Q1=0.3, pd_choice="0.065")
+    assert r["pd"] == 0.032 and r["_msg"] == PD_FORCED_MSG
+    assert compute(Q1=3.0, pd_choice="0.065")["_msg"] is None
+
+
+def test_user_pd_priority():
+    assert user_pd("0.050", "0.1") == (0.1, True)
+    assert user_pd("0.050", "abc") == (0.05, False)      # 직접입력이 숫자가 아니면 선택값
+    assert user_pd(None, "-1") == (None, False)
+    with pytest.raises(ValueError):
+        user_pd("0", None)
+
+
+def test_anfo_custom_pd_uses_design_charge():
+    r = compute(Q1=3.3, pd_text="0.1")
+    assert r["Q"] == 3.3 and r["pd"] == 0.1
+    assert compute(Q1=3.3)["Q"] <= 3.3
+
+
+def test_every_pa_has_name_and_default_pd():
+    for pa in PA_NAMES:
+        assert default_pd(pa) > 0
+
+
+def _random_inputs(count, seed=1):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        pd = rnd.choice([None, 0.032, 0.05, 0.065, 0.045, 0.1])
+        kw = dict(K=rnd.choice([None, 150.0, 200.0, 250.0]), n=-1.6, Vel=rnd.choice([0.2, 0.3, 0.5]),
+                  D=rnd.choice([None, 15.0, 40.0, 120.0]), C=rnd.choice([0.25, 0.33, 0.5]),
+                  V=rnd.choice([1.0, 1.2, 1.25]), k1=rnd.choice([0.7, 0.5]))
+        kw["Q1"] = round(rnd.uniform(0.05, 40), 2) if kw["K"] is None or kw["D"] is None or rnd.random() < 0.3 else None
+        yield kw, pd, rnd.random() < 0.3
+
+
+def test_design_matches_compute():
+    for kw, pd, custom in _random_inputs(3000):
+        pd_kw = dict(pd_text=repr(pd)) if custom and pd else dict(pd_choice=pd)
+        r = design(pd=pd, pd_custom=custom and pd is not None, **kw)
+        assert isinstance(r, Design) and r.as_dict() == compute(**kw, **pd_kw)
+
+
+def test_design_is_immutable():
+    r = design(Q1=2.5)
+    with pytest.raises(AttributeError):
+        r.B = 1.0
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import csv
+
+import numpy as np
+import pytest
+
+from blasting.core import compute
+from blasting.delays import max_window_charge, programmable, schedule, schedule_layout, series
+from blasting.layout import layout
+from blasting.structures import Structures
+
+RECT = [(0, 0), (30, 0), (30, 12), (0, 12)]
+FACE = ((0, 0), (30, 0))
+
+
+def _brute_max(t, Q, window):
+    return max(Q[(t > ti - window) & (t <= ti)].sum() for ti in t)
+
+
+def _check(sch, Q, limit):
+    """모든 window (t - window, t] 의 합 ≤ 그 안 공들의 최소 limit"""
+    t = sch.time
+    for ti in t:
+        m = (t > ti - sch.window) & (t <= ti)
+        assert Q[m].sum() <= limit[m].min() + 1e-9
+    assert np.all(np.diff(t[sch.order]) >= 0)            # 발파 순서대로 시각이 줄지 않음
+
+
+def test_max_window_charge_matches_brute_force():
+    rng = np.random.default_rng(0)
+    t = rng.integers(0, 200, 300).astype(float)
+    Q = rng.uniform(0.5, 3, 300)
+    for w in (1.0, 8.0, 25.0):
+        assert max_window_charge(t, Q, w) == pytest.approx(_brute_max(t, Q, w))
+    assert max_window_charge([], []) == 0.0
+
+
+def test_schedule_respects_limit():
+    rng = np.random.default_rng(1)
+    Q = rng.uniform(0.5, 2.0, 200)
+    sch = schedule(Q, 4.0, window=8.0)
+    _check(sch, Q, np.full(200, 4.0))
+    assert sch.max_window_charge() <= 4.0 + 1e-9 and sch.time.min() == 0
+    assert list(sch.time) == list(programmable()[sch.delay])
+
+
+def test_per_hole_limit_and_order():
+    rng = np.random.default_rng(2)
+    Q = rng.uniform(0.5, 2.0, 100)
+    limit = rng.uniform(2.0, 6.0, 100)
+    order = rng.permutation(100)
+    sch = schedule(Q, limit, window=5.0, order=order)
+    _check(sch, Q, limit)
+    assert list(sch.order) == list(order)
+
+
+def test_unconstrained_and_single_hole_limit():
+    Q = np.ones(10)
+    assert set(schedule(Q, 100.0).time) == {0.0}          # 허용값이 충분하면 모두 같은 지발
+    sch = schedule(Q, 1.0, window=8.0)
+    assert list(sch.time) == [8.0 * i for i in range(10)]  # 1공씩, window 간격
+    assert sch.summary() == {"holes": 10, "duration": 72.0, "max_window_charge": 1.0, "delays": 10}
+
+
+def test_series_delays():
+    nominal = [0, 25, 25, 50, 75, 100, 125]
+    assert list(series(nominal)) == [0, 25, 50, 75, 100, 125]
+    sch = schedule(np.ones(6), 2.0, window=30.0, delays=nominal)
+    _check(sch, np.ones(6), np.full(6, 2.0))
+    assert set(sch.time) <= set(nominal)
+    with pytest.raises(ValueError, match="모자랍니다"):
+        schedule(np.ones(20), 2.0, window=30.0, delays=nominal)
+
+
+def test_schedule_errors():
+    with pytest.raises(ValueError, match="2번 공"):
+        schedule([1.0, 1.0, 5.0, 6.0], 4.0)
+    with pytest.raises(ValueError, match="order"):
+        schedule([1.0, 1.0], 4.0, order=[0, 0])
+
+
+def test_to_csv(tmp_path):
+    sch = schedule([1.0, 2.0, 1.5], 2.5, order=[2, 0, 1])
+    p = tmp_path / "d.csv"
+    sch.to_csv(p, hole=[11, 12, 13])
+    with open(p, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["hole", "seq", "time_ms", "Q", "limit"]
+    assert [r[:2] for r in rows[1:]] == [["11", "2"], ["12", "3"], ["13", "1"]]
+
+
+def test_schedule_layout():
+    res = compute(Q1=2.5)
+    st = Structures([15], [-40], [2.0])
+    lay = layout(RECT, FACE, res, structures=st, K=200, n=-1.6)
+    assert lay["ok"].all()
+    sch = schedule_layout(lay)
+    _check(sch, lay["Q"], lay["Q2"])
+    # 자유면 열부터 발파
+    assert np.all(np.diff(lay["row"][sch.order]) >= 0)
+    fixed = schedule_layout(lay, limit=res["Q"] * 2)
+    assert fixed.max_window_charge() <= res["Q"] * 2 + 1e-9
+    with pytest.raises(ValueError, match="limit"):
+        schedule_layout(layout(RECT, FACE, res))
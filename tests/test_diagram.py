@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from blasting import diagram, printpage
+from blasting.core import compute
+
+# Q=0 (허용 장약량이 가장 작은 카트리지보다 작음) → B, S, H 모두 0
+ZERO = dict(K=200, n=-1.6, Vel=0.3, D=12)
+
+
+def test_zero_charge_result():
+    r = compute(**ZERO)
+    assert r["Q"] == 0 and r["B"] == 0 and r["H"] == 0
+
+
+def test_svg_zero_geometry():
+    s = diagram.svg(compute(**ZERO))
+    assert s.startswith("<svg") and s.count(diagram.EMPTY_TEXT) == 2
+
+
+def test_svg_normal_geometry():
+    s = diagram.svg(compute(K=200, n=-1.6, Vel=0.3, D=80))
+    assert diagram.EMPTY_TEXT not in s and "<circle" in s
+
+
+def test_print_html_zero_geometry():
+    assert diagram.EMPTY_TEXT in printpage.print_html(compute(**ZERO))
+
+
+def test_pdf_zero_geometry():
+    pytest.importorskip("reportlab")
+    from blasting.report import make_pdf
+    assert make_pdf(compute(**ZERO), None).startswith(b"%PDF")
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from blasting.explosives import CATALOGUE, Catalogue, read_products
+
+HEADER = "name,kind,diameter_mm,weight_kg,length_m,density,nu,pa,default_pa\n"
+
+
+def _write(tmp_path, body):
+    p = tmp_path / "ex.csv"
+    p.write_text(HEADER + body, encoding="utf-8")
+    return p
+
+
+def test_default_catalogue():
+    assert CATALOGUE.default_pd(1) == 0.032 and CATALOGUE.default_pd(6) == 0.076
+    assert CATALOGUE.lookup(4, 0.065).name == "에멀젼 65"
+    assert CATALOGUE.lookup(6, 0.065).name == "에멀젼 65 (대규모)"
+    assert CATALOGUE.lookup(4, 0.0652).name == "에멀젼 65"            # 0.5 mm 이내
+    assert CATALOGUE.lookup(4, 0.045).name == CATALOGUE.products[CATALOGUE.default[4]].name
+    assert CATALOGUE.lookup(4, 0.1, custom=True).kind == "bulk"
+    assert CATALOGUE.lookup(1, 0.1, custom=True).kind == "cartridge"  # Pa 1 은 벌크 없음
+
+
+def test_bulk_spec_scales_with_diameter():
+    W1, h1, _ = CATALOGUE.spec(5, 0.1, custom=True)
+    W2, _, _ = CATALOGUE.spec(5, 0.05, custom=True)
+    assert h1 == 1.0 and W1 == pytest.approx(4 * W2)
+
+
+def test_find_batch_matches_find():
+    rng = np.random.default_rng(0)
+    Pa = rng.integers(1, 7, 2000)
+    pd = rng.choice([0.032, 0.0322, 0.045, 0.05, 0.065, 0.0655, 0.076, 0.1], 2000)
+    custom = rng.random(2000) < 0.3
+    out = CATALOGUE.find_batch(Pa, pd, custom)
+    assert list(out) == [CATALOGUE.find(int(a), float(d), bool(c)) for a, d, c in zip(Pa, pd, custom)]
+
+
+def test_csv_errors(tmp_path):
+    with pytest.raises(ValueError, match="kind"):
+        read_products(_write(tmp_path, "x,gel,32,0.1,0.2,1,0.5,1,1\n"))
+    with pytest.raises(ValueError, match="weight_kg"):
+        read_products(_write(tmp_path, "x,cartridge,32,,0.2,1,0.5,1,1\n"))
+    with pytest.raises(ValueError, match="기본 제품"):
+        Catalogue.load(_write(tmp_path, "x,cartridge,32,0.1,0.2,1,0.5,1 2,1\n"))
+    with pytest.raises(ValueError, match="같은 직경"):
+        Catalogue.load(_write(tmp_path, "x,cartridge,32,0.1,0.2,1,0.5,1,1\ny,cartridge,32.2,0.1,0.2,1,0.5,1,\n"))
+
+
+def test_comment_lines_and_new_product(tmp_path):
+    cat = Catalogue.load(_write(tmp_path, "# 주석\nx,cartridge,32,0.1,0.2,1,0.5,1,1\nz,cartridge,40,0.3,0.3,1,0.5,1,\n"))
+    assert [p.name for p in cat.products] == ["x", "z"]
+    assert cat.spec(1, 0.04) == (0.3, 0.3, 0.5)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+
+import pytest
+
+reportlab = pytest.importorskip("reportlab")
+import reportlab.pdfbase.ttfonts as ttfonts
+
+from blasting import fonts
+
+VERA = os.path.join(os.path.dirname(reportlab.__file__), "fonts", "Vera.ttf")
+
+
+@pytest.fixture
+def clean(monkeypatch):
+    fonts.reset()
+    yield monkeypatch
+    monkeypatch.undo()
+    fonts.reset()
+
+
+def test_env_font_registered_once(clean):
+    clean.setenv("BLASTING_KOR_FONT", VERA)
+    parsed = []
+    real = ttfonts.TTFont
+    clean.setattr(ttfonts, "TTFont", lambda *a, **k: parsed.append(a) or real(*a, **k))
+
+    names = []
+    threads = [threading.Thread(target=lambda: names.append(fonts.korean_font())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert names == [fonts.FONT_NAME] * 8
+    assert len(parsed) == 1 and fonts.korean_font_path() == VERA
+
+
+def test_missing_font(clean):
+    clean.setattr(fonts, "candidates", lambda: [os.path.join(os.sep, "nonexistent", "font.ttf")])
+    assert fonts.korean_font() is None and fonts.korean_font_path() is None
+
+
+def test_candidates_env_first(clean):
+    clean.setenv("BLASTING_KOR_FONT", "/x/y.ttf")
+    assert fonts.candidates()[0] == "/x/y.ttf"
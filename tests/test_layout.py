@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import csv
+
+import numpy as np
+import pytest
+
+from blasting.core import compute
+from blasting.layout import COLUMNS, hole_grid, layout
+from blasting.structures import Structures
+
+RECT = [(0, 0), (20, 0), (20, 10), (0, 10)]
+FACE = ((0, 0), (20, 0))
+
+
+def test_square_grid():
+    x, y, row = hole_grid(RECT, FACE, B=2.0, S=2.5, pattern="square")
+    # 열: y = 2, 4, 6, 8 (10 은 경계 밖), 열 안: x = 1.25, 3.75, ... 18.75
+    assert sorted(set(y.tolist())) == [2.0, 4.0, 6.0, 8.0] and list(np.unique(row)) == [1, 2, 3, 4]
+    assert np.allclose(x[row == 1], 1.25 + 2.5 * np.arange(8))
+    assert len(x) == 32
+
+
+def test_staggered_shifts_odd_rows():
+    x, y, row = hole_grid(RECT, FACE, B=2.0, S=2.5)
+    assert np.allclose(x[row == 1], 1.25 + 2.5 * np.arange(8))
+    assert np.allclose(x[row == 2], 2.5 * np.arange(8))            # x = 0 (경계 위) 포함
+
+
+def test_face_direction_and_rotation():
+    # 자유면을 반대 방향으로 줘도 안쪽 방향은 다각형 쪽
+    _, y, _ = hole_grid(RECT, ((20, 0), (0, 0)), B=2.0, S=2.5, pattern="square")
+    assert y.min() == pytest.approx(2.0)
+    # 45도 회전한 계단 → 같은 공 수, 자유면까지 거리 = 열 x B
+    c, s = np.cos(np.pi / 4), np.sin(np.pi / 4)
+    rot = lambda p: (p[0] * c - p[1] * s, p[0] * s + p[1] * c)
+    ref, _, _ = hole_grid(RECT, FACE, B=2.0, S=2.5, pattern="square", margin=0.1)   # 경계 위 공 제외
+    x, y, row = hole_grid([rot(p) for p in RECT], (rot((0, 0)), rot((20, 0))), B=2.0, S=2.5,
+                          pattern="square", margin=0.1)
+    assert len(x) == len(ref) == 32
+    assert np.allclose(-x * s + y * c, row * 2.0)
+
+
+def test_margin_and_concave_polygon():
+    x, y, _ = hole_grid(RECT, FACE, B=2.0, S=2.5, pattern="square", margin=1.5)
+    assert len(x) == 24 and x.min() > 1.5 and x.max() < 18.5 and y.max() < 8.5
+    L = [(0, 0), (20, 0), (20, 4.5), (10, 4.5), (10, 10), (0, 10)]
+    x, y, _ = hole_grid(L, FACE, B=2.0, S=2.5, pattern="square")
+    assert not ((x > 10) & (y > 4.5)).any() and ((x < 10) & (y > 4.5)).any()
+
+
+def test_grid_errors():
+    with pytest.raises(ValueError, match="pattern"):
+        hole_grid(RECT, FACE, 2, 2, pattern="hex")
+    with pytest.raises(ValueError, match="양수"):
+        hole_grid(RECT, FACE, 0, 2)
+    with pytest.raises(ValueError, match="3개"):
+        hole_grid(RECT[:2], FACE, 2, 2)
+    with pytest.raises(ValueError, match="같습니다"):
+        hole_grid(RECT, ((0, 0), (0, 0)), 2, 2)
+
+
+def test_layout_columns_follow_result(tmp_path):
+    res = compute(Q1=2.5)
+    lay = layout(RECT, FACE, res)
+    x, _, _ = hole_grid(RECT, FACE, res["B"], res["S"])
+    assert len(lay) == len(x) > 0 and list(lay["hole"]) == list(range(1, len(x) + 1))
+    assert set(lay["Q"]) == {res["Q"]} and set(lay["H"]) == {res["H"]}
+    assert lay["ok"].all() and (lay["structure"] == -1).all()
+    s = lay.summary()
+    assert s == {"holes": len(x), "explosive": pytest.approx(res["Q"] * len(x)),
+                 "drilled": pytest.approx(res["H"] * len(x)), "over": 0}
+
+    p = tmp_path / "lay.csv"
+    lay.to_csv(p)
+    with open(p, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == COLUMNS and len(rows) == len(lay) + 1
+    assert lay.to_dicts()[0]["hole"] == 1 and set(lay.to_dicts()[0]) == set(COLUMNS)
+
+
+def test_layout_with_structures():
+    st = Structures([10, 100], [-10, 50], [5.0, 5.0], names=["주택", "창고"])
+    res = compute(Q1=2.5)
+    lay = layout(RECT, FACE, res, structures=st, K=200, n=-1.6)
+    g = st.governing(lay["x"], lay["y"], 200, -1.6)
+    assert list(lay["structure"]) == list(g.index) and list(lay["Q2"]) == list(g.Q2)
+    assert list(lay["ok"]) == list(res["Q"] <= g.Q2)
+    # 주택에 가까운 앞 열은 허용 장약량 초과
+    assert 0 < lay.summary()["over"] < len(lay) and not lay["ok"][lay["row"] == 1].any()
+    with pytest.raises(ValueError, match="K, n"):
+        layout(RECT, FACE, res, structures=st)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+from blasting import printpage
+from blasting.core import compute
+from blasting.report import get_pattern_path
+
+
+def test_print_html_date_filled_in_browser():
+    html = printpage.print_html(compute(Q1=2.5))
+    assert 'id="out-date"></span>' in html and "<svg" in html
+    assert printpage.print_html(compute(Q1=2.5)) == html          # 날짜와 무관하게 같은 문서
+
+
+def test_publish_is_content_addressed(tmp_path):
+    a, b = compute(Q1=2.5), compute(Q1=3.5)
+    key = printpage.publish(a, None, str(tmp_path))
+    assert printpage.publish(dict(a), None, str(tmp_path)) == key
+    assert printpage.publish(b, None, str(tmp_path)) != key
+    with open(tmp_path / f"{key}.json", encoding="utf-8") as f:
+        assert "<svg" in json.load(f)["html"]
+
+
+def test_publish_shares_image(tmp_path):
+    r = compute(Q1=2.5)
+    img = get_pattern_path(r)[0]
+    if img is None:
+        pytest.skip("패턴 이미지 없음")
+    k1 = printpage.publish(r, img, str(tmp_path))
+    k2 = printpage.publish(compute(Q1=4.0), img, str(tmp_path))     # 같은 Pa → 같은 패턴
+    images = [n for n in os.listdir(tmp_path) if not n.endswith(".json")]
+    assert k1 != k2 and len(images) == 1
+    with open(tmp_path / f"{k1}.json", encoding="utf-8") as f:
+        assert f"src='{images[0]}'" in json.load(f)["html"]
+
+
+def test_prune_keeps_newest(tmp_path, monkeypatch):
+    monkeypatch.setattr(printpage, "MAX_DOCS", 4)
+    keys = []
+    for i in range(7):
+        keys.append(printpage.publish(compute(Q1=1.0 + i), None, str(tmp_path)))
+        os.utime(tmp_path / f"{keys[-1]}.json", (i, i))
+    left = {n[:-5] for n in os.listdir(tmp_path)}
+    assert keys[-1] in left and keys[0] not in left and len(left) < 7
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import multiprocessing
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from blasting import render, runner
+from blasting.core import compute
+from blasting.render import RenderJob, RenderPool, render_job
+
+# 시험용 레이아웃은 fork 로 작업자에 전달
+fork_only = pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="fork 시작 방식 필요")
+
+
+def _slow(result, img):
+    time.sleep(30)
+
+
+def _crash(result, img):
+    os._exit(3)
+
+
+def _fail(result, img):
+    raise RuntimeError("실패")
+
+
+def test_render_job(tmp_path):
+    r = compute(Q1=2.5)
+    for layout in render.LAYOUTS:
+        res = render_job(RenderJob(1, r, layout=layout))
+        assert res.error is None and res.data.startswith(b"%PDF")
+    out = tmp_path / "a.pdf"
+    res = render_job(RenderJob(2, r, out=str(out)))
+    assert res.data == str(out) and out.read_bytes().startswith(b"%PDF")
+
+
+def test_render_job_error(monkeypatch):
+    monkeypatch.setitem(render.LAYOUTS, "fail", _fail)
+    res = render_job(RenderJob(3, compute(Q1=1.0), layout="fail"))
+    assert res.data is None and res.error == "RuntimeError: 실패"
+
+
+@fork_only
+def test_pool_timeout_and_crash(monkeypatch):
+    monkeypatch.setitem(render.LAYOUTS, "slow", _slow)
+    monkeypatch.setitem(render.LAYOUTS, "crash", _crash)
+    jobs = [RenderJob(i, compute(Q1=0.5 + i), layout="web") for i in range(8)]
+    jobs[2] = jobs[2]._replace(layout="slow")
+    jobs[5] = jobs[5]._replace(layout="crash")
+    with RenderPool(workers=2, queue_depth=3, timeout=1, warm_paths=()) as pool:
+        out = {r.key: r for r in pool.imap(jobs)}
+    assert sorted(out) == list(range(8))
+    assert out[2].error.startswith("TimeoutError")
+    assert out[5].error is not None
+    assert all(out[i].error is None and out[i].data.startswith(b"%PDF") for i in (0, 1, 3, 4, 6, 7))
+
+
+@fork_only
+def test_main_exit_code(tmp_path, monkeypatch):
+    src, res = tmp_path / "in.csv", tmp_path / "res.csv"
+    src.write_text("Q1\n2.5\n7\n", encoding="utf-8")
+    runner.run_csv(src, res, jobs=1)
+    assert render.main([str(res), "-d", str(tmp_path / "ok"), "-j", "1"]) == 0
+    assert len(os.listdir(tmp_path / "ok")) == 2
+    monkeypatch.setitem(render.LAYOUTS, "web", _fail)
+    assert render.main([str(res), "-d", str(tmp_path / "bad"), "-j", "1"]) == 1
+
+
+def test_image_stream_without_a85_leaves_setting():
+    from reportlab import rl_config
+
+    r = compute(Q1=2.0)
+    img = render.get_pattern_path(r)[0]
+    if img is None:
+        pytest.skip("패턴 이미지 없음")
+    before = rl_config.useA85
+    data = render_job(RenderJob(4, r, img_path=img)).data
+    assert rl_config.useA85 == before
+    assert b"/Filter [ /DCTDecode ]" in data          # 이미지 스트림만 ASCII85 없음
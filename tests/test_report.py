@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from blasting import report
+from blasting.core import compute
+
+
+class _Day:
+    """report.datetime 대체: now() 가 정해진 시각"""
+    value = datetime(2026, 1, 5, 9, 0)
+
+    @classmethod
+    def now(cls):
+        return cls.value
+
+
+def test_make_pdf():
+    r = compute(Q1=2.5)
+    data = report.make_pdf(r, None, "2026-01-01 10:00")
+    assert data.startswith(b"%PDF") and data.rstrip().endswith(b"%%EOF")
+
+
+def test_design_rows_shared():
+    rows = report.design_rows(compute(Q1=2.5))
+    assert rows[0] == ("항목", "값") and len(rows) == 10
+    assert rows[1] == ("저항선 (B)", f"{compute(Q1=2.5)['B']:.2f} m")
+
+
+def test_content_key():
+    a, b = compute(Q1=2.5), compute(Q1=3.5)
+    assert report.content_key(a, None) == report.content_key(dict(a), None)
+    assert report.content_key(a, None) != report.content_key(b, None)
+    assert report.content_key(a, None, "x") != report.content_key(a, None, "y")
+
+
+def test_cached_pdf_keyed_by_date(monkeypatch):
+    monkeypatch.setattr(report, "datetime", _Day)
+    dates, make = [], report.make_pdf
+    monkeypatch.setattr(report, "make_pdf", lambda r, p, d: dates.append(d) or make(r, p, d))
+    r = compute(Q1=4.2)
+    first = report.cached_pdf(r, None)
+    monkeypatch.setattr(_Day, "value", datetime(2026, 1, 5, 17, 59))      # 같은 날 다른 시각
+    assert report.cached_pdf(r, None) is first
+    monkeypatch.setattr(_Day, "value", datetime(2026, 1, 6, 8, 0))
+    assert report.cached_pdf(r, None) is not first
+    assert dates == ["2026-01-05", "2026-01-06"]
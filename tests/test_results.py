@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from blasting.batch import compute_batch
+from blasting.core import PD_FORCED_MSG, compute
+from blasting.results import COLUMNS, ResultSet, encode_messages
+
+Q1 = np.round(np.linspace(0.05, 30, 200), 2)
+
+
+@pytest.fixture(scope="module")
+def rs():
+    return ResultSet.from_batch(compute_batch(Q1=Q1, pd=0.065))
+
+
+def test_rows_equal_compute(rs):
+    assert len(rs) == len(Q1)
+    for i in (0, 7, 100, -1):
+        assert rs[i] == compute(Q1=float(Q1[i]), pd_choice=0.065)
+    assert rs[0]["_msg"] == PD_FORCED_MSG
+    assert rs.to_dicts() == [compute(Q1=float(q), pd_choice=0.065) for q in Q1]
+
+
+def test_from_dicts_and_concat(rs):
+    other = ResultSet.from_dicts(compute(Q1=float(q), pd_choice=0.065) for q in Q1)
+    assert other.to_dicts() == rs.to_dicts()
+    both = ResultSet.concat([rs, other])
+    assert len(both) == 2 * len(rs) and both[len(rs)] == rs[0]
+
+
+def test_views_share_columns(rs):
+    part = rs[10:20]
+    assert len(part) == 10 and part[0] == rs[10]
+    assert np.shares_memory(part["B"], rs["B"])
+    sel = rs[(rs["Pa"] == 4) & (rs["B"] > 1.0)]
+    assert len(sel) and all(r["Pa"] == 4 and r["B"] > 1.0 for r in sel)
+    with pytest.raises(IndexError):
+        rs[len(rs)]
+
+
+def test_sort(rs):
+    s = rs.sort("c1", descending=True)
+    assert list(s["c1"]) == sorted(rs["c1"], reverse=True)
+    assert s[0]["c1"] == rs["c1"].max()
+    sub = rs[50:150].sort("B")
+    assert sub.compact().to_dicts() == sub.to_dicts()
+
+
+def test_float32_and_nbytes(rs):
+    small = rs.astype(np.float32)
+    assert small.nbytes < rs.nbytes
+    assert np.allclose(small["B"], rs["B"], rtol=1e-6) and list(small["Pa"]) == list(rs["Pa"])
+
+
+def test_exports(rs):
+    batch = rs.to_batch()
+    ref = compute_batch(Q1=Q1, pd=0.065)
+    for k in COLUMNS:
+        assert list(batch[k]) == list(ref[k])
+    arr = rs.to_numpy()
+    assert arr.dtype.names == COLUMNS and arr["B"][3] == rs[3]["B"]
+
+
+def test_to_arrow(rs):
+    pytest.importorskip("pyarrow")
+    t = rs.to_arrow()
+    assert t.num_rows == len(rs) and t.column_names == list(COLUMNS)
+    msgs = t.column("_msg").to_pylist()
+    assert msgs == list(rs.messages())
+
+
+def test_unknown_message():
+    with pytest.raises(ValueError, match="코드표"):
+        encode_messages([None, "다른 문구"])
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import csv
+
+import pytest
+
+from blasting import runner
+from blasting.core import compute
+
+HEADER = ["id", "Q1", "K", "n", "Vel", "D", "pd", "k1"]
+ROWS = [
+    ["a", "2.5", "", "", "", "", "", ""],
+    ["b", "", "200", "-1.6", "0.3", "80", "자동", "비산제어(0.7)"],
+    ["c", "", "200", "-1.6", "0.3", "", "", ""],          # Q1, D 모두 비어 있음 → 행 오류
+    ["d", "12", "", "", "", "", "0.065", "0.5"],
+]
+
+
+def _write(path, rows):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(HEADER)
+        w.writerows(rows)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_csv_order_and_errors(tmp_path, jobs):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write(src, ROWS * 3)
+    assert runner.run_csv(src, dst, jobs=jobs, chunk_size=2) == (12, 3)
+
+    out = list(runner.read_results(dst))
+    assert [row["id"] for row, _ in out] == [r[0] for r in ROWS] * 3
+    assert [res is None for _, res in out] == [False, False, True, False] * 3
+    assert out[2][0]["error"].startswith("ValueError")
+
+
+def test_run_row_matches_compute():
+    row = dict(zip(HEADER, ROWS[1]))
+    r = compute(K=200, n=-1.6, Vel=0.3, D=80, k1=0.7)
+    assert runner.run_row(row)[:10] == [r["B"], r["S"], r["T"], r["h"], r["H"], r["Q"], r["c1"],
+                                        r["K_step"], r["Pa"], r["pd"]]
+
+
+def test_main_exit_code(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write(src, [ROWS[0], ROWS[3]])
+    assert runner.main([str(src), "-o", str(dst), "-j", "1"]) == 0
+    _write(src, ROWS)
+    assert runner.main([str(src), "-o", str(dst), "-j", "1"]) == 1
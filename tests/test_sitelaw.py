@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from blasting import sitelaw
+from blasting.core import compute, max_charge
+from blasting.sitelaw import SiteLawAccumulator, fit_csv, t_ppf
+
+
+def _records(size=5000, K=200.0, n=-1.6, s=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    D = rng.uniform(10, 300, size)
+    W = rng.uniform(0.1, 20, size)
+    ppv = K * (D / np.sqrt(W)) ** n * 10 ** rng.normal(0, s, size)
+    return ppv, D, W
+
+
+def test_recovers_k_and_n():
+    law = SiteLawAccumulator().add(*_records()).fit()
+    assert law.K == pytest.approx(200, rel=0.05) and law.n == pytest.approx(-1.6, abs=0.02)
+    assert law.s == pytest.approx(0.1, rel=0.05) and law.count == 5000
+    assert law.K_at(0.5) == pytest.approx(law.K)
+    assert law.K_at(0.95) > law.K
+
+
+def test_exact_fit_matches_polyfit():
+    ppv, D, W = _records(50)
+    law = SiteLawAccumulator().add(ppv, D, W).fit()
+    n, a = np.polyfit(np.log10(D / np.sqrt(W)), np.log10(ppv), 1)
+    assert law.n == pytest.approx(n, rel=1e-10) and law.a == pytest.approx(a, rel=1e-10)
+
+
+def test_chunks_and_merge_equal_single_add():
+    ppv, D, W = _records()
+    one = SiteLawAccumulator().add(ppv, D, W).fit()
+    chunked = SiteLawAccumulator()
+    for i in range(0, len(ppv), 700):
+        chunked.add(ppv[i:i + 700], D[i:i + 700], W[i:i + 700])
+    left = SiteLawAccumulator().add(ppv[:1234], D[:1234], W[:1234])
+    right = SiteLawAccumulator().add(ppv[1234:], D[1234:], W[1234:])
+    for law in (chunked.fit(), left.merge(right).fit()):
+        assert (law.count, law.sd_range) == (one.count, one.sd_range)
+        for k in ("a", "n", "s", "mean_x", "sxx", "r2"):
+            assert getattr(law, k) == pytest.approx(getattr(one, k), rel=1e-9)
+
+
+def test_invalid_rows_skipped():
+    ppv, D, W = _records(100)
+    bad = (np.array([0.0, -1, np.nan, 1, 1]), np.array([10.0, 10, 10, np.inf, 10]), np.array([1.0, 1, 1, 1, 0]))
+    acc = SiteLawAccumulator().add(*bad).add(ppv, D, W)
+    law = acc.fit()
+    assert law.skipped == 5 and law.count == 100
+    assert law.n == SiteLawAccumulator().add(ppv, D, W).fit().n
+
+
+def test_fit_errors():
+    with pytest.raises(ValueError, match="부족"):
+        SiteLawAccumulator().add([1, 2], [10, 20], [1, 1]).fit()
+    with pytest.raises(ValueError, match="환산거리"):
+        SiteLawAccumulator().add([1, 2, 3], [10, 10, 10], [1, 1, 1]).fit()
+    law = SiteLawAccumulator().add(*_records(100)).fit()
+    with pytest.raises(ValueError, match="kind"):
+        law.bounds(10, kind="tolerance")
+
+
+def test_bounds():
+    law = SiteLawAccumulator().add(*_records(200)).fit()
+    sd = np.array([5.0, 20.0, 80.0])
+    lo_c, hi_c = law.bounds(sd, 0.95, "confidence")
+    lo_p, hi_p = law.bounds(sd, 0.95)
+    mid = law.ppv(sd)
+    assert np.all(lo_p < lo_c) and np.all(lo_c < mid) and np.all(mid < hi_c) and np.all(hi_c < hi_p)
+    assert np.allclose(np.log10(mid) * 2, np.log10(lo_p) + np.log10(hi_p))
+
+
+def test_t_ppf():
+    assert t_ppf(0.975, 10) == pytest.approx(2.228, abs=2e-3)
+    assert t_ppf(0.95, 3) == pytest.approx(2.353, abs=2e-2)
+    assert t_ppf(0.975, 10**7) == pytest.approx(1.95996, abs=1e-5)
+    assert t_ppf(0.5, 5) == 0
+
+
+def test_compute_args_feed_compute():
+    law = SiteLawAccumulator().add(*_records()).fit()
+    args = law.compute_args(0.95)
+    assert args == {"K": law.K_at(0.95), "n": law.n}
+    assert compute(**args, Vel=0.3, D=30) == compute(K=args["K"], n=args["n"], Vel=0.3, D=30)
+    # 95% K 가 더 크면 허용 장약량은 작아짐
+    assert max_charge(**args, Vel=0.3, D=30) < max_charge(**law.compute_args(0.5), Vel=0.3, D=30)
+
+
+def _csv(path, ppv, D, W, header="PPV,D,W"):
+    rows = [header] + [f"{float(a)!r},{float(b)!r},{float(c)!r}" for a, b, c in zip(ppv, D, W)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_fit_csv_matches_arrays(tmp_path):
+    ppv, D, W = _records(300)
+    a = _csv(tmp_path / "a.csv", ppv[:100], D[:100], W[:100])
+    b = _csv(tmp_path / "b.csv", ppv[100:], D[100:], W[100:])
+    with open(a, "a", encoding="utf-8") as f:
+        f.write(",12,1\nx,12,1\n1\n")             # 빈 값/숫자 아님 → 제외, 열 부족 행 → 무시
+    law = fit_csv([a, b], chunk_size=37)
+    ref = SiteLawAccumulator().add(ppv, D, W).fit()
+    assert law.count == 300 and law.skipped == 2
+    assert law.n == pytest.approx(ref.n, rel=1e-12) and law.a == pytest.approx(ref.a, rel=1e-12)
+
+
+def test_fit_csv_columns(tmp_path):
+    ppv, D, W = _records(50)
+    p = _csv(tmp_path / "m.csv", ppv, D, W, header="v, dist ,q")
+    with pytest.raises(ValueError, match="PPV, D, W"):
+        fit_csv(p)
+    assert fit_csv(p, columns=("v", "dist", "q")).count == 50
+
+
+def test_main(tmp_path, capsys):
+    p = _csv(tmp_path / "m.csv", *_records(100))
+    assert sitelaw.main([p, "--levels", "50,90"]) == 0
+    out = capsys.readouterr().out
+    assert "기록 100건" in out and "50% 추정식" in out and "90% 추정식" in out
+    short = _csv(tmp_path / "s.csv", [1, 2], [10, 20], [1, 1])
+    assert sitelaw.main([short]) == 1
+    assert "부족" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        sitelaw.main([p, "--columns", "PPV,D"])
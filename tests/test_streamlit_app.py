@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+pytest.importorskip("streamlit.testing.v1")
+from streamlit.testing.v1 import AppTest
+
+from blasting.core import compute
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit_app.py")
+
+
+@pytest.fixture
+def app():
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    return at
+
+
+def test_form_mode(app):
+    app.text_input(key="D_in").input("120")
+    app.button[0].click().run()
+    assert not app.error
+    assert app.session_state["result"] == compute(K=200, n=-1.6, Vel=0.3, D=120, C=0.33, V=1.2, k1=0.7)
+
+
+def test_live_mode_computes_on_input_generation(app):
+    app.toggle[0].set_value(True).run()
+    assert [e.value for e in app.error] and "result" not in app.session_state   # Q1, D 미입력
+
+    app.text_input(key="D_in").input("80").run()
+    gen = app.session_state["input_gen"]
+    assert app.session_state["live_gen"] == gen and not app.error
+    first = app.session_state["result"]
+    assert first == compute(K=200, n=-1.6, Vel=0.3, D=80)
+
+    app.run()                                             # 입력 변경 없는 재실행 → 계산 생략
+    assert app.session_state["input_gen"] == gen and app.session_state["result"] is first
+
+    app.text_input(key="D_in").input("8x").run()          # 입력 오류 → 오류 표시, 직전 결과 유지
+    assert app.error and app.session_state["result"] is first
+    app.run()
+    assert app.error                                      # 같은 세대의 재실행에서도 오류 유지
+
+
+def test_inputs_survive_mode_switch(app):
+    app.text_input(key="D_in").input("60")
+    app.number_input(key="K_in").set_value(250.0)
+    app.button[0].click().run()                           # 폼 값은 제출할 때 반영
+    app.toggle[0].set_value(True).run()
+    assert app.text_input(key="D_in").value == "60" and app.number_input(key="K_in").value == 250.0
+    app.toggle[0].set_value(False).run()
+    assert app.text_input(key="D_in").value == "60"
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from blasting.batch import compute_batch
+from blasting.core import compute, max_charge
+from blasting.structures import Structures
+
+K, N = 200.0, -1.6
+
+
+def _site(size=400, seed=0):
+    rng = np.random.default_rng(seed)
+    return Structures(rng.uniform(0, 1000, size), rng.uniform(0, 800, size),
+                      rng.choice([0.2, 0.3, 0.5, 1.0, 2.0], size))
+
+
+def _brute(st, bx, by, n):
+    d = np.hypot(st.xy[:, 0] - bx[:, None], st.xy[:, 1] - by[:, None])
+    wd = st.Vel ** (-1.0 / n) * d
+    return wd.min(axis=1)
+
+
+def test_nearest_matches_brute_force():
+    st = _site()
+    rng = np.random.default_rng(1)
+    bx, by = rng.uniform(-800, 1800, 3000), rng.uniform(-800, 1600, 3000)   # 격자 밖 포함
+    for n in (N, -1.2):
+        i, D = st.nearest(bx, by, n)
+        w = st.Vel ** (-1.0 / n)
+        assert np.allclose(w[i] * D, _brute(st, bx, by, n), rtol=1e-12)
+        assert np.allclose(D, np.hypot(st.xy[i, 0] - bx, st.xy[i, 1] - by))
+    assert st.candidates(N)["mean"] < len(st) / 10
+
+
+def test_governing_q2_is_minimum():
+    st = _site(50)
+    rng = np.random.default_rng(2)
+    bx, by = rng.uniform(0, 1000, 200), rng.uniform(0, 800, 200)
+    g = st.governing(bx, by, K, N)
+    for j in range(0, 200, 17):
+        each = [max_charge(K, N, float(v), float(d))
+                for v, d in zip(st.Vel, np.hypot(st.xy[:, 0] - bx[j], st.xy[:, 1] - by[j]))]
+        assert g.Q2[j] == min(each) == max_charge(K, N, float(g.Vel[j]), float(g.D[j]))
+
+
+def test_shape_and_scalar():
+    st = _site(30)
+    i, D = st.nearest(np.zeros((2, 3)), 5.0, N)
+    assert i.shape == D.shape == (2, 3)
+    i, D = st.nearest(500.0, 400.0, N)
+    assert i.shape == () and D == pytest.approx(np.hypot(*(st.xy[int(i)] - (500, 400))))
+
+
+def test_design_matches_compute():
+    st = Structures([0, 100], [0, 0], [0.3, 2.0], names=["주택", "창고"])
+    res, gov = st.design(30.0, 0.0, K, N, Q1=5.0)
+    assert gov["name"] == "주택" and gov["D"] == 30.0 and gov["Vel"] == 0.3
+    assert gov["Q2"] == max_charge(K, N, 0.3, 30.0)
+    assert res == compute(K=K, n=N, Vel=0.3, D=30.0, Q1=5.0)
+    with pytest.raises(ValueError, match="주택"):
+        st.design(0.0, 0.0, K, N)
+
+
+def test_design_batch():
+    st = _site(80)
+    rng = np.random.default_rng(3)
+    bx, by = rng.uniform(0, 1000, 100), rng.uniform(0, 800, 100)
+    out = st.design_batch(bx, by, K, N, Q1=3.0)
+    g = st.governing(bx, by, K, N)
+    ref = compute_batch(K=K, n=N, Vel=g.Vel, D=g.D, Q1=3.0)
+    assert all(np.array_equal(out[k], ref[k]) for k in ref if k != "_msg")
+    assert list(out["structure"]) == list(g.index) and list(out["Q2"]) == list(g.Q2)
+    with pytest.raises(ValueError, match="1번째"):
+        st.design_batch([500.0, st.xy[0, 0]], [400.0, st.xy[0, 1]], K, N)
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError, match="없습니다"):
+        Structures([], [], [])
+    with pytest.raises(ValueError, match="양수 Vel"):
+        Structures([0, 1], [0, 1], [0.3, 0])
+    with pytest.raises(ValueError, match="음수"):
+        Structures([0], [0], [0.3]).nearest(1.0, 1.0, 1.6)
+    p = tmp_path / "s.csv"
+    p.write_text("name,x,y\n주택,0,0\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Vel"):
+        Structures.from_csv(p)
+
+
+def test_from_csv(tmp_path):
+    p = tmp_path / "s.csv"
+    p.write_text("\ufeffname,x,y,Vel\n 주택 ,0,0,0.3\n창고,100,0,2\n", encoding="utf-8")
+    st = Structures.from_csv(p, bounds=(-50, -50, 150, 150))
+    assert len(st) == 2 and st.names == ["주택", "창고"] and st.bounds == (-50.0, -50.0, 150.0, 150.0)
+    assert int(st.nearest(60.0, 0.0, N)[0]) == 0          # 창고가 더 가깝지만 Vel 이 작은 주택이 지배
+    assert int(st.nearest(90.0, 0.0, N)[0]) == 1
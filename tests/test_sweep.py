@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import csv
+
+import numpy as np
+import pytest
+
+from blasting import sweep
+from blasting.core import compute
+
+
+def test_parse_values():
+    np.testing.assert_allclose(sweep.parse_values("0.1:0.5:0.1"), [0.1, 0.2, 0.3, 0.4, 0.5])
+    v = sweep.parse_values("auto,0.032, 0.05")
+    assert np.isnan(v[0]) and list(v[1:]) == [0.032, 0.05]
+    with pytest.raises(ValueError):
+        sweep.parse_values("1:2:0")
+
+
+def test_sweep_chunks_match_compute():
+    ranges = dict(D=[20.0, 55.0, 120.0], Vel=[0.2, 0.5], V=[1.0, 1.2], pd=[np.nan, 0.065])
+    assert sweep.grid_size(**ranges) == 24
+    chunks = list(sweep.sweep(chunk_size=5, **ranges))
+    assert [len(c["B"]) for c in chunks] == [5, 5, 5, 5, 4]
+    seen = set()
+    for c in chunks:
+        for i in range(len(c["B"])):
+            pd_in = c["pd_in"][i]
+            r = compute(K=200.0, n=-1.6, Vel=c["Vel"][i], D=c["D"][i], C=0.33, V=c["V"][i],
+                        pd_choice=None if np.isnan(pd_in) else pd_in)
+            assert (c["B"][i], c["Q"][i], c["Pa"][i], c["pd"][i]) == (r["B"], r["Q"], r["Pa"], r["pd"])
+            seen.add((c["D"][i], c["Vel"][i], c["V"][i], str(pd_in)))
+    assert len(seen) == 24
+
+
+def test_unknown_input():
+    with pytest.raises(ValueError, match="알 수 없는 입력"):
+        next(sweep.sweep(Z=[1]))
+
+
+def test_write_csv(tmp_path):
+    path = tmp_path / "grid.csv"
+    assert sweep.write_csv(sweep.sweep(chunk_size=3, D=[10, 20, 30, 40]), path) == 4
+    with open(path, encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == sweep.columns()
+    assert rows[0]["Q1"] == "" and rows[3]["D"] == "40.0"
+
+
+def test_write_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "grid.parquet"
+    assert sweep.write_table(sweep.sweep(chunk_size=2, D=[10, 20, 30]), str(path)) == 3
+    f = pq.ParquetFile(path)
+    assert f.num_row_groups == 2 and f.schema_arrow.names == sweep.columns()
+
+
+def test_main(tmp_path):
+    out = tmp_path / "grid.csv"
+    assert sweep.main(["--D", "10:30:10", "--Vel", "0.3,0.5", "-o", str(out)]) == 0
+    with open(out, encoding="utf-8-sig") as f:
+        assert sum(1 for _ in f) == 7
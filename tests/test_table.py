@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from blasting.core import compute
+from blasting.table import DesignTable
+
+
+@pytest.fixture(scope="module")
+def table():
+    return DesignTable.build(q3_max=20.0, pd=0.050, C=0.33, V=1.2, k1=0.7)
+
+
+@pytest.mark.parametrize("profile", [dict(), dict(pd=0.065, V=1.0), dict(pd=0.1, pd_custom=True, C=0.5)])
+def test_verify_whole_grid(profile):
+    assert DesignTable.build(q3_max=8.0, **profile).verify() == []
+
+
+def test_compute_inside_and_outside_grid(table):
+    for D in (8.0, 40.0, 95.5, 300.0):          # 300 m → Q3 가 격자 밖
+        kw = dict(K=200, n=-1.6, Vel=0.3, D=D)
+        assert table.compute(**kw) == compute(pd_choice=0.05, **kw)
+    assert table.compute(Q1=0.3) == compute(Q1=0.3, pd_choice=0.05)      # Pa 2 pd 강제 메시지 포함
+
+
+def test_evaluate_matches_compute(table):
+    D = np.array([10.0, 33.3, 80.0, 500.0])
+    out = table.evaluate(K=200, n=-1.6, Vel=0.3, D=D)
+    for i, d in enumerate(D):
+        r = compute(K=200, n=-1.6, Vel=0.3, D=d, pd_choice=0.05)
+        assert {k: out[k][i] for k in r} == r
+
+
+def test_missing_inputs(table):
+    with pytest.raises(ValueError):
+        table.compute(K=200, n=-1.6, Vel=0.3)
+
+
+def test_save_load(table, tmp_path):
+    path = tmp_path / "site.npz"
+    table.save(path)
+    t = DesignTable.load(path)
+    assert t.profile == table.profile and t.size == table.size and t.q3_max == pytest.approx(20.0)
+    assert t.compute(Q1=7.77) == table.compute(Q1=7.77)
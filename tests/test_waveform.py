@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from blasting import waveform as wf
+
+RATE = 1000
+
+
+def _samples(n, freqs=(12.0, 33.0, 47.0), amp=20000, seed=0):
+    t = np.arange(n) / RATE
+    x = np.sin(2 * np.pi * np.array(freqs) * t[:, None]) * amp
+    x += np.random.default_rng(seed).normal(0, 20, (n, 3))
+    return np.clip(np.round(x), -32767, 32767).astype(np.int16)
+
+
+def _full(x, scale):
+    """기록 전체를 float64 로 바꿔 한 번에 계산한 기준값"""
+    x = x.astype(np.float64) * scale
+    spec = np.abs(np.fft.rfft(x - x.mean(axis=0), axis=0))
+    return (np.abs(x).max(axis=0), float(np.sqrt((x * x).sum(axis=1)).max()),
+            (np.argmax(spec[1:], axis=0) + 1) * RATE / len(x))
+
+
+def test_analyse_matches_full_record(tmp_path, monkeypatch):
+    monkeypatch.setattr(wf, "CHUNK", 700)          # 여러 chunk 로 나뉘도록
+    x = _samples(5000)
+    p = tmp_path / "ev.bin"
+    wf.write_bin(p, x, RATE, scale=5e-4, D=50, W=2)
+    meta, data, scale = wf.read_bin(p)
+    assert isinstance(data, np.memmap)
+
+    ppv, pvs, freq = wf.analyse(data, RATE, scale)
+    ref = _full(x, 5e-4)
+    np.testing.assert_allclose(ppv, ref[0], rtol=1e-12)
+    assert pvs == pytest.approx(ref[1], rel=1e-12)
+    np.testing.assert_allclose(freq, ref[2])
+    np.testing.assert_allclose(freq, [12, 33, 47])
+
+
+def test_analyse_windows_long_record(monkeypatch):
+    monkeypatch.setattr(wf, "WINDOW", 1000)
+    monkeypatch.setattr(wf, "CHUNK", 1000)
+    _, _, freq = wf.analyse(_samples(4500), RATE)
+    np.testing.assert_allclose(freq, [12, 33, 47])
+
+
+def test_int16_minimum_does_not_overflow():
+    x = np.zeros((10, 3), dtype=np.int16)
+    x[3, 1] = -32768
+    ppv, pvs, _ = wf.analyse(x, RATE)
+    assert ppv[1] == 32768 and pvs == 32768
+
+
+def test_analyse_rejects_wrong_shape():
+    with pytest.raises(ValueError):
+        wf.analyse(np.zeros((10, 2)), RATE)
+    with pytest.raises(ValueError):
+        wf.analyse(np.zeros((0, 3)), RATE)
+
+
+def test_file_column_is_relative_path(tmp_path):
+    for sub in ("a", "b"):
+        (tmp_path / sub).mkdir()
+        wf.write_bin(tmp_path / sub / "ev.bin", _samples(200), RATE, D=40, W=1)
+    paths = [str(tmp_path / "a" / "ev.bin"), str(tmp_path / "b" / "ev.bin")]
+    events = list(wf.process_files(paths, jobs=1, root=str(tmp_path)))
+    assert [e.file for e in events] == ["a/ev.bin", "b/ev.bin"]
+    assert all(not e.error for e in events)
+    assert events[0].SD == pytest.approx(40.0)
+
+
+def test_csv_and_errors(tmp_path):
+    p = tmp_path / "ev.csv"
+    x = _samples(300)
+    with open(p, "w", encoding="utf-8") as f:
+        f.write(f"# sample_rate={RATE}\n# D=30\n# W=4\nt,T,V,L\n")
+        for i, row in enumerate(x):
+            f.write(f"{i},{row[0]},{row[1]},{row[2]}\n")
+    bad = tmp_path / "bad.bin"
+    bad.write_bytes(b"XXXX")
+    ev, err = wf.process_files([str(p), str(bad)], jobs=1)
+    assert not ev.error and ev.PPV == pytest.approx(np.abs(x).max()) and ev.D == 30
+    assert err.error.startswith("ValueError")
+
+    out = tmp_path / "events.csv"
+    assert wf.main([str(p), str(bad), "-o", str(out), "-j", "1"]) == 1
+    assert wf.main([str(p), "-o", str(out), "-j", "1"]) == 0